@@ -1,4 +1,6 @@
+from rsl_comm_py.rsl_async import AsyncShearWaterSerial, AsyncUM7Serial
 from rsl_comm_py.rsl_autodetect import rsl_autodetect
+from rsl_comm_py.rsl_simulator import SimulatedSensor
 from rsl_comm_py.serve_rsl_autodetect import serve_autodetect_script
 from rsl_comm_py.shearwater_serial import ShearWaterSerial
 from rsl_comm_py.shearwater_spi import ShearWaterSpiUsbIss, ShearWaterSpiLinuxPort
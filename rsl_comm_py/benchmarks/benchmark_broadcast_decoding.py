@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import os
+import struct
+
+from timeit import timeit
+
+from rsl_comm_py import shearwater_broadcast_packets, um7_broadcast_packets
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.um7_serial import UM7Serial
+from rsl_comm_py.test.helpers import make_packet
+
+
+def legacy_decode(packet_type: type, payload_format: str, packet: memoryview):
+    # decoding before the precompiled layouts: slice the payload, parse the format string, unpack;
+    # this is a lower bound, the drivers used to call unpack once per sensor group
+    payload = packet[5:-2]
+    values = struct.unpack(payload_format, payload[0:struct.calcsize(payload_format)])
+    if packet_type.__name__.endswith('EulerPacket'):
+        values = [value / 91.02222 for value in values[:6]] + [values[6]]
+    elif packet_type.__name__.endswith('QuaternionPacket'):
+        values = [value / 29789.09091 for value in values[:4]] + [values[4]]
+    return packet_type(*values)
+
+
+def broadcast_decoders(sensor_class):
+    decoders = {}
+    for name in dir(sensor_class):
+        if name.startswith('decode_') and name.endswith('_broadcast'):
+            decode_callback = getattr(sensor_class, name)
+            decoders[decode_callback.__annotations__['return']] = decode_callback
+    return decoders
+
+
+if __name__ == '__main__':
+    num_runs = 200_000
+    print(f"{'packet':<28}{'legacy, ns':>12}{'unpack_from, ns':>18}{'speedup':>10}")
+    for sensor_class, broadcast_structs in [(ShearWaterSerial, shearwater_broadcast_packets.BROADCAST_STRUCTS),
+                                            (UM7Serial, um7_broadcast_packets.BROADCAST_STRUCTS)]:
+        decoders = broadcast_decoders(sensor_class)
+        for packet_type, payload_struct in broadcast_structs.items():
+            # packets are decoded straight from the receive buffer, as `find_packet` returns them
+            packet = memoryview(bytearray(make_packet(0x80, 0x55, os.urandom(payload_struct.size))))
+            decode_callback = decoders[packet_type]
+            legacy = timeit(lambda: legacy_decode(packet_type, payload_struct.format, packet), number=num_runs)
+            current = timeit(lambda: decode_callback(None, packet), number=num_runs)
+            print(f"{packet_type.__name__:<28}{legacy / num_runs * 1e9:>12.0f}{current / num_runs * 1e9:>18.0f}"
+                  f"{legacy / current:>10.2f}")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import os
+
+from time import perf_counter
+
+from rsl_comm_py.rsl_numpy import verify_checksums
+from rsl_comm_py.rsl_serial import SerialCommunication
+from rsl_comm_py.test.helpers import make_packet
+
+
+def legacy_verify_checksum(packet: bytes) -> bool:
+    # checksum verification before the builtin `sum` was used
+    computed_checksum = 0
+    for byte in packet[:-2]:
+        computed_checksum += byte
+    received_checksum = int.from_bytes(packet[-2:], byteorder='big', signed=False)
+    return computed_checksum == received_checksum
+
+
+if __name__ == '__main__':
+    # shearwater all-proc broadcast, 95 bytes
+    packet = make_packet(0xD8, 0x68, os.urandom(88))
+    num_packets = 200_000
+    capture = packet * num_packets
+    packets = [memoryview(capture)[idx:idx + len(packet)] for idx in range(0, len(capture), len(packet))]
+
+    start = perf_counter()
+    assert all(legacy_verify_checksum(packet) for packet in packets)
+    legacy = perf_counter() - start
+
+    start = perf_counter()
+    verify_checksum = SerialCommunication.verify_checksum
+    assert all(verify_checksum(None, packet) for packet in packets)
+    single = perf_counter() - start
+
+    start = perf_counter()
+    assert len(verify_checksums(capture, len(packet))) == 0
+    bulk = perf_counter() - start
+
+    start = perf_counter()
+    assert len(verify_checksums(capture, [len(packet)] * num_packets)) == 0
+    bulk_offsets = perf_counter() - start
+
+    size_mb = len(capture) / 1e6
+    print(f"{'checksum verification':<36}{'us / packet':>14}{'MB/s':>10}")
+    for name, elapsed in [('python loop (before)', legacy), ('verify_checksum', single),
+                          ('verify_checksums, same length', bulk),
+                          ('verify_checksums, per packet lengths', bulk_offsets)]:
+        print(f"{name:<36}{elapsed / num_packets * 1e6:>14.3f}{size_mb / elapsed:>10.1f}")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import struct
+
+from typing import List, Tuple
+
+from rsl_comm_py.benchmarks.benchmark_ring_buffer import legacy_find_packet
+from rsl_comm_py.test.helpers import ShearWaterFraming, make_packet
+
+
+BAUD_RATE = 115200
+POLL_PERIOD = 0.001
+DURATION = 2.0
+
+
+def synthetic_schedule() -> List[Tuple[float, bytes]]:
+    # quaternion at 100 Hz, euler at 50 Hz, health at 1 Hz, as configured in CREG_COM_RATES*
+    quat = make_packet(0x8C, 0x7E, struct.pack('>hhhhf', 29789, 0, 0, 0, 0.0))
+    euler = make_packet(0x94, 0x78, struct.pack('>hhh2xhhh2xf', 1, 2, 3, 4, 5, 6, 0.0))
+    health = make_packet(0x80, 0x55, struct.pack('>I', 0))
+    schedule = [(k / 100, quat) for k in range(int(DURATION * 100))]
+    schedule += [(k / 50, euler) for k in range(int(DURATION * 50))]
+    schedule += [(k / 1, health) for k in range(int(DURATION * 1))]
+    return sorted(schedule, key=lambda el: el[0])
+
+
+def wire_timing(schedule: List[Tuple[float, bytes]]) -> Tuple[bytes, List[float], List[float]]:
+    # arrival time of every byte on the UART line (10 bits per byte), and completion time of every packet
+    stream, byte_times, packet_done_times = bytearray(), [], []
+    line_free = 0.0
+    for t, packet in schedule:
+        t_byte = max(t, line_free)
+        for byte in packet:
+            t_byte += 10 / BAUD_RATE
+            stream.append(byte)
+            byte_times.append(t_byte)
+        line_free = t_byte
+        packet_done_times.append(t_byte)
+    return bytes(stream), byte_times, packet_done_times
+
+
+def simulate(stream: bytes, byte_times: List[float], packet_done_times: List[float], use_legacy: bool) -> List[float]:
+    framing = ShearWaterFraming()
+    legacy_buffer = bytes()
+    latencies = []
+    received_bytes = 0
+    t_poll = 0.0
+    while t_poll < DURATION + 1.0:
+        t_poll += POLL_PERIOD
+        new_bytes = 0
+        while received_bytes + new_bytes < len(stream) and byte_times[received_bytes + new_bytes] <= t_poll:
+            new_bytes += 1
+        chunk = stream[received_bytes:received_bytes + new_bytes]
+        received_bytes += new_bytes
+        if use_legacy:
+            legacy_buffer += chunk
+            packet, remainder = legacy_find_packet(legacy_buffer)
+            while len(packet) >= 7:
+                legacy_buffer = remainder
+                latencies.append(t_poll - packet_done_times[len(latencies)])
+                packet, remainder = legacy_find_packet(legacy_buffer)
+        else:
+            framing.buffer.write(chunk)
+            packet = framing.find_packet()
+            while len(packet) > 0:
+                latencies.append(t_poll - packet_done_times[len(latencies)])
+                packet = framing.find_packet()
+    return latencies
+
+
+def report(name: str, latencies: List[float], num_packets: int):
+    latencies_ms = sorted(el * 1000 for el in latencies)
+    mean = sum(latencies_ms) / len(latencies_ms)
+    p99 = latencies_ms[int(0.99 * (len(latencies_ms) - 1))]
+    print(f"{name:>24} | {len(latencies_ms):>5d}/{num_packets:<5d} | {mean:>9.3f} | {p99:>9.3f} | "
+          f"{latencies_ms[-1]:>9.3f}")
+
+
+if __name__ == '__main__':
+    stream, byte_times, packet_done_times = wire_timing(synthetic_schedule())
+    print(f"synthetic stream: {len(packet_done_times)} packets, {BAUD_RATE} baud, "
+          f"polling every {POLL_PERIOD * 1000} ms")
+    print("latency: time from the last packet byte on the wire until the packet is returned by the framer")
+    print(f"{'framing':>24} | {'delivered':>11} | {'mean, ms':>9} | {'p99, ms':>9} | {'max, ms':>9}")
+    report('preamble-to-preamble', simulate(stream, byte_times, packet_done_times, True), len(packet_done_times))
+    report('packet type length', simulate(stream, byte_times, packet_done_times, False), len(packet_done_times))
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import struct
+
+from time import perf_counter
+
+from rsl_comm_py.rsl_numpy import decode_frames
+from rsl_comm_py.shearwater_broadcast_packets import ShearWaterAllRawPacket, ShearWaterEulerPacket, \
+    ShearWaterQuaternionPacket
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.test.helpers import make_packet
+
+
+PACKETS = {
+    ShearWaterAllRawPacket: (ShearWaterSerial.decode_all_raw_broadcast,
+                             make_packet(0xC8, 0x56, struct.pack('>hhh2xf', 1, 2, 3, 0.1) * 3 +
+                                         struct.pack('>iiif', 1, 2, 3, 0.1) + struct.pack('>hhh2xf', 1, 2, 3, 0.1) +
+                                         struct.pack('>ff', 25.0, 0.1))),
+    ShearWaterEulerPacket: (ShearWaterSerial.decode_euler_broadcast,
+                            make_packet(0x94, 0x81, struct.pack('>hhh2xhhh2xf', 100, 200, 300, 1, 2, 3, 0.1))),
+    ShearWaterQuaternionPacket: (ShearWaterSerial.decode_quaternion_broadcast,
+                                 make_packet(0x8C, 0x7E, struct.pack('>hhhhf', 29789, 0, 0, 0, 0.1))),
+}
+
+
+if __name__ == '__main__':
+    num_packets = 100_000
+    print(f"{'packet':<28}{'per packet, us':>16}{'decode_frames, us':>20}{'speedup':>10}")
+    for packet_type, (decode_callback, packet) in PACKETS.items():
+        frames = packet * num_packets
+        packet_length = len(packet)
+        start = perf_counter()
+        for idx in range(0, len(frames), packet_length):
+            decode_callback(None, frames[idx:idx + packet_length])
+        per_packet = (perf_counter() - start) / num_packets * 1e6
+        start = perf_counter()
+        decode_frames(frames, packet_type)
+        batched = (perf_counter() - start) / num_packets * 1e6
+        print(f"{packet_type.__name__:<28}{per_packet:>16.3f}{batched:>20.3f}{per_packet / batched:>10.1f}")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import dataclasses
+import tracemalloc
+
+from rsl_comm_py.rsl_packet_columns import RslPacketColumns
+from rsl_comm_py.shearwater_broadcast_packets import ShearWaterEulerPacket, ShearWaterAllProcPacket
+
+
+def dict_based(packet_type: type) -> type:
+    # packet class as it was before `__slots__`, i.e. with a per-instance `__dict__`
+    return dataclasses.make_dataclass(packet_type.__name__, [(field.name, field.type)
+                                                             for field in dataclasses.fields(packet_type)])
+
+
+def make_packet(packet_type: type, idx: int):
+    # distinct values in every field, as in a real capture
+    return packet_type(*[idx + 0.5 * field for field in range(len(dataclasses.fields(packet_type)))])
+
+
+def measure(make_capture) -> int:
+    tracemalloc.start()
+    capture = make_capture()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del capture
+    return size
+
+
+if __name__ == '__main__':
+    # ten minutes at 200 Hz, memory is reported for one hour
+    num_packets = 200 * 600
+    print("memory of one hour capture at 200 Hz")
+    print(f"{'packet':<28}{'dataclass, MB':>15}{'slotted, MB':>13}{'columns, MB':>13}")
+    for packet_type in [ShearWaterEulerPacket, ShearWaterAllProcPacket]:
+        unslotted_type = dict_based(packet_type)
+        sizes = [
+            measure(lambda: [make_packet(unslotted_type, idx) for idx in range(num_packets)]),
+            measure(lambda: [make_packet(packet_type, idx) for idx in range(num_packets)]),
+            measure(lambda: RslPacketColumns(packet_type,
+                                             (make_packet(packet_type, idx) for idx in range(num_packets)))),
+        ]
+        print(f"{packet_type.__name__:<28}" + ''.join(f"{6 * size / 1e6:>13.1f}" for size in sizes))
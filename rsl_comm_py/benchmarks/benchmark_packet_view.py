@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import os
+
+from timeit import timeit
+
+from rsl_comm_py.rsl_packet_view import broadcast_layout, packet_view_type
+from rsl_comm_py.shearwater_broadcast_packets import ShearWaterAllProcPacket, ShearWaterHealthPacket, \
+    ShearWaterQuaternionPacket
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.test.helpers import make_packet
+
+
+if __name__ == '__main__':
+    num_runs = 200_000
+    cases = [
+        (ShearWaterQuaternionPacket, ShearWaterSerial.decode_quaternion_broadcast, ['q_w']),
+        (ShearWaterQuaternionPacket, ShearWaterSerial.decode_quaternion_broadcast, ['q_w', 'q_x', 'q_y', 'q_z']),
+        (ShearWaterAllProcPacket, ShearWaterSerial.decode_all_proc_broadcast, ['gyro_1_proc_z']),
+        (ShearWaterHealthPacket, ShearWaterSerial.decode_health_broadcast, ['health']),
+    ]
+    print(f"{'packet':<28}{'fields read':>12}{'decode, ns':>12}{'view, ns':>10}")
+    for packet_type, decode_callback, field_names in cases:
+        _, packet_length = broadcast_layout(packet_type)
+        packet = memoryview(bytearray(make_packet(0x80, 0x55, os.urandom(packet_length - 7))))
+        view_type = packet_view_type(packet_type)
+
+        def read_decoded():
+            decoded = decode_callback(None, packet)
+            return [getattr(decoded, name) for name in field_names]
+
+        def read_view():
+            view = view_type(packet)
+            return [getattr(view, name) for name in field_names]
+
+        decoded = timeit(read_decoded, number=num_runs) / num_runs * 1e9
+        viewed = timeit(read_view, number=num_runs) / num_runs * 1e9
+        print(f"{packet_type.__name__:<28}{len(field_names):>12}{decoded:>12.0f}{viewed:>10.0f}")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import os
+import threading
+import tty
+
+import serial
+
+from time import perf_counter, sleep
+
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.test.helpers import make_packet
+
+# round trip of the sensor, the USB-serial converter, and the OS scheduling
+SENSOR_LATENCY = 0.002
+
+
+def sensor_responder(master: int, stop: threading.Event, answer_batches: bool):
+    # answers each read request `SENSOR_LATENCY` after its arrival, requests in flight do not wait for each other,
+    # batch reads are answered with a payload per register, or not at all for a sensor rejecting them
+    received = b''
+    pending = []
+    os.set_blocking(master, False)
+    while not stop.is_set():
+        try:
+            received += os.read(master, 4096)
+        except BlockingIOError:
+            pass
+        start = received.find(b'snp')
+        while start != -1 and len(received) >= start + 7:
+            packet_type, address = received[start + 3], received[start + 4]
+            count = packet_type >> 2 & 0x1F
+            if count <= 1 or answer_batches:
+                payload = b''.join(bytes([address + idx, 0, 0, 0]) for idx in range(max(count, 1)))
+                reply = make_packet(0x80 | (packet_type & 0x7E), address, payload)
+                pending.append((perf_counter() + SENSOR_LATENCY, reply))
+            received = received[start + 7:]
+            start = received.find(b'snp')
+        while pending and pending[0][0] <= perf_counter():
+            os.write(master, pending.pop(0)[1])
+        sleep(0.0001)
+
+
+def run(answer_batches: bool):
+    # pseudo terminal stands for the sensor UART (POSIX only)
+    master, slave = os.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    stop = threading.Event()
+    responder = threading.Thread(target=sensor_responder, args=(master, stop, answer_batches), daemon=True)
+    responder.start()
+    shearwater = ShearWaterSerial(port=serial.Serial(os.ttyname(slave)))
+    cregs = shearwater.svd_parser.cregs
+
+    start = perf_counter()
+    for reg in cregs:
+        getattr(shearwater, reg.name.lower())
+    one_by_one = perf_counter() - start
+
+    times = []
+    for _ in range(2):
+        start = perf_counter()
+        regs = shearwater.creg_regs_values()
+        times.append(perf_counter() - start)
+        assert len(regs) == len(cregs)
+    stop.set()
+    responder.join()
+    os.close(master)
+    os.close(slave)
+    return len(cregs), one_by_one, times
+
+
+if __name__ == '__main__':
+    for answer_batches in (True, False):
+        num_regs, one_by_one, (first_read, second_read) = run(answer_batches)
+        print(f"{num_regs} config registers, sensor latency {SENSOR_LATENCY * 1e3:.1f} ms, "
+              f"batch reads {'answered' if answer_batches else 'rejected'}")
+        print(f"read one by one: {one_by_one * 1e3:.1f} ms")
+        print(f"pipelined reads: {first_read * 1e3:.1f} ms, then {second_read * 1e3:.1f} ms")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import os
+import struct
+import tty
+
+import serial
+
+from statistics import median
+from time import monotonic, perf_counter, process_time, sleep
+
+from rsl_comm_py.shearwater_broadcast_packets import ShearWaterQuaternionPacket
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.test.helpers import make_packet
+
+IDLE_TIME = 2.0
+
+
+if __name__ == '__main__':
+    # pseudo terminal stands for the sensor UART (POSIX only)
+    master, slave = os.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    shearwater = ShearWaterSerial(port=serial.Serial(os.ttyname(slave)))
+
+    # polling the port as `recv` did before the reader: spin on `in_waiting` while no data arrives
+    start_cpu, deadline = process_time(), monotonic() + IDLE_TIME
+    while monotonic() < deadline:
+        shearwater.buffer.read_from(shearwater.port, shearwater.port.in_waiting)
+    spin_cpu = process_time() - start_cpu
+
+    with shearwater.start_reader() as reader:
+        quaternions = reader.subscribe(ShearWaterQuaternionPacket)
+        start_cpu = process_time()
+        sleep(IDLE_TIME)
+        reader_cpu = process_time() - start_cpu
+        quat_addr = shearwater.svd_parser.find_register_by(name='DREG_QUAT_AB').address
+        quat = make_packet(0x8C, quat_addr, struct.pack('>hhhhf', 29789, 0, 0, 0, 0.0))
+        latencies = []
+        for _ in range(200):
+            start = perf_counter()
+            os.write(master, quat)
+            quaternions.get(timeout=1.0)
+            latencies.append(perf_counter() - start)
+            sleep(0.005)
+
+    print(f"idle CPU, spinning on in_waiting: {spin_cpu / IDLE_TIME * 100:.1f} %")
+    print(f"idle CPU, reader thread: {reader_cpu / IDLE_TIME * 100:.1f} %")
+    print(f"wake-up latency of the reader (write to subscriber queue), median: {median(latencies) * 1e6:.0f} us, "
+          f"max: {max(latencies) * 1e6:.0f} us")
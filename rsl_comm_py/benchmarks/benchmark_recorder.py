@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import os
+import tempfile
+
+from time import perf_counter
+
+from rsl_comm_py.rsl_recorder import RslFrameRecorder, read_frames
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.test.helpers import make_packet
+
+
+if __name__ == '__main__':
+    # shearwater all-proc broadcast, 95 bytes
+    packet = memoryview(make_packet(0xD8, 0x68, os.urandom(88)))
+    num_packets = 200_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = perf_counter()
+        with open(os.path.join(tmp_dir, 'capture.csv'), 'w') as fd:
+            for _ in range(num_packets):
+                fd.write(ShearWaterSerial.decode_all_proc_broadcast(None, packet).to_csv())
+        csv = perf_counter() - start
+        csv_size = os.path.getsize(os.path.join(tmp_dir, 'capture.csv'))
+
+        log_file = os.path.join(tmp_dir, 'capture.rslf')
+        start = perf_counter()
+        with RslFrameRecorder(log_file) as recorder:
+            for _ in range(num_packets):
+                recorder.record(packet)
+        binary = perf_counter() - start
+        binary_size = os.path.getsize(log_file)
+
+        start = perf_counter()
+        assert sum(1 for _ in read_frames(log_file)) == num_packets
+        read_back = perf_counter() - start
+
+    print(f"{'all_proc, 95 bytes':<32}{'us / packet':>14}{'bytes / packet':>16}")
+    print(f"{'decode + to_csv':<32}{csv / num_packets * 1e6:>14.3f}{csv_size / num_packets:>16.1f}")
+    print(f"{'RslFrameRecorder.record':<32}{binary / num_packets * 1e6:>14.3f}{binary_size / num_packets:>16.1f}")
+    print(f"{'read_frames':<32}{read_back / num_packets * 1e6:>14.3f}")
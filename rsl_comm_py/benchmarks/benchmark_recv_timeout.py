@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import os
+import threading
+import tty
+
+import serial
+
+from statistics import median
+from time import monotonic, perf_counter, process_time
+
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+
+IDLE_TIME = 2.0
+
+
+if __name__ == '__main__':
+    # pseudo terminal stands for the sensor UART (POSIX only)
+    master, slave = os.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    shearwater = ShearWaterSerial(port=serial.Serial(os.ttyname(slave)), timeout=IDLE_TIME)
+
+    # `recv` before the timeout: spin on `in_waiting` until data arrives
+    start_cpu, deadline = process_time(), monotonic() + IDLE_TIME
+    while monotonic() < deadline:
+        shearwater.buffer.read_from(shearwater.port, shearwater.port.in_waiting)
+    spin_cpu = process_time() - start_cpu
+
+    # `recv` blocking in `select` until the timeout expires
+    start_cpu, start = process_time(), perf_counter()
+    ok, _ = shearwater.recv()
+    recv_cpu, recv_time = process_time() - start_cpu, perf_counter() - start
+    assert not ok
+
+    # wake-up latency: from writing a byte on the sensor side until `recv` returns
+    latencies = []
+    for _ in range(200):
+        write_time = []
+        writer = threading.Timer(0.002, lambda: (write_time.append(perf_counter()), os.write(master, b's')))
+        writer.start()
+        ok, _ = shearwater.recv()
+        latencies.append(perf_counter() - write_time[0])
+        writer.join()
+        shearwater.buffer.clear()
+        assert ok
+
+    print(f"idle CPU, spinning on in_waiting: {spin_cpu / IDLE_TIME * 100:.1f} %")
+    print(f"idle CPU, recv with timeout: {recv_cpu / recv_time * 100:.1f} %, "
+          f"returned after {recv_time:.3f} s for timeout {IDLE_TIME} s")
+    print(f"wake-up latency of recv, median: {median(latencies) * 1e6:.0f} us, max: {max(latencies) * 1e6:.0f} us")
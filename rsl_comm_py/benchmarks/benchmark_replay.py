@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import os
+
+from time import perf_counter
+
+from rsl_comm_py.rsl_replay import ReplayPort
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.test.helpers import make_packet
+
+
+if __name__ == '__main__':
+    # the production receive path (recv, framing, checksum, dispatch, decoding) on a synthetic capture,
+    # pass a recorded capture with `ReplayPort.from_file` instead to benchmark real data
+    num_packets = 100_000
+    packets = [make_packet(0x94, 0x81, os.urandom(20)),   # euler, 27 bytes
+               make_packet(0xD8, 0x68, os.urandom(88)),   # all proc, 95 bytes
+               make_packet(0x8C, 0x7E, os.urandom(12))]   # quaternion, 19 bytes
+    capture = b''.join(packets[idx % len(packets)] for idx in range(num_packets))
+    for lazy in [False, True]:
+        shearwater = ShearWaterSerial(port=ReplayPort(data=capture))
+        start = perf_counter()
+        received_packets = sum(1 for _ in shearwater.recv_broadcast(lazy=lazy))
+        elapsed = perf_counter() - start
+        assert received_packets == num_packets
+        print(f"recv_broadcast(lazy={lazy}): {elapsed / num_packets * 1e6:.2f} us / packet, "
+              f"{len(capture) / elapsed / 1e6:.1f} MB/s")
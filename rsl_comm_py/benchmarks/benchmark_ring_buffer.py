@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import struct
+
+from time import perf_counter
+from typing import Tuple
+
+from rsl_comm_py.rsl_ring_buffer import RslRingBuffer
+from rsl_comm_py.test.helpers import ShearWaterFraming, make_packet
+
+
+def synthetic_stream(num_packets: int) -> bytes:
+    # shearwater all-raw (79 bytes) and all-proc (95 bytes) broadcasts interleaved
+    all_raw = make_packet(0xC8, 0x56, struct.pack('>hhh2xf', 1, 2, 3, 0.1) * 3 + struct.pack('>iiif', 1, 2, 3, 0.1) +
+                          struct.pack('>hhh2xf', 1, 2, 3, 0.1) + struct.pack('>ff', 25.0, 0.1))
+    all_proc = make_packet(0xD8, 0x8C, struct.pack('>ffff', 0.1, 0.2, 0.3, 0.4) * 3 +
+                           struct.pack('>fffff', 0.1, 0.2, 0.3, 1.0, 0.4) * 2)
+    return (all_raw + all_proc) * (num_packets // 2)
+
+
+class SyntheticPort:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.data) - self.pos
+
+    def read(self, size: int) -> bytes:
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += len(chunk)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def legacy_find_packet(sensor_response: bytes) -> Tuple[bytes, bytes]:
+    # framing of the drivers before the ring buffer was introduced
+    preamble = b'snp'
+    packet_start_idx = sensor_response.find(preamble)
+    if packet_start_idx == -1:
+        return bytes(), bytes()
+    next_packet_rel_idx = sensor_response[packet_start_idx + 3:].find(preamble)
+    next_packet_start_idx = packet_start_idx + 3 + next_packet_rel_idx
+    if next_packet_start_idx == -1:
+        return bytes(), bytes()
+    packet = sensor_response[packet_start_idx:next_packet_start_idx]
+    remainder = sensor_response[next_packet_start_idx:]
+    return packet, remainder
+
+
+def legacy_verify_checksum(packet: bytes) -> bool:
+    # checksum of the drivers before the ring buffer, run on each broadcast before decoding it
+    computed_checksum = 0
+    for byte in packet[:-2]:
+        computed_checksum += byte
+    received_checksum = int.from_bytes(packet[-2:], byteorder='big', signed=False)
+    return computed_checksum == received_checksum
+
+
+def run_legacy(stream: bytes, read_size: int, verify: bool = False) -> Tuple[int, float]:
+    # with `verify`, checksums are verified after framing, as the legacy receive path did,
+    # the ring buffer verifies them while framing
+    port = SyntheticPort(stream)
+    buffer = bytes()
+    framed_bytes = 0
+    t = perf_counter()
+    while port.in_waiting > 0:
+        buffer += port.read(read_size)
+        while len(buffer) > 0:
+            packet, buffer_remainder = legacy_find_packet(buffer)
+            if len(packet) < 7:
+                # keep the incomplete packet instead of dropping it, so that both implementations frame the same bytes
+                break
+            buffer = buffer_remainder
+            if verify and not legacy_verify_checksum(packet):
+                continue
+            framed_bytes += len(packet)
+    return framed_bytes, perf_counter() - t
+
+
+def run_ring_buffer(stream: bytes, read_size: int) -> Tuple[int, float]:
+    port = SyntheticPort(stream)
+    serial_communication = ShearWaterFraming()
+    serial_communication.buffer = RslRingBuffer(max(4096, 2 * read_size))
+    framed_bytes = 0
+    t = perf_counter()
+    while port.in_waiting > 0:
+        serial_communication.buffer.read_from(port, read_size)
+        packet = serial_communication.find_packet()
+        while len(packet) > 0:
+            framed_bytes += len(packet)
+            packet = serial_communication.find_packet()
+    return framed_bytes, perf_counter() - t
+
+
+if __name__ == '__main__':
+    stream = synthetic_stream(20000)
+    print(f"synthetic stream: {len(stream)} bytes of shearwater all-raw + all-proc broadcasts")
+    print(f"{'read size, bytes':>18} | {'legacy, MB/s':>14} | {'legacy + checksum, MB/s':>24} | "
+          f"{'ring buffer, MB/s':>18} | {'vs legacy':>9} | {'vs legacy + checksum':>20}")
+    # `read_port` reads up to `buffer_size` (125 bytes for UM7 and UM8, 384 for shearwater) or what is waiting,
+    # i.e. small reads model a consumer keeping up, large reads model a backlog when the consumer falls behind
+    for read_size in (125, 384, 4096, 65536, 262144):
+        legacy_bytes, legacy_time = min((run_legacy(stream, read_size) for _ in range(3)), key=lambda r: r[1])
+        checked_bytes, checked_time = min((run_legacy(stream, read_size, verify=True) for _ in range(3)),
+                                          key=lambda r: r[1])
+        ring_bytes, ring_time = min((run_ring_buffer(stream, read_size) for _ in range(3)), key=lambda r: r[1])
+        legacy_rate = legacy_bytes / legacy_time / 1e6
+        checked_rate = checked_bytes / checked_time / 1e6
+        ring_rate = ring_bytes / ring_time / 1e6
+        print(f"{read_size:>18d} | {legacy_rate:>14.2f} | {checked_rate:>24.2f} | {ring_rate:>18.2f} | "
+              f"{ring_rate / legacy_rate:>8.1f}x | {ring_rate / checked_rate:>19.1f}x")
@@ -7,6 +7,7 @@
 
 import json
 import logging
+from dataclasses import asdict
 from pathlib import Path
 import sys
 
@@ -30,7 +31,7 @@ def sensor_read_process(raw_shm: shared_memory.SharedMemory, proc_shm: shared_me
     um7 = UM7Serial(device=device_file)
 
     for packet in um7.recv_broadcast(flush_buffer_on_start=False):
-        packet_bytes = bytes(json.dumps(packet.__dict__), encoding='utf-8')
+        packet_bytes = bytes(json.dumps(asdict(packet)), encoding='utf-8')
         assert len(packet_bytes) <= BUFFER_SIZE, f"Packet cannot be serialized, increase `BUFFER` size at least up to {len(packet_bytes)}"
         if isinstance(packet, UM7AllRawPacket):
             r_lock.acquire()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import asyncio
+import logging
+import os
+
+from typing import Any, AsyncIterator, Optional, Tuple, Union
+
+from rsl_comm_py.rsl_serial import RegisterAccessRecorder
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.um7_serial import UM7Serial
+from rsl_comm_py.um8_serial import UM8Serial
+
+
+class AsyncSerialCommunication:
+    """
+    Coroutines of the serial drivers for `asyncio` applications. The port is watched with `loop.add_reader`,
+    so waiting for the sensor neither blocks the event loop nor takes a thread, and many sensors share one loop.
+    Ports without a file descriptor (Windows, `ReplayPort`) are waited for in the default executor instead.
+    Generated register properties have awaitable equivalents: `await sensor.get_register('creg_com_rates1')`
+    and `await sensor.set_register('creg_com_rates1', value)`. The port is used by one coroutine at a time.
+    Register requests are sent again and fail as decided by `retry_policy`, and counted in `metrics`,
+    as for the blocking drivers.
+    """
+
+    def port_lock(self) -> asyncio.Lock:
+        # created on first use in the running loop, `asyncio.Lock` binds to the loop of its creation on python < 3.10
+        if getattr(self, 'async_lock', None) is None:
+            self.async_lock = asyncio.Lock()
+        return self.async_lock
+
+    async def recv_async(self) -> bool:
+        # like `recv`, `False` when no data arrives within `timeout`
+        return await self.recv_within(self.timeout)
+
+    async def recv_within(self, timeout: Optional[float]) -> bool:
+        # `False` when no data arrives within `timeout` seconds (`None` waits forever)
+        if self.read_port(self.buffer_size, 0) > 0:
+            return True
+        loop = asyncio.get_running_loop()
+        if os.name != 'posix' or not hasattr(self.port, 'fileno'):
+            num_bytes = await loop.run_in_executor(None, self.read_port, self.buffer_size, timeout)
+            return num_bytes > 0
+        readable = loop.create_future()
+        fd = self.port.fileno()
+        loop.add_reader(fd, lambda: readable.done() or readable.set_result(True))
+        try:
+            await asyncio.wait_for(readable, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(fd)
+        return self.read_port(self.buffer_size, 0) > 0
+
+    async def request(self, packet: bytes, reg_addr: int, hidden: bool, expected_length: int,
+                      max_attempts: Optional[int] = None, deadline: Optional[float] = None) -> Tuple[bool, bytes]:
+        # awaitable equivalent of `request_response` (see `request_steps`), returns the payload of the response
+        async with self.port_lock():
+            steps = self.request_steps(packet, reg_addr, hidden, expected_length, max_attempts, deadline)
+            try:
+                wait_time = next(steps)
+                while True:
+                    wait_time = steps.send(await self.recv_within(wait_time))
+            except StopIteration as result:
+                ok, sensor_reply = result.value
+            if not ok:
+                return False, bytes()
+            logging.debug(f"packet: {sensor_reply}")
+            self.check_packet(sensor_reply)
+            return self.get_payload(sensor_reply)
+
+    async def read_register(self, reg_addr: int, hidden: bool = False, max_attempts: Optional[int] = None,
+                            deadline: Optional[float] = None) -> Tuple[bool, bytes]:
+        cached_payload = self.register_cache.lookup(reg_addr, hidden)
+        if cached_payload is not None:
+            return True, cached_payload
+        packet = self.construct_read_packet(reg_addr, hidden)
+        ok, payload = await self.request(packet, reg_addr, hidden, 11, max_attempts, deadline)
+        if ok:
+            self.register_cache.store(reg_addr, payload, hidden)
+        return ok, payload
+
+    async def write_register(self, reg_addr: int, reg_value: Union[int, bytes, float, str], hidden: bool = False,
+                             max_attempts: int = 1, deadline: Optional[float] = None) -> bool:
+        self.register_cache.written(reg_addr, hidden=hidden)
+        packet = self.construct_write_packet(reg_addr, reg_value, hidden)
+        ok, _ = await self.request(packet, reg_addr, hidden, 7, max_attempts, deadline)
+        return ok
+
+    async def get_register(self, name: str) -> Any:
+        # awaitable equivalent of reading the register property `name`, e.g. `creg_com_rates1`
+        register_property = getattr(type(self), name)
+        access = RegisterAccessRecorder(self)
+        register_property.fget(access)
+        ok, payload = await self.read_register(access.reg_addr, access.hidden)
+        if ok:
+            return register_property.fget(RegisterAccessRecorder(self, payload))
+
+    async def set_register(self, name: str, value: Any) -> bool:
+        # awaitable equivalent of writing the register property `name`
+        access = RegisterAccessRecorder(self)
+        getattr(type(self), name).fset(access, value)
+        return await self.write_register(access.reg_addr, access.reg_value, access.hidden)
+
+    async def broadcasts(self, num_packets: int = -1, lazy: bool = False) -> AsyncIterator[Any]:
+        # async equivalent of `recv_broadcast`, ends when the data source is exhausted (e.g. `ReplayPort`),
+        # lazy views are valid until the next packet is requested or a register is accessed
+        broadcast_decoders = self.broadcast_views() if lazy else self.broadcast_decoders
+        with self.receiving_broadcasts():
+            received_packets = 0
+            while num_packets == -1 or received_packets < num_packets:
+                async with self.port_lock():
+                    packet = self.next_broadcast_frame()
+                    while len(packet) == 0:
+                        try:
+                            if not await self.recv_async():
+                                raise TimeoutError(f"No data received from {self.port_name} within {self.timeout} s!")
+                        except EOFError:
+                            return
+                        packet = self.next_broadcast_frame()
+                    decoded_packet = self.dispatch_broadcast(packet, broadcast_decoders)
+                if decoded_packet is not None:
+                    yield decoded_packet
+                    received_packets += 1
+
+
+class AsyncUM7Serial(AsyncSerialCommunication, UM7Serial):
+    pass
+
+
+class AsyncUM8Serial(AsyncSerialCommunication, UM8Serial):
+    pass
+
+
+class AsyncShearWaterSerial(AsyncSerialCommunication, ShearWaterSerial):
+    pass
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+from bisect import bisect_left
+from time import monotonic
+from typing import Any, Dict, Hashable, Sequence
+
+
+class RslHistogram:
+    """
+    Counts of values in buckets with upper bounds `bounds` (ascending), values above the last bound are counted
+    in an extra bucket. Recording a value is a bisection and an increment.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def record(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'bounds': list(self.bounds),
+            'counts': list(self.counts),
+            'count': self.count,
+            'mean': self.sum / self.count if self.count else 0.0,
+        }
+
+
+class RslMetrics:
+    """
+    Transport metrics of one sensor (`metrics` attribute of the UART and SPI sensor classes): bytes read and written,
+    framed packets, checksum and packet type check failures, frames discarded while waiting for a response
+    (or stale responses to earlier requests), frames dropped because the queues of frames kept aside were full,
+    resent and failed register requests, histograms of port read sizes and register response times,
+    and counts of received packets per packet type (per snapshot group for SPI).
+    Counters are plain attributes incremented on the receive path, cheap enough to leave on,
+    `snapshot` returns them as a dict with rates since the start (or the last `reset`).
+    """
+
+    def __init__(self):
+        # names of packet keys, e.g. (register address, packet length) -> packet dataclass name, set by the sensor
+        self.packet_names = {}
+        self.reset()
+
+    def reset(self):
+        self.start_time = monotonic()
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.transfers = 0
+        self.checksum_failures = 0
+        self.packet_check_failures = 0
+        self.discarded_frames = 0
+        self.overflowed_frames = 0
+        self.requests = 0
+        self.resends = 0
+        self.request_failures = 0
+        self.packet_counts = {}
+        # bytes per read from the port, or per SPI transfer
+        self.read_size = RslHistogram([1, 4, 16, 64, 256, 1024, 4096])
+        # seconds from sending a register request to its response
+        self.response_time = RslHistogram([0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5])
+
+    def packet_received(self, key: Hashable):
+        self.packet_counts[key] = self.packet_counts.get(key, 0) + 1
+
+    def packet_name(self, key: Hashable) -> str:
+        name = self.packet_names.get(key)
+        if name is not None:
+            return name
+        if isinstance(key, tuple):
+            reg_addr, packet_length = key
+            return f"0x{reg_addr:02X}/{packet_length}"
+        return str(key)
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = monotonic() - self.start_time
+        packets = {}
+        for key, count in self.packet_counts.items():
+            name = self.packet_name(key)
+            if name in packets:
+                # several keys of the same packet dataclass, e.g. batch and single register broadcasts
+                count += packets[name]['count']
+            packets[name] = {'count': count, 'rate': count / elapsed if elapsed > 0 else 0.0}
+        return {
+            'elapsed': elapsed,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'read_rate': self.bytes_read / elapsed if elapsed > 0 else 0.0,
+            'transfers': self.transfers,
+            'frames': sum(self.packet_counts.values()),
+            'checksum_failures': self.checksum_failures,
+            'packet_check_failures': self.packet_check_failures,
+            'discarded_frames': self.discarded_frames,
+            'overflowed_frames': self.overflowed_frames,
+            'requests': self.requests,
+            'resends': self.resends,
+            'request_failures': self.request_failures,
+            'read_size': self.read_size.snapshot(),
+            'response_time': self.response_time.snapshot(),
+            'packets': packets,
+        }
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import functools
+
+import numpy as np
+
+from typing import Dict, Iterable, Optional, Union
+
+from rsl_comm_py.rsl_packet_view import BROADCAST_FIELD_SCALES, broadcast_layout
+
+STRUCT_TO_NUMPY = {'h': '>i2', 'H': '>u2', 'i': '>i4', 'I': '>u4', 'f': '>f4', 'd': '>f8'}
+
+
+@functools.lru_cache(maxsize=None)
+def broadcast_dtype(packet_type: type) -> np.dtype:
+    """
+    Big-endian structured dtype spanning a whole broadcast packet (header, payload, checksum),
+    the fields are the fields of the packet dataclass, header and padding bytes are skipped.
+    """
+    fields, packet_length = broadcast_layout(packet_type)
+    return np.dtype({'names': [name for name, *_ in fields],
+                     'formats': [STRUCT_TO_NUMPY[code] for _, code, _ in fields],
+                     'offsets': [offset for *_, offset in fields],
+                     'itemsize': packet_length})
+
+
+def decode_frames(frames: Union[bytes, bytearray, memoryview, Iterable[bytes]], packet_type: type) -> np.ndarray:
+    """
+    Decode many broadcast packets of the same type at once into a structured array.
+    `frames` are complete packets (as returned by `find_packet`), either concatenated in one buffer or as a sequence.
+    Without scaled fields the result is a zero-copy big-endian view of `frames`, otherwise Euler angles
+    and quaternion components are converted like in `decode_*_broadcast` and stored as `float64`.
+    """
+    if not isinstance(frames, (bytes, bytearray, memoryview)):
+        frames = b''.join(frames)
+    dtype = broadcast_dtype(packet_type)
+    packets = np.frombuffer(frames, dtype=dtype)
+    scales: Dict[str, float] = BROADCAST_FIELD_SCALES.get(packet_type)
+    if scales is None:
+        return packets
+    decoded = np.empty(len(packets), dtype=[(name, 'f8' if name in scales else dtype.fields[name][0])
+                                            for name in dtype.names])
+    for name in dtype.names:
+        decoded[name] = packets[name] / scales[name] if name in scales else packets[name]
+    return decoded
+
+
+def verify_checksums(data: Union[bytes, bytearray, memoryview, np.ndarray], packet_lengths: Union[int, Iterable[int]],
+                     packet_starts: Optional[Iterable[int]] = None) -> np.ndarray:
+    """
+    Verify checksums of many packets in one call, returns the indices of packets with a wrong checksum.
+    `packet_lengths` is either a single length for back-to-back packets of the same type, or a length per packet;
+    `packet_starts` are increasing offsets of the packets in `data`,
+    by default packets follow each other without gaps.
+    `data` may be a `np.memmap` of a capture file, so captures larger than memory are verified in place.
+    """
+    data = np.frombuffer(data, dtype=np.uint8) if not isinstance(data, np.ndarray) else data.view(np.uint8)
+    if packet_starts is None and np.ndim(packet_lengths) == 0:
+        packets = data[:len(data) // packet_lengths * packet_lengths].reshape(-1, packet_lengths)
+        computed_checksums = packets[:, :-2].sum(axis=1, dtype=np.uint32)
+        received_checksums = packets[:, -2].astype(np.uint32) << 8 | packets[:, -1]
+        return np.flatnonzero(computed_checksums != received_checksums)
+    packet_lengths = np.asarray(packet_lengths, dtype=np.int64)
+    if packet_starts is None:
+        packet_starts = np.concatenate(([0], np.cumsum(packet_lengths)[:-1]))
+    packet_starts = np.asarray(packet_starts, dtype=np.int64)
+    packet_lengths = np.broadcast_to(packet_lengths, packet_starts.shape)
+    if len(packet_starts) == 0:
+        return np.empty(0, dtype=np.int64)
+    checksum_starts = packet_starts + packet_lengths - 2
+    # sums of data[start:checksum_start] for every packet, the odd segments (checksum to next packet) are dropped
+    segments = np.empty(2 * len(packet_starts), dtype=np.int64)
+    segments[0::2] = packet_starts
+    segments[1::2] = checksum_starts
+    computed_checksums = np.add.reduceat(data, segments, dtype=np.uint32)[0::2]
+    received_checksums = data[checksum_starts].astype(np.uint32) << 8 | data[checksum_starts + 1]
+    return np.flatnonzero(computed_checksums != received_checksums)
+
+
+if __name__ == '__main__':
+    pass
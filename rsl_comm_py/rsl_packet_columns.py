@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import array
+import dataclasses
+
+from typing import Any, Iterable, Iterator, Union
+
+
+class RslPacketColumns:
+    """
+    Columnar storage for long captures of one broadcast packet type (e.g. `ShearWaterEulerPacket`).
+    Every dataclass field is kept in its own typed `array.array` (8 bytes per value), instead of
+    a Python object per packet and per value. Columns are accessed with the field names of the packet,
+    e.g. `columns.roll`, and indexing or iterating materializes packets, so `repr` and `to_csv` of
+    the packet class apply to the rows.
+    """
+
+    def __init__(self, packet_type: type, packets: Iterable = ()):
+        self.packet_type = packet_type
+        self.field_names = tuple(field.name for field in dataclasses.fields(packet_type))
+        type_codes = {field.name: 'q' if field.type in (int, 'int') else 'd'
+                      for field in dataclasses.fields(packet_type)}
+        self.columns = {name: array.array(type_codes[name]) for name in self.field_names}
+        self.extend(packets)
+
+    def __len__(self) -> int:
+        return len(self.columns[self.field_names[0]])
+
+    def __getattr__(self, name: str) -> array.array:
+        # only called for names which are not attributes of the container itself, i.e. packet fields
+        columns = self.__dict__.get('columns')
+        if columns is None or name not in columns:
+            raise AttributeError(f"{type(self).__name__} of {self.packet_type.__name__} has no field {name}!")
+        return columns[name]
+
+    def __getitem__(self, idx: Union[int, slice]) -> Any:
+        if isinstance(idx, slice):
+            sliced = RslPacketColumns(self.packet_type)
+            for name in self.field_names:
+                sliced.columns[name] = self.columns[name][idx]
+            return sliced
+        return self.packet_type(*[self.columns[name][idx] for name in self.field_names])
+
+    def __iter__(self) -> Iterator:
+        columns = [self.columns[name] for name in self.field_names]
+        for values in zip(*columns):
+            yield self.packet_type(*values)
+
+    def __repr__(self) -> str:
+        if len(self) > 6:
+            rows = [repr(packet) for packet in self[:3]] + ['...'] + [repr(packet) for packet in self[-3:]]
+        else:
+            rows = [repr(packet) for packet in self]
+        return f"{type(self).__name__}({self.packet_type.__name__}, {len(self)} packets: [" + ', '.join(rows) + "])"
+
+    def append(self, packet: Any):
+        for name in self.field_names:
+            self.columns[name].append(getattr(packet, name))
+
+    def extend(self, packets: Iterable):
+        for packet in packets:
+            self.append(packet)
+
+    def to_csv(self) -> str:
+        return ''.join(packet.to_csv() for packet in self)
+
+    def csv_header(self) -> str:
+        return self.packet_type.csv_header()
+
+    def memory_size(self) -> int:
+        return sum(column.itemsize * column.buffer_info()[1] for column in self.columns.values())
+
+
+if __name__ == '__main__':
+    pass
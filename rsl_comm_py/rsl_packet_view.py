@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import dataclasses
+import functools
+import re
+import struct
+
+from typing import Any, List, Tuple
+
+from rsl_comm_py import shearwater_broadcast_packets, um7_broadcast_packets, um8_broadcast_packets
+
+EULER_SCALE = 91.02222
+QUATERNION_SCALE = 29789.09091
+PACKET_HEADER_LENGTH = 5
+
+# payload layouts of broadcast packets, the same as used by the `decode_*_broadcast` methods
+BROADCAST_STRUCTS = {
+    **shearwater_broadcast_packets.BROADCAST_STRUCTS,
+    **um7_broadcast_packets.BROADCAST_STRUCTS,
+    **um8_broadcast_packets.BROADCAST_STRUCTS,
+}
+
+# integer fields converted to physical units when decoding
+BROADCAST_FIELD_SCALES = {}
+for packet_type in BROADCAST_STRUCTS:
+    if packet_type.__name__.endswith('EulerPacket'):
+        BROADCAST_FIELD_SCALES[packet_type] = {name: EULER_SCALE for name in
+                                               ['roll', 'pitch', 'yaw', 'roll_rate', 'pitch_rate', 'yaw_rate']}
+    elif packet_type.__name__.endswith('QuaternionPacket'):
+        BROADCAST_FIELD_SCALES[packet_type] = {name: QUATERNION_SCALE for name in ['q_w', 'q_x', 'q_y', 'q_z']}
+
+
+@functools.lru_cache(maxsize=None)
+def broadcast_layout(packet_type: type) -> Tuple[List[Tuple[str, str, int]], int]:
+    """
+    Fields of a broadcast packet as (field name, `struct` format character, offset in the packet),
+    and the packet length (header, payload, checksum), padding bytes of the payload are skipped.
+    """
+    payload_format = BROADCAST_STRUCTS[packet_type].format
+    names = [field.name for field in dataclasses.fields(packet_type)]
+    codes, offsets = [], []
+    offset = PACKET_HEADER_LENGTH
+    for count, code in re.findall(r'(\d*)([a-zA-Z])', payload_format):
+        count = int(count) if count else 1
+        if code == 'x':
+            offset += count
+            continue
+        for _ in range(count):
+            codes.append(code)
+            offsets.append(offset)
+            offset += struct.calcsize(code)
+    if len(codes) != len(names):
+        raise ValueError(f"Payload format {payload_format} does not match fields of {packet_type.__name__}!")
+    return list(zip(names, codes, offsets)), offset + 2
+
+
+def payload_registers(packet_type: type) -> int:
+    # number of 4-byte registers in the payload of the broadcast packet
+    _, packet_length = broadcast_layout(packet_type)
+    return (packet_length - PACKET_HEADER_LENGTH - 2) // 4
+
+
+def decode_payload(packet_type: type, payload: bytes) -> Any:
+    # packet dataclass from the broadcast payload alone, e.g. from a block of registers read over SPI
+    return packet_view_type(packet_type)(payload, -PACKET_HEADER_LENGTH).materialize()
+
+
+class RslPacketView:
+    """
+    Lazy view of a broadcast packet: holds the `memoryview` of the packet and decodes a field only
+    when the field is accessed, with the attribute names of the packet dataclass.
+    The view does not copy the packet, so it is valid only as long as the underlying buffer holds the packet,
+    e.g. for `recv_broadcast(lazy=True)` until the next packet is requested. Use `materialize` to keep the packet.
+    """
+    __slots__ = ('packet', 'offset')
+    packet_type = None
+    field_names = ()
+
+    def __init__(self, packet: memoryview, offset: int = 0):
+        self.packet = packet
+        self.offset = offset
+
+    def materialize(self) -> Any:
+        return self.packet_type(*[getattr(self, name) for name in self.field_names])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.materialize()!r})"
+
+
+def field_property(field_struct: struct.Struct, field_offset: int, scale: float = None) -> property:
+    unpack_from = field_struct.unpack_from
+    if scale is None:
+        def decode_field(self):
+            return unpack_from(self.packet, self.offset + field_offset)[0]
+    else:
+        def decode_field(self):
+            return unpack_from(self.packet, self.offset + field_offset)[0] / scale
+    return property(decode_field)
+
+
+@functools.lru_cache(maxsize=None)
+def packet_view_type(packet_type: type) -> type:
+    """
+    `RslPacketView` subclass for the packet type,
+    e.g. `ShearWaterQuaternionPacketView` for `ShearWaterQuaternionPacket`.
+    """
+    fields, _ = broadcast_layout(packet_type)
+    scales = BROADCAST_FIELD_SCALES.get(packet_type, {})
+    namespace = {'__slots__': (), 'packet_type': packet_type, 'field_names': tuple(name for name, *_ in fields)}
+    for name, code, offset in fields:
+        namespace[name] = field_property(struct.Struct('>' + code), offset, scales.get(name))
+    return type(f"{packet_type.__name__}View", (RslPacketView,), namespace)
+
+
+if __name__ == '__main__':
+    pass
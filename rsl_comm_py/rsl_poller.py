@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import logging
+import math
+
+from time import monotonic, sleep
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from rsl_comm_py.rsl_packet_view import decode_payload, payload_registers
+
+
+class RslPollGroup:
+    """
+    Schedule and statistics of one polled register group (a `snapshot_groups` entry of the sensor).
+    """
+
+    def __init__(self, name: str, rate: float, start_addr: int, packet_type: type):
+        self.name = name
+        self.rate = rate
+        self.period = 1.0 / rate
+        self.start_addr = start_addr
+        self.count = payload_registers(packet_type)
+        self.packet_type = packet_type
+        self.due_time = None
+        self.samples = 0
+        self.missed = 0
+        self.errors = 0
+        self.first_time = None
+        self.last_time = None
+        self.jitter_sum = 0.0
+        self.jitter_squares = 0.0
+        self.jitter_max = 0.0
+
+    def sampled(self, sample_time: float):
+        # jitter is the deviation of the read from its due time, reads of coalesced groups may come early
+        jitter = abs(sample_time - self.due_time)
+        self.samples += 1
+        self.jitter_sum += jitter
+        self.jitter_squares += jitter * jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+        if self.first_time is None:
+            self.first_time = sample_time
+        self.last_time = sample_time
+
+    def schedule_next(self, now: float):
+        # the next due time follows the schedule, not the time of the read, so delays do not accumulate,
+        # periods which have already passed are skipped rather than read in a burst
+        self.due_time += self.period
+        if self.due_time <= now:
+            skipped = math.floor((now - self.due_time) / self.period) + 1
+            self.missed += skipped
+            self.due_time += skipped * self.period
+
+    def statistics(self) -> Dict[str, float]:
+        elapsed = (self.last_time - self.first_time) if self.samples > 1 else 0.0
+        mean = self.jitter_sum / self.samples if self.samples else 0.0
+        variance = self.jitter_squares / self.samples - mean * mean if self.samples else 0.0
+        return {
+            'target_rate': self.rate,
+            'achieved_rate': (self.samples - 1) / elapsed if elapsed > 0 else 0.0,
+            'samples': self.samples,
+            'missed': self.missed,
+            'errors': self.errors,
+            'jitter_mean': mean,
+            'jitter_std': math.sqrt(max(variance, 0.0)),
+            'jitter_max': self.jitter_max,
+        }
+
+
+class RslPoller:
+    """
+    Polls register groups of a sensor at independent rates, for SPI sensors (no broadcasts), or UART sensors
+    with broadcasts disabled, e.g. `RslPoller(sensor, {'proc_gyro': 500.0, 'health': 1.0})`, groups are
+    the `snapshot_groups` of the sensor, the same for both transports (`get_snapshot_groups` of the UART driver).
+    Due times are kept on a `monotonic` schedule (the next read is due one period after the previous due time,
+    not after the previous read), so the rate does not drift. Groups due within `coalesce_window` seconds
+    of each other are read together, registers of adjacent or overlapping groups in a single burst
+    (`read_registers`). Reads are decoded into the packet dataclasses of the UART broadcasts.
+    Deviation of each read from its due time (jitter), achieved rates, and skipped periods are
+    reported by `statistics`.
+    """
+
+    def __init__(self, sensor, rates: Dict[str, float], coalesce_window: float = 0.0005):
+        if len(rates) == 0:
+            raise ValueError("No register group is given to poll!")
+        if any(rate <= 0 for rate in rates.values()):
+            raise ValueError(f"Polling rates must be positive, got: {rates}!")
+        self.sensor = sensor
+        self.coalesce_window = coalesce_window
+        self.groups = []
+        for name, rate in rates.items():
+            reg_name, packet_type = sensor.snapshot_groups[name]
+            start_addr = sensor.svd_parser.find_register_by(name=reg_name).address
+            self.groups.append(RslPollGroup(name, rate, start_addr, packet_type))
+        self.bursts = 0
+
+    def due_groups(self, now: float) -> List[RslPollGroup]:
+        return [group for group in self.groups if group.due_time <= now + self.coalesce_window]
+
+    def bursts_of(self, groups: List[RslPollGroup]) -> List[Tuple[int, int, List[RslPollGroup]]]:
+        # (start address, register count, groups) of register ranges covering the groups, adjacent ranges merged
+        bursts = []
+        for group in sorted(groups, key=lambda group: group.start_addr):
+            if bursts and group.start_addr <= bursts[-1][0] + bursts[-1][1]:
+                start_addr, count, burst_groups = bursts[-1]
+                bursts[-1] = (start_addr, max(count, group.start_addr + group.count - start_addr),
+                              burst_groups + [group])
+            else:
+                bursts.append((group.start_addr, group.count, [group]))
+        return bursts
+
+    def poll(self, num_packets: int = -1, duration: Optional[float] = None) -> Iterator[Any]:
+        """
+        Generator of decoded packets in the order they are read, for `num_packets` packets (-1 for no limit),
+        or for `duration` seconds.
+        """
+        start_time = monotonic()
+        for group in self.groups:
+            group.due_time = start_time
+        end_time = start_time + duration if duration is not None else math.inf
+        received_packets = 0
+        while num_packets == -1 or received_packets < num_packets:
+            now = monotonic()
+            if now >= end_time:
+                return
+            next_due_time = min(group.due_time for group in self.groups)
+            if next_due_time - now > self.coalesce_window:
+                # a group due after the end is not waited for
+                sleep(min(next_due_time, end_time) - now)
+                continue
+            for start_addr, count, groups in self.bursts_of(self.due_groups(now)):
+                sample_time = monotonic()
+                ok, payload = self.sensor.read_registers(start_addr, count)
+                self.bursts += 1
+                for group in groups:
+                    if ok:
+                        # failed reads are counted as errors, not as samples of the achieved rate and jitter
+                        group.sampled(sample_time)
+                    group.schedule_next(monotonic())
+                    if not ok:
+                        logging.error(f"Polling {group.name} failed!")
+                        group.errors += 1
+                        continue
+                    offset = 4 * (group.start_addr - start_addr)
+                    yield decode_payload(group.packet_type, payload[offset:offset + 4 * group.count])
+                    received_packets += 1
+                    if num_packets != -1 and received_packets >= num_packets:
+                        return
+
+    def statistics(self) -> Dict[str, Dict[str, float]]:
+        return {group.name: group.statistics() for group in self.groups}
+
+
+if __name__ == '__main__':
+    pass
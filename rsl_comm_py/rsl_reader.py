@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import logging
+import queue
+import threading
+
+from time import monotonic
+from typing import Any, Iterator, Optional, Tuple
+
+
+class RslBroadcastReader:
+    """
+    Background thread receiving from the port of a serial sensor (`UM7Serial`, `UM8Serial`, `ShearWaterSerial`).
+    The thread blocks on the port (`read_port` of the sensor, `poll_interval` as timeout) instead of spinning,
+    frames packets in the sensor ring buffer, and delivers decoded broadcasts to subscribers through bounded queues,
+    one queue per `subscribe` call. Only packet types with subscribers are decoded. When a queue is full,
+    the oldest packet is dropped (counted in `dropped_packets`), so a slow consumer never stalls the port.
+    Register responses are kept in `pending_responses` of the sensor while a request waits for them
+    (`waiting_requests` of the sensor), so `read_register` and `write_register` of the sensor keep working while
+    the reader runs: the sensor stops reading the port itself and waits for the reader to receive its response,
+    responses are left for the caller waiting for them. The `recv_broadcast*` generators
+    of the sensor take their packets from a subscription (`packets`). When the reader stops, on `stop`, at the end
+    of the data, or on an error (kept in `error`), the sensor reads the port itself again.
+    """
+
+    def __init__(self, sensor, poll_interval: float = 0.1, response_timeout: float = 0.05):
+        self.sensor = sensor
+        self.poll_interval = poll_interval
+        self.response_timeout = response_timeout
+        # notified when a response is kept in `pending_responses` of the sensor, or the reader stops
+        self.response_arrived = threading.Condition()
+        self.subscribers = {}
+        self.dropped_packets = 0
+        self.error = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def subscribe(self, packet_type: Optional[type] = None, maxsize: int = 1024) -> queue.Queue:
+        # queue of decoded packets of the packet type, or of all decoded packets for `None`
+        packet_queue = queue.Queue(maxsize=maxsize)
+        self.subscribers.setdefault(packet_type, []).append(packet_queue)
+        return packet_queue
+
+    def unsubscribe(self, packet_queue: queue.Queue):
+        for packet_queues in self.subscribers.values():
+            if packet_queue in packet_queues:
+                packet_queues.remove(packet_queue)
+
+    def start(self) -> 'RslBroadcastReader':
+        if self.is_running:
+            return self
+        self.stop_event.clear()
+        self.error = None
+        self.sensor.reader = self
+        self.thread = threading.Thread(target=self.run, name=f"{type(self.sensor).__name__} reader", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        if self.sensor.reader is self:
+            self.sensor.reader = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def publish(self, packet_queue: queue.Queue, packet):
+        while True:
+            try:
+                packet_queue.put_nowait(packet)
+                return
+            except queue.Full:
+                try:
+                    packet_queue.get_nowait()
+                    self.dropped_packets += 1
+                except queue.Empty:
+                    pass
+
+    def run(self):
+        sensor = self.sensor
+        read_size = sensor.buffer.capacity
+        all_subscribers = self.subscribers.setdefault(None, [])
+        try:
+            while not self.stop_event.is_set():
+                packet = sensor.find_packet()
+                if len(packet) == 0:
+                    # blocks in the OS until a byte arrives or `poll_interval` passes, then takes what is waiting
+                    sensor.read_port(read_size, self.poll_interval)
+                    continue
+                if sensor.waiting_requests and (len(packet) <= 11 or not sensor.is_broadcast(packet)):
+                    # register responses and batch responses while a request waits for them, single register
+                    # broadcasts (e.g. health) are filtered out by the address when waiting
+                    with self.response_arrived:
+                        sensor.keep_frame(sensor.pending_responses, (monotonic(), bytes(packet)))
+                        self.response_arrived.notify_all()
+                decode_callback = sensor.broadcast_decoders.get((packet[4], len(packet)))
+                if decode_callback is None:
+                    continue
+                packet_type = sensor.broadcast_packet_type(decode_callback)
+                packet_queues = self.subscribers.get(packet_type) if packet_type is not None else None
+                if not packet_queues and not all_subscribers:
+                    continue
+                if not sensor.check_packet(packet):
+                    logging.error(f"Checking packet type failed for broadcast with addr: {packet[4]}!")
+                    continue
+                decoded_packet = decode_callback(packet)
+                for packet_queue in (packet_queues or []) + all_subscribers:
+                    self.publish(packet_queue, decoded_packet)
+        except EOFError:
+            logging.info(f"{type(sensor).__name__} reader: end of data")
+        except Exception as error:
+            logging.error(f"{type(sensor).__name__} reader stopped with: {error!r}")
+            self.error = error
+        finally:
+            # the sensor reads the port itself again, waiting callers are woken up
+            if sensor.reader is self:
+                sensor.reader = None
+            self.stop_event.set()
+            with self.response_arrived:
+                self.response_arrived.notify_all()
+
+    def next_response(self, sent_time: Optional[float] = None) -> bytes:
+        # next register response, empty if none is received within `response_timeout`,
+        # responses which arrived before `sent_time` are dropped (counted in `discarded_frames` of the sensor metrics)
+        pending_responses = self.sensor.pending_responses
+        deadline = monotonic() + self.response_timeout
+        with self.response_arrived:
+            while True:
+                while pending_responses:
+                    arrival_time, packet = pending_responses.popleft()
+                    if sent_time is None or arrival_time >= sent_time:
+                        return packet
+                    self.sensor.metrics.discarded_frames += 1
+                timeout = deadline - monotonic()
+                if timeout <= 0 or self.stop_event.is_set():
+                    return bytes()
+                self.response_arrived.wait(timeout)
+
+    def wait_response(self, reg_addr: int, hidden: bool = False, expected_length: int = 7,
+                      sent_time: Optional[float] = None) -> Tuple[bool, bytes]:
+        # responses to other registers are left in `pending_responses` for the callers waiting for them,
+        # stale responses are dropped as for `take_response` of the sensor
+        deadline = monotonic() + self.response_timeout
+        with self.response_arrived:
+            while True:
+                ok, packet = self.sensor.take_response(reg_addr, hidden, expected_length, sent_time)
+                timeout = deadline - monotonic()
+                if ok or timeout <= 0 or self.stop_event.is_set():
+                    return ok, packet
+                self.response_arrived.wait(timeout)
+
+    def packets(self, packet_type: Optional[type] = None, num_packets: int = -1, timeout: Optional[float] = None,
+                maxsize: int = 1024) -> Iterator[Any]:
+        # generator of decoded packets of a subscription (as `subscribe`), for `num_packets` packets (-1 for no limit),
+        # ends when the reader stops, raises the error the reader stopped with, or `TimeoutError` if no packet arrives
+        # within `timeout` seconds (`None` waits forever)
+        packet_queue = self.subscribe(packet_type, maxsize)
+        try:
+            received_packets = 0
+            while num_packets == -1 or received_packets < num_packets:
+                wait_start = monotonic()
+                while True:
+                    try:
+                        packet = packet_queue.get(timeout=self.poll_interval)
+                        break
+                    except queue.Empty:
+                        if not self.is_running:
+                            if self.error is not None:
+                                raise self.error
+                            return
+                        if timeout is not None and monotonic() - wait_start >= timeout:
+                            raise TimeoutError(f"No packet received from {type(self.sensor).__name__} reader "
+                                               f"within {timeout} s!")
+                yield packet
+                received_packets += 1
+        finally:
+            self.unsubscribe(packet_queue)
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+from typing import Iterable, Optional, Tuple
+
+
+class RslRegisterCache:
+    """
+    Payloads of configuration registers (CREGs and hidden registers), which only change when they are written,
+    so reading them again is served without a round trip to the sensor. Data registers and commands are not cached.
+    Writing a register invalidates it (write-through invalidation), and writing a command (e.g. `reset_to_factory`,
+    `zero_gyros`) invalidates all registers, since the sensor may change any of them.
+    Cache lookups are counted in `hits` and `misses`.
+    """
+
+    def __init__(self, sensor, registers: Iterable[Tuple[int, bool]] = ()):
+        self.sensor = sensor
+        self.registers = set(registers)
+        self.payloads = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def lookup(self, reg_addr: int, hidden: bool = False) -> Optional[bytes]:
+        # cached payload, `None` for registers which are not cached (yet)
+        key = (reg_addr, hidden)
+        if key not in self.registers:
+            return None
+        payload = self.payloads.get(key)
+        if payload is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return payload
+
+    def store(self, reg_addr: int, payload: bytes, hidden: bool = False):
+        # payload of 4 bytes per register, for consecutive registers starting at `reg_addr`
+        for idx in range(len(payload) // 4):
+            if (reg_addr + idx, hidden) in self.registers:
+                self.payloads[(reg_addr + idx, hidden)] = bytes(payload[4 * idx:4 * idx + 4])
+
+    def written(self, reg_addr: int, count: int = 1, hidden: bool = False):
+        if (reg_addr, hidden) not in self.registers:
+            self.payloads.clear()
+            return
+        for idx in range(count):
+            self.payloads.pop((reg_addr + idx, hidden), None)
+
+    def invalidate(self, reg_addr: Optional[int] = None, hidden: bool = False):
+        # the register at `reg_addr`, or all registers for `None`, are read from the sensor next time
+        if reg_addr is None:
+            self.payloads.clear()
+        else:
+            self.payloads.pop((reg_addr, hidden), None)
+
+    def refresh(self):
+        # read all cached registers again from the sensor, in bulk
+        self.payloads.clear()
+        for hidden in (False, True):
+            addresses = [reg_addr for reg_addr, is_hidden in self.registers if is_hidden == hidden]
+            if addresses:
+                self.sensor.read_registers_payloads(addresses, hidden)
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import os
+
+from bisect import bisect_right
+from time import monotonic_ns, sleep
+from typing import Iterable, Optional, Tuple, Union
+
+from rsl_comm_py.rsl_recorder import FILE_MAGIC, read_frames
+
+
+class ReplayPort:
+    """
+    Serial port replaying a capture, to be passed as `port` keyword to `UM7Serial`, `UM8Serial`,
+    or `ShearWaterSerial`, so recorded data goes through the same receive and decoding path as the sensor data.
+    The capture is either a raw byte stream (`data`), or (timestamp in ns, frame) tuples, e.g. from `read_frames`.
+    With `speed` set to `None` bytes are served as fast as they are read, otherwise bytes are served when they
+    are due at the recorded time divided by `speed`: by frame timestamps, or by the `baudrate` for raw bytes.
+    When the capture is exhausted, reading raises `EOFError`, which ends the `recv_broadcast*` generators.
+    Bytes sent to the port are kept in `written`.
+    """
+
+    def __init__(self, data: bytes = bytes(), frames: Iterable[Tuple[int, bytes]] = None, speed: Optional[float] = None,
+                 baudrate: int = 115200, max_in_waiting: int = 4096):
+        self.port = 'replay'
+        self.baudrate = baudrate
+        self.timeout = None
+        self.is_open = True
+        self.speed = speed
+        self.max_in_waiting = max_in_waiting
+        self.written = bytearray()
+        self.data = bytearray(data)
+        if frames is None:
+            # raw bytes arrive at the line rate: 10 bits per byte (start, 8 data bits, stop)
+            chunk_size = 64
+            self.chunk_ends = [min(end, len(self.data)) for end in range(chunk_size, len(self.data) + chunk_size,
+                                                                         chunk_size)]
+            self.chunk_times_ns = [end * 10 * 1_000_000_000 // baudrate for end in self.chunk_ends]
+        else:
+            self.chunk_ends, self.chunk_times_ns = [], []
+            first_timestamp_ns = None
+            for timestamp_ns, frame in frames:
+                if first_timestamp_ns is None:
+                    first_timestamp_ns = timestamp_ns
+                self.data += frame
+                self.chunk_ends.append(len(self.data))
+                self.chunk_times_ns.append(timestamp_ns - first_timestamp_ns)
+        self.position = 0
+        # replay clock starts with the first access of the port
+        self.start_ns = None
+
+    @classmethod
+    def from_file(cls, file_name: Union[str, os.PathLike], **kwargs) -> 'ReplayPort':
+        # frame log written by `RslFrameRecorder`, or a raw byte capture
+        with open(file_name, 'rb') as fd:
+            is_frame_log = fd.read(len(FILE_MAGIC)) == FILE_MAGIC
+            if not is_frame_log:
+                fd.seek(0)
+                return cls(data=fd.read(), **kwargs)
+        return cls(frames=read_frames(file_name), **kwargs)
+
+    def arrived(self) -> int:
+        # end of the data which has arrived at the port so far
+        if self.speed is None:
+            return len(self.data)
+        if self.start_ns is None:
+            self.start_ns = monotonic_ns()
+        elapsed_ns = (monotonic_ns() - self.start_ns) * self.speed
+        chunk_idx = bisect_right(self.chunk_times_ns, elapsed_ns)
+        return self.chunk_ends[chunk_idx - 1] if chunk_idx > 0 else 0
+
+    def wait_arrival(self):
+        # as a serial port, wait for the next bytes at most `timeout` seconds
+        chunk_idx = bisect_right(self.chunk_ends, self.position)
+        due_ns = self.start_ns + self.chunk_times_ns[chunk_idx] / self.speed
+        wait_time = max(0.0, (due_ns - monotonic_ns()) / 1e9)
+        sleep(wait_time if self.timeout is None else min(wait_time, self.timeout))
+
+    @property
+    def in_waiting(self) -> int:
+        return min(self.arrived() - self.position, self.max_in_waiting)
+
+    def readinto(self, buffer) -> int:
+        if self.position >= len(self.data):
+            raise EOFError("Replayed capture is exhausted!")
+        if self.speed is not None and self.arrived() <= self.position:
+            self.wait_arrival()
+        num_bytes = min(len(buffer), self.arrived() - self.position)
+        buffer[:num_bytes] = self.data[self.position:self.position + num_bytes]
+        self.position += num_bytes
+        return num_bytes
+
+    def read(self, size: int = 1) -> bytes:
+        buffer = bytearray(size)
+        num_bytes = self.readinto(buffer)
+        return bytes(buffer[:num_bytes])
+
+    def write(self, data: bytes) -> int:
+        self.written += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        # drop the data which has arrived but is not read yet, nothing is pending when replaying as fast as possible
+        if self.speed is not None:
+            self.position = max(self.position, self.arrived())
+
+    def open(self):
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+from typing import Dict, Optional
+
+
+class RslRetryPolicy:
+    """
+    When to send a register request again, and when to give up, for one link to the sensor (`retry_policy` keyword
+    of the sensor classes). The round trip time is estimated from the responses as in TCP (RFC 6298): smoothed round
+    trip `srtt` and its variation `rttvar`, samples are taken only from requests answered on the first attempt,
+    since the response to a repeated request cannot be attributed to one of the attempts.
+    A request is sent again when no response comes within `srtt + 4 * rttvar` (`initial_timeout` before the first
+    sample), the timeout grows by `backoff` for each attempt, the request is sent at most `max_attempts` times,
+    and fails when no response comes within `deadline` seconds. Subclasses may override `timeout` to implement
+    a different schedule.
+    """
+
+    def __init__(self, initial_timeout: float = 0.05, min_timeout: float = 0.005, max_timeout: float = 1.0,
+                 backoff: float = 2.0, max_attempts: int = 4, deadline: float = 0.2):
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.backoff = backoff
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.srtt = None
+        self.rttvar = None
+        self.requests = 0
+        self.attempts = 0
+        self.failures = 0
+        self.last_rtt = None
+        self.min_rtt = None
+        self.max_rtt = None
+
+    def timeout(self, attempt: int) -> float:
+        # time to wait for the response to the `attempt` (1, 2, ...) before the request is sent again
+        rto = self.initial_timeout if self.srtt is None else self.srtt + 4 * self.rttvar
+        rto = rto * self.backoff ** (attempt - 1)
+        return min(max(rto, self.min_timeout), self.max_timeout)
+
+    def record_response(self, attempts: int, rtt: Optional[float]):
+        # `rtt` of `None` counts the request without taking a round trip sample
+        self.requests += 1
+        self.attempts += attempts
+        if attempts > 1 or rtt is None:
+            return
+        self.last_rtt = rtt
+        self.min_rtt = rtt if self.min_rtt is None else min(self.min_rtt, rtt)
+        self.max_rtt = rtt if self.max_rtt is None else max(self.max_rtt, rtt)
+        if self.srtt is None:
+            self.srtt, self.rttvar = rtt, rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+
+    def record_failure(self, attempts: int):
+        self.requests += 1
+        self.attempts += attempts
+        self.failures += 1
+
+    def statistics(self) -> Dict[str, Optional[float]]:
+        return {
+            'requests': self.requests,
+            'attempts': self.attempts,
+            'retransmissions': self.attempts - self.requests,
+            'failures': self.failures,
+            'srtt': self.srtt,
+            'rttvar': self.rttvar,
+            'last_rtt': self.last_rtt,
+            'min_rtt': self.min_rtt,
+            'max_rtt': self.max_rtt,
+            'timeout': self.timeout(1),
+        }
+
+
+if __name__ == '__main__':
+    pass
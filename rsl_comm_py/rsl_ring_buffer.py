@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import logging
+
+
+class RslRingBuffer:
+    """
+    Preallocated receive buffer shared by the serial drivers.
+
+    Bytes from the port are read straight into a fixed `bytearray`, and packets are handed out
+    as `memoryview` slices of that storage, so framing a packet copies nothing. Instead of wrapping
+    around (which would split packets in two), consumed space is reclaimed by sliding the unread
+    tail to the front of the storage once the end is reached. The tail is normally a partial packet,
+    so the cost of sliding is amortized to almost nothing per received byte.
+
+    NOTE: a `memoryview` returned by `peek` is valid only until the next `write` / `read_from` call.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.data = bytearray(capacity)
+        self.view = memoryview(self.data)
+        self.start = 0
+        self.end = 0
+        self.dropped_bytes = 0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __getitem__(self, idx: int) -> int:
+        return self.data[self.start + idx]
+
+    def clear(self):
+        self.start = 0
+        self.end = 0
+
+    def compact(self):
+        length = self.end - self.start
+        if self.start > 0:
+            # memoryview assignment uses memmove, overlapping source and destination are fine
+            self.view[0:length] = self.view[self.start:self.end]
+            self.start = 0
+            self.end = length
+
+    def reserve(self, size: int) -> int:
+        size = min(size, self.capacity)
+        if self.capacity - self.end >= size:
+            return size
+        overflow = len(self) + size - self.capacity
+        if overflow > 0:
+            # consumer fell behind the sensor: drop the oldest bytes, as the UART FIFO would do
+            logging.warning(f"Receive buffer overflow, dropping {overflow} oldest bytes!")
+            self.dropped_bytes += overflow
+            self.start += overflow
+        self.compact()
+        return size
+
+    def write(self, data: bytes) -> int:
+        size = self.reserve(len(data))
+        self.view[self.end:self.end + size] = memoryview(data)[len(data) - size:]
+        self.end += size
+        return size
+
+    def read_from(self, port, size: int) -> int:
+        end = self.end
+        if self.capacity - end < size:
+            # unread bytes stay in the port, so read no more than fits without dropping buffered data
+            free_space = self.capacity - len(self)
+            size = self.reserve(min(size, free_space) if free_space > 0 else size)
+            end = self.end
+        num_bytes = port.readinto(self.view[end:end + size])
+        num_bytes = num_bytes if num_bytes is not None else 0
+        self.end = end + num_bytes
+        return num_bytes
+
+    def find(self, sub: bytes, offset: int = 0) -> int:
+        idx = self.data.find(sub, self.start + offset, self.end)
+        return idx - self.start if idx != -1 else -1
+
+    def peek(self, offset: int, length: int) -> memoryview:
+        return self.view[self.start + offset:self.start + offset + length]
+
+    def consume(self, num_bytes: int):
+        self.start += max(0, min(num_bytes, len(self)))
+        if self.start == self.end:
+            # buffer is drained, next read starts from the beginning of the storage without moving data
+            self.start = 0
+            self.end = 0
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,788 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import logging
+import os
+import select
+import threading
+import zlib
+
+from collections import deque
+from contextlib import contextmanager
+from time import monotonic
+from typing import Any, Tuple, List, Dict, Callable, Generator, Optional
+
+from rsl_comm_py.rsl_packet_view import BROADCAST_STRUCTS, decode_payload, packet_view_type, payload_registers
+from rsl_comm_py.rsl_metrics import RslMetrics
+from rsl_comm_py.rsl_reader import RslBroadcastReader
+from rsl_comm_py.rsl_register_cache import RslRegisterCache
+from rsl_comm_py.rsl_retry import RslRetryPolicy
+from rsl_comm_py.rsl_ring_buffer import RslRingBuffer
+
+
+def byte_sum(data: bytes) -> int:
+    # Packet checksum is the plain sum of bytes. Adler-32 keeps the sum of bytes + 1 modulo 65521
+    # in its lower half, for up to 256 bytes (packets are at most 131 bytes) the modulo never applies,
+    # so the sum is computed in C, and from a `memoryview` without copying
+    if len(data) > 256:
+        return sum(data)
+    return (zlib.adler32(data) & 0xFFFF) - 1
+
+
+class RslException(Exception):
+    """
+    RSL Exception class for recording RedShiftLabs and/or UM7 specific errors
+    """
+    pass
+
+
+class RegisterAccessRecorder:
+    """
+    Stand-in for the sensor when running a generated register property: records the register address
+    the property reads or writes, and returns a payload received otherwise (by the async drivers, or by pipelined
+    reads) to the property, so registers are parsed by exactly the same generated code as for single reads.
+    """
+
+    def __init__(self, sensor, payload: bytes = None):
+        self.sensor = sensor
+        self.payload = payload
+        self.reg_addr = None
+        self.hidden = False
+        self.reg_value = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.sensor, name)
+
+    def read_register(self, reg_addr: int, hidden: bool = False) -> Tuple[bool, bytes]:
+        self.reg_addr, self.hidden = reg_addr, hidden
+        return self.payload is not None, self.payload
+
+    def write_register(self, reg_addr: int, reg_value: Any, hidden: bool = False):
+        self.reg_addr, self.reg_value, self.hidden = reg_addr, reg_value, hidden
+
+
+class SerialCommunication:
+    """
+    Receive path shared by `UM7Serial`, `UM8Serial`, and `ShearWaterSerial`.
+    Sensor data is accumulated in the `RslRingBuffer`, and packets are framed in place,
+    i.e. `find_packet` returns a `memoryview` into the buffer, which is valid until the next `recv`.
+    The packet length is derived from the packet type byte (`get_packet_length`, sensor specific),
+    so a packet is returned as soon as its checksum is received.
+    Broadcasts are dispatched to decoders by the (start address, packet length) of the packet,
+    the table is built once from `get_broadcast_decoders` (sensor specific), and can be extended
+    with `register_broadcast_decoder` for packet types the driver does not know about.
+    Broadcasts are named by their groups (`broadcast_groups`, e.g. `euler` for `decode_euler_broadcast`),
+    and the register blocks of the groups are read by `snapshot` (`get_snapshot_groups`, shared with the SPI drivers).
+    Received frames are appended to the `recorder` (e.g. `RslFrameRecorder`), if one is passed as keyword,
+    before they are decoded.
+    Data is received with `read_port`, which blocks in the OS (`select`) until data arrives or the `timeout`
+    (keyword, seconds, `None` by default waits forever) expires: then `send_recv` raises, and the `recv_broadcast*`
+    generators raise `TimeoutError`.
+    Packets are demultiplexed: frames of broadcasts met while waiting for a register response are kept
+    in `pending_broadcasts` for the broadcast consumers, and other frames met while receiving broadcasts
+    are kept in `pending_responses` for `find_response`, so neither side loses the packets of the other.
+    Kept responses are stamped with their arrival time, a response which arrived before its request was sent
+    (e.g. a late duplicate of a resent request) is dropped. When a queue is full, its oldest frame is dropped,
+    and counted in `overflowed_frames` of `metrics` if a request or a broadcast generator waits for it.
+    With `start_reader` a background thread (`RslBroadcastReader`) takes over the port, decoded broadcasts
+    are delivered to its subscriber queues (the `recv_broadcast*` generators subscribe to the reader),
+    and register responses are taken from the reader.
+    With the `cache_registers` keyword, configuration and hidden registers are read from the sensor once and
+    then served from `register_cache` (`RslRegisterCache`) until they are written.
+    Bytes, packets, failed checks and register requests are counted in `metrics` (`RslMetrics`).
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.metrics = kwargs.get('metrics') if kwargs.get('metrics') else RslMetrics()
+        self.buffer = RslRingBuffer(kwargs.get('buffer_capacity') if kwargs.get('buffer_capacity') else 4096)
+        self.preamble = self.get_preamble()
+        self.empty_packet = memoryview(bytes())
+        self.recorder = kwargs.get('recorder')
+        self.timeout = kwargs.get('timeout')
+        self.reader = None
+        self.pending_broadcasts = deque(maxlen=1024)
+        self.pending_responses = deque(maxlen=64)
+        # register requests waiting for their responses, see `waiting_for_responses`
+        self.waiting_requests = 0
+        self.requests_lock = threading.Lock()
+        # `recv_broadcast*` generators receiving broadcasts, see `receiving_broadcasts`
+        self.broadcast_consumers = 0
+        # queues of frames kept aside which are full, warned about once until they have room again
+        self.overflowing_queues = set()
+        self.retry_policy = kwargs.get('retry_policy') if kwargs.get('retry_policy') else RslRetryPolicy()
+        # cleared when the sensor answers none of the batch reads, `read_registers_payloads` then reads one by one
+        self.batch_reads = True
+        self.register_cache = RslRegisterCache(self)
+        if kwargs.get('cache_registers'):
+            self.register_cache.registers.update([(reg.address, False) for reg in self.svd_parser.cregs] +
+                                                 [(reg.address, True) for reg in self.svd_parser.hidden_regs])
+        self.packet_lengths = [self.get_packet_length(packet_type) for packet_type in range(256)]
+        self.broadcast_decoders = {}
+        # snapshot group name (e.g. `euler` for `decode_euler_broadcast`) -> (first register name, packet type)
+        self.snapshot_groups = self.get_snapshot_groups()
+        for reg_name, packet_length, decode_callback in self.get_broadcast_decoders():
+            start_reg = self.svd_parser.find_register_by(name=reg_name)
+            if start_reg is None:
+                logging.warning(f"Register {reg_name} is not found in SVD, broadcast decoding is disabled for it!")
+                self.snapshot_groups.pop(self.broadcast_group(decode_callback), None)
+                continue
+            # decoders of the table are functions of the class, bound to the sensor for dispatching
+            self.register_broadcast_decoder(start_reg.address, packet_length, decode_callback.__get__(self))
+            packet_type = self.broadcast_packet_type(decode_callback)
+            if packet_type is not None:
+                self.metrics.packet_names[(start_reg.address, packet_length)] = packet_type.__name__
+
+    def get_preamble(self) -> bytes:
+        preamble = bytes('snp', encoding='ascii')
+        return preamble
+
+    def get_packet_length(self, packet_type: int) -> int:
+        raise NotImplementedError("This method should be implemented in child classes!")
+
+    @classmethod
+    def get_broadcast_decoders(cls) -> List[Tuple[str, int, Callable]]:
+        # (start register name, packet length, decode function of the class) for each broadcast known to the sensor
+        return []
+
+    @staticmethod
+    def broadcast_group(decode_callback: Callable) -> str:
+        # name of the broadcast group of a decoder, e.g. `euler` for `decode_euler_broadcast`
+        return decode_callback.__name__[len('decode_'):-len('_broadcast')]
+
+    @classmethod
+    def broadcast_groups(cls) -> Dict[str, Tuple[str, int, Callable]]:
+        # broadcast group name -> (start register name, packet length, decode function), read from the class
+        return {cls.broadcast_group(decode_callback): (reg_name, packet_length, decode_callback)
+                for reg_name, packet_length, decode_callback in cls.get_broadcast_decoders()}
+
+    @classmethod
+    def get_snapshot_groups(cls) -> Dict[str, Tuple[str, type]]:
+        # snapshot group name -> (first register name, packet type) of the broadcasts with a known payload layout,
+        # the same groups are polled over UART and SPI
+        snapshot_groups = {}
+        for group, (reg_name, _, decode_callback) in cls.broadcast_groups().items():
+            packet_type = cls.broadcast_packet_type(decode_callback)
+            if packet_type in BROADCAST_STRUCTS:
+                snapshot_groups[group] = (reg_name, packet_type)
+        return snapshot_groups
+
+    def register_broadcast_decoder(self, start_addr: int, packet_length: int, decode_callback: Callable):
+        self.broadcast_decoders[(start_addr, packet_length)] = decode_callback
+
+    @staticmethod
+    def broadcast_packet_type(decode_callback: Callable) -> Optional[type]:
+        # packet dataclass produced by the decoder, taken from its return annotation
+        return getattr(decode_callback, '__annotations__', {}).get('return')
+
+    def broadcast_views(self) -> Dict[Tuple[int, int], Callable]:
+        # lazy views instead of decoders, decoders of packets without known layout are kept as is
+        broadcast_views = {}
+        for key, decode_callback in self.broadcast_decoders.items():
+            packet_type = self.broadcast_packet_type(decode_callback)
+            broadcast_views[key] = \
+                packet_view_type(packet_type) if packet_type in BROADCAST_STRUCTS else decode_callback
+        return broadcast_views
+
+    def compute_checksum(self, partial_packet: bytes) -> bytes:
+        checksum = byte_sum(partial_packet)
+        checksum_bytes = int.to_bytes(checksum, length=2, byteorder='big', signed=False)
+        return checksum_bytes
+
+    def verify_checksum(self, packet: bytes) -> bool:
+        computed_checksum = byte_sum(packet[:-2])
+        received_checksum = packet[-2] << 8 | packet[-1]
+        if computed_checksum != received_checksum:
+            self.metrics.checksum_failures += 1
+            return False
+        return True
+
+    def find_packet(self) -> memoryview:
+        # called once per packet, so the checksum (as in `verify_checksum`) and the packet count
+        # (as in `RslMetrics.packet_received`) are inlined: packets are at most 131 bytes,
+        # the Adler-32 of `byte_sum` never wraps for them
+        preamble = self.preamble
+        buffer = self.buffer
+        data = buffer.data
+        end = buffer.end
+        if buffer.start == end:
+            # all data is framed, the next read starts from the beginning of the storage without moving data
+            buffer.start = buffer.end = 0
+            return self.empty_packet
+        while True:
+            packet_start_idx = data.find(preamble, buffer.start, end)
+
+            if packet_start_idx == -1:
+                # preamble of packet not found, keep only the bytes which might start the next preamble
+                buffer.consume(len(buffer) - len(preamble) + 1)
+                return self.empty_packet
+
+            # skip garbage before the preamble
+            buffer.start = packet_start_idx
+            if end - packet_start_idx < 5:
+                # packet type is not received yet
+                return self.empty_packet
+
+            # packet length is known from the packet type, no need to wait for the next preamble
+            packet_end_idx = packet_start_idx + self.packet_lengths[data[packet_start_idx + 3]]
+            if packet_end_idx > end:
+                # packet is incomplete, wait for more data
+                return self.empty_packet
+
+            view = buffer.view
+            if (zlib.adler32(view[packet_start_idx:packet_end_idx - 2]) & 0xFFFF) - 1 == \
+                    data[packet_end_idx - 2] << 8 | data[packet_end_idx - 1]:
+                # complete packet found in data
+                buffer.start = packet_end_idx
+                packet = view[packet_start_idx:packet_end_idx]
+                packet_counts = self.metrics.packet_counts
+                packet_key = (data[packet_start_idx + 4], packet_end_idx - packet_start_idx)
+                packet_counts[packet_key] = packet_counts.get(packet_key, 0) + 1
+                if self.recorder is not None:
+                    self.recorder.record(packet)
+                return packet
+
+            # preamble was a part of the payload or the packet is corrupted: re-synchronize after this preamble
+            self.metrics.checksum_failures += 1
+            logging.warning(f"Checksum failed for packet: {bytes(view[packet_start_idx:packet_end_idx])}, "
+                            f"skipping preamble!")
+            buffer.start = packet_start_idx + 1
+
+    def read_port(self, size: int, timeout: Optional[float]) -> int:
+        # receive up to `size` bytes waiting in the port into the buffer, when nothing is waiting block until
+        # the first byte arrives or `timeout` expires, returns number of received bytes (0 on timeout)
+        port = self.port
+        in_waiting = port.in_waiting
+        if in_waiting == 0 and timeout == 0:
+            return 0
+        if in_waiting == 0:
+            if os.name == 'posix' and hasattr(port, 'fileno'):
+                readable, _, _ = select.select([port.fileno()], [], [], timeout)
+                if not readable:
+                    return 0
+                num_bytes = self.buffer.read_from(port, max(1, min(size, port.in_waiting)))
+            else:
+                # no selectable handle (Windows, `ReplayPort`): blocking read of the first byte with the port timeout
+                port_timeout = port.timeout
+                port.timeout = timeout
+                try:
+                    num_bytes = self.buffer.read_from(port, 1)
+                finally:
+                    port.timeout = port_timeout
+                if num_bytes > 0 and size > 1:
+                    num_bytes += self.buffer.read_from(port, min(size - 1, port.in_waiting))
+        else:
+            num_bytes = self.buffer.read_from(port, max(1, min(size, in_waiting)))
+        if num_bytes > 0:
+            self.metrics.bytes_read += num_bytes
+            self.metrics.read_size.record(num_bytes)
+        return num_bytes
+
+    def recv_more(self) -> bool:
+        # receive more data for framing, `False` when the data source is exhausted (e.g. end of a replayed capture)
+        try:
+            ok, _ = self.recv()
+        except EOFError:
+            return False
+        if not ok:
+            raise TimeoutError(f"No data received from {self.port_name} within {self.timeout} s!")
+        return True
+
+    def start_reader(self, **kwargs) -> RslBroadcastReader:
+        # keywords are passed to `RslBroadcastReader`, subscribe to packets with `subscribe` of the returned reader
+        if self.reader is None:
+            RslBroadcastReader(self, **kwargs).start()
+        return self.reader
+
+    def stop_reader(self):
+        if self.reader is not None:
+            self.reader.stop()
+
+    def flush_input(self):
+        self.port.reset_input_buffer()
+        self.buffer.clear()
+        self.pending_broadcasts.clear()
+        self.pending_responses.clear()
+
+    @contextmanager
+    def waiting_for_responses(self):
+        # frames which may be register responses are only kept aside in `pending_responses` while a request waits,
+        # the frames left when the last request is done answer none of the later requests and are dropped
+        with self.requests_lock:
+            self.waiting_requests += 1
+        try:
+            yield
+        finally:
+            with self.requests_lock:
+                self.waiting_requests -= 1
+                if self.waiting_requests == 0:
+                    self.pending_responses.clear()
+
+    @contextmanager
+    def receiving_broadcasts(self):
+        # broadcasts kept aside in `pending_broadcasts` are waited for while a `recv_broadcast*` generator runs
+        self.broadcast_consumers += 1
+        try:
+            yield
+        finally:
+            self.broadcast_consumers -= 1
+
+    def keep_frame(self, frames: deque, frame: Any, waited_for: bool = True):
+        # frames kept aside in a bounded queue, the oldest one is dropped when the queue is full, dropped frames
+        # are counted in `overflowed_frames` only when someone waits for them (`waited_for`),
+        # and warned about once until the queue has room again
+        if len(frames) < frames.maxlen:
+            self.overflowing_queues.discard(id(frames))
+        elif waited_for:
+            self.metrics.overflowed_frames += 1
+            if id(frames) not in self.overflowing_queues:
+                self.overflowing_queues.add(id(frames))
+                logging.warning(f"Queue of {frames.maxlen} frames kept aside is full, dropping the oldest frames!")
+        frames.append(frame)
+
+    def is_broadcast(self, packet: memoryview) -> bool:
+        return (packet[4], len(packet)) in self.broadcast_decoders
+
+    @staticmethod
+    def is_response(packet: memoryview, reg_addr: int, hidden: bool, expected_length: int) -> bool:
+        is_packet_hidden = bool((packet[3] >> 1) & 0x01)
+        return len(packet) == expected_length and packet[4] == reg_addr and hidden == is_packet_hidden
+
+    def take_response(self, reg_addr: int, hidden: bool = False, expected_length: int = 7,
+                      sent_time: Optional[float] = None) -> Tuple[bool, bytes]:
+        # response kept aside in `pending_responses`, removed when taken, responses which arrived before
+        # `sent_time` (`monotonic` time the request was sent) answer an earlier request and are dropped
+        pending_responses = self.pending_responses
+        idx = 0
+        while idx < len(pending_responses):
+            arrival_time, packet = pending_responses[idx]
+            if not self.is_response(packet, reg_addr, hidden, expected_length):
+                idx += 1
+                continue
+            del pending_responses[idx]
+            if sent_time is None or arrival_time >= sent_time:
+                return True, packet
+            logging.debug(f"Stale response for register {reg_addr} is dropped")
+            self.metrics.discarded_frames += 1
+        return False, bytes()
+
+    def find_response(self, reg_addr: int, hidden: bool = False, expected_length: int = 7,
+                      sent_time: Optional[float] = None) -> Tuple[bool, bytes]:
+        reader = self.reader
+        if reader is not None:
+            return reader.wait_response(reg_addr, hidden, expected_length, sent_time)
+        ok, packet = self.take_response(reg_addr, hidden, expected_length, sent_time)
+        if ok:
+            return True, packet
+        packet = self.find_packet()
+        while len(packet) > 0:
+            logging.debug(f"addr: {packet[4]}")
+            if self.is_response(packet, reg_addr, hidden, expected_length):
+                # required packet found, copy it out of the receive buffer
+                return True, bytes(packet)
+            if self.is_broadcast(packet):
+                self.keep_frame(self.pending_broadcasts, bytes(packet), self.broadcast_consumers > 0)
+            else:
+                self.metrics.discarded_frames += 1
+            packet = self.find_packet()
+        return False, bytes()
+
+    def request_steps(self, packet: bytes, reg_addr: int, hidden: bool, expected_length: int,
+                      max_attempts: Optional[int] = None,
+                      deadline: Optional[float] = None) -> Generator[float, int, Tuple[bool, bytes]]:
+        # steps of a register request, shared by `request_response` and the awaitable `request`: the command is sent,
+        # sent again and the request fails as decided by `retry_policy`, unless `max_attempts` or `deadline` (seconds)
+        # are given for the call, requests are counted in `metrics`. Yields the time (seconds) to wait for data,
+        # and is sent the number of bytes received meanwhile (or whether data arrived), returns (ok, response),
+        # raises when the sensor sends nothing at all
+        policy = self.retry_policy
+        metrics = self.metrics
+        max_attempts = policy.max_attempts if max_attempts is None else max_attempts
+        metrics.requests += 1
+        with self.waiting_for_responses():
+            # taken before sending, so a response kept aside as soon as it arrives is not taken for a stale one
+            start_time = sent_time = monotonic()
+            if not self.send(packet):
+                raise RslException("Sending packet failed!")
+            attempts = 1
+            deadline_time = start_time + (policy.deadline if deadline is None else deadline)
+            resend_time = sent_time + policy.timeout(attempts)
+            received_bytes = 0
+            while True:
+                ok, sensor_reply = self.find_response(reg_addr, hidden, expected_length, start_time)
+                now = monotonic()
+                if ok:
+                    policy.record_response(attempts, now - sent_time)
+                    metrics.response_time.record(now - start_time)
+                    return True, sensor_reply
+                if now >= deadline_time:
+                    policy.record_failure(attempts)
+                    metrics.request_failures += 1
+                    if received_bytes == 0 and self.reader is None:
+                        raise RslException(f"Receiving packet failed, no data within {now - start_time:.3f} s!")
+                    logging.debug(f"No response for register {reg_addr} after {attempts} attempts")
+                    return False, bytes()
+                if now >= resend_time and attempts < max_attempts:
+                    metrics.resends += 1
+                    self.send(packet)
+                    attempts, sent_time = attempts + 1, now
+                    resend_time = sent_time + policy.timeout(attempts)
+                elif self.reader is None:
+                    # the last attempt waits for its response until the deadline
+                    wait_until = resend_time if attempts < max_attempts else deadline_time
+                    received_bytes += yield min(wait_until, deadline_time) - now
+
+    def request_response(self, packet: bytes, reg_addr: int, hidden: bool, expected_length: int,
+                         max_attempts: Optional[int] = None, deadline: Optional[float] = None) -> Tuple[bool, bytes]:
+        # send the command and receive until its response is found, see `request_steps`
+        steps = self.request_steps(packet, reg_addr, hidden, expected_length, max_attempts, deadline)
+        try:
+            wait_time = next(steps)
+            while True:
+                wait_time = steps.send(self.read_port(self.buffer_size, wait_time))
+        except StopIteration as result:
+            return result.value
+
+    def read_registers_pipelined(self, registers: List[Tuple[int, bool]], window: int = 16,
+                                 retry_time: Optional[float] = None,
+                                 resend_interval: float = 0.05) -> List[Tuple[bool, bytes]]:
+        """
+        Read registers given as (address, hidden) with up to `window` requests in flight: requests are sent
+        back-to-back, and responses are matched by (address, hidden), so reading many registers takes about
+        one round trip plus wire time. A request without response is sent again after `resend_interval` seconds,
+        growing by the `backoff` of `retry_policy` for each attempt, up to `max_attempts` attempts, and fails
+        after `retry_time` seconds (`deadline` of `retry_policy` by default).
+        Returns (ok, payload) per register, as `read_register`.
+        """
+        batches = [(reg_addr, 1, hidden) for reg_addr, hidden in registers]
+        return self.read_batches_pipelined(batches, window, retry_time, resend_interval)
+
+    def read_batches_pipelined(self, batches: List[Tuple[int, int, bool]], window: int = 16,
+                               retry_time: Optional[float] = None,
+                               resend_interval: float = 0.05) -> List[Tuple[bool, bytes]]:
+        # as `read_registers_pipelined` for batches given as (start address, register count, hidden),
+        # a batch of one register is a single register read, payload has 4 bytes per register
+        policy = self.retry_policy
+        retry_time = policy.deadline if retry_time is None else retry_time
+        results = [(False, bytes())] * len(batches)
+        waiting = {}
+        for idx, batch in enumerate(batches):
+            waiting.setdefault(batch, []).append(idx)
+        not_sent = deque(waiting)
+        with self.waiting_for_responses():
+            # responses kept aside before the first request is sent are stale
+            start_time = monotonic()
+            # (time of the first attempt, time to send again, attempts) of the requests waiting for the response
+            in_flight = {}
+            while not_sent or in_flight:
+                now = monotonic()
+                packets = []
+                for batch, (first_sent_time, resend_time, attempts) in list(in_flight.items()):
+                    if now - first_sent_time >= retry_time:
+                        logging.warning(f"No response for register {batch[0]} (count: {batch[1]}, hidden: {batch[2]})!")
+                        policy.record_failure(attempts)
+                        self.metrics.request_failures += 1
+                        del in_flight[batch]
+                    elif now >= resend_time and attempts < policy.max_attempts:
+                        self.metrics.resends += 1
+                        in_flight[batch] = (first_sent_time, now + resend_interval * policy.backoff ** attempts,
+                                            attempts + 1)
+                        packets.append(self.construct_read_packet(batch[0], batch[2], batch[1]))
+                while not_sent and len(in_flight) < window:
+                    batch = not_sent.popleft()
+                    in_flight[batch] = (now, now + resend_interval, 1)
+                    self.metrics.requests += 1
+                    packets.append(self.construct_read_packet(batch[0], batch[2], batch[1]))
+                if packets and not self.send(b''.join(packets)):
+                    logging.error("Sending packet failed!")
+                packet = self.next_response_frame(start_time)
+                while len(packet) > 0:
+                    batch = self.response_batch(packet, in_flight)
+                    if batch is not None:
+                        # responses queue up behind each other, so they are no samples of the round trip time
+                        policy.record_response(in_flight.pop(batch)[2], None)
+                        ok = self.check_packet(packet)
+                        for idx in waiting[batch]:
+                            results[idx] = (ok, bytes(packet[5:-2]))
+                    elif self.reader is None and self.is_broadcast(packet):
+                        self.keep_frame(self.pending_broadcasts, bytes(packet), self.broadcast_consumers > 0)
+                    packet = self.next_response_frame(start_time)
+                if in_flight and self.reader is None:
+                    # wait for more data until the next request is due to be sent again or to fail
+                    next_due_time = min(first_sent_time + retry_time if attempts >= policy.max_attempts else
+                                        min(first_sent_time + retry_time, resend_time)
+                                        for first_sent_time, resend_time, attempts in in_flight.values())
+                    self.read_port(self.buffer_size, max(0.0, next_due_time - monotonic()))
+        return results
+
+    @staticmethod
+    def response_batch(packet: memoryview, in_flight: Dict[Tuple[int, int, bool], Any]) \
+            -> Optional[Tuple[int, int, bool]]:
+        # requested (start address, count, hidden) the packet responds to, failed responses carry no data
+        reg_addr, hidden = packet[4], bool((packet[3] >> 1) & 0x01)
+        if packet[3] & 0x01:
+            return next((batch for batch in in_flight if batch[0] == reg_addr and batch[2] == hidden), None)
+        batch = (reg_addr, (len(packet) - 7) // 4, hidden)
+        return batch if len(packet) > 7 and batch in in_flight else None
+
+    def read_registers(self, start_addr: int, count: int, hidden: bool = False) -> Tuple[bool, bytes]:
+        # `count` consecutive registers in batch packets of at most `max_batch_length` registers, 4 bytes each
+        batches = [(reg_addr, min(self.max_batch_length, start_addr + count - reg_addr), hidden)
+                   for reg_addr in range(start_addr, start_addr + count, self.max_batch_length)]
+        results = self.read_batches_pipelined(batches)
+        if not all(ok for ok, _ in results):
+            return False, bytes()
+        payload = b''.join(payload for _, payload in results)
+        self.register_cache.store(start_addr, payload, hidden)
+        return True, payload
+
+    def snapshot(self, group: str) -> Any:
+        # registers of a broadcast (e.g. `euler`, see `snapshot_groups`) read in a batch and decoded into its packet
+        # dataclass, for polling when broadcasts are disabled, `None` if reading fails
+        reg_name, packet_type = self.snapshot_groups[group]
+        start_addr = self.svd_parser.find_register_by(name=reg_name).address
+        ok, payload = self.read_registers(start_addr, payload_registers(packet_type))
+        if not ok:
+            logging.error(f"Reading registers of {group} failed!")
+            return None
+        return decode_payload(packet_type, payload)
+
+    def write_registers(self, start_addr: int, reg_values: List[Any], hidden: bool = False) -> bool:
+        # consecutive registers starting at `start_addr` written in batch packets, values as for `write_register`
+        for offset in range(0, len(reg_values), self.max_batch_length):
+            reg_addr = start_addr + offset
+            payload = b''.join(self.encode_register_value(reg_addr + idx, reg_value)
+                               for idx, reg_value in enumerate(reg_values[offset:offset + self.max_batch_length]))
+            self.register_cache.written(reg_addr, len(payload) // 4, hidden)
+            packet_to_send = self.construct_batch_write_packet(reg_addr, payload, hidden)
+            logging.debug(f"packet sent: {packet_to_send}")
+            ok, sensor_reply = self.request_response(packet_to_send, reg_addr, hidden, 7, max_attempts=1)
+            if not ok or not self.check_packet(sensor_reply):
+                logging.error(f"Writing registers {reg_addr}..{reg_addr + len(payload) // 4 - 1} failed!")
+                return False
+        return True
+
+    def next_response_frame(self, sent_time: Optional[float] = None) -> memoryview:
+        # next frame which may be a register response, from the reader, from `pending_responses`, or from the buffer,
+        # frames kept aside before `sent_time` are dropped as for `take_response`
+        reader = self.reader
+        if reader is not None:
+            return memoryview(reader.next_response(sent_time))
+        pending_responses = self.pending_responses
+        while pending_responses:
+            arrival_time, packet = pending_responses.popleft()
+            if sent_time is None or arrival_time >= sent_time:
+                return memoryview(packet)
+            self.metrics.discarded_frames += 1
+        return self.find_packet()
+
+    def address_runs(self, addresses: List[int]) -> List[Tuple[int, int]]:
+        # (start address, count) of consecutive addresses, at most `max_batch_length` registers per run
+        runs = []
+        for reg_addr in sorted(set(addresses)):
+            if runs and reg_addr == sum(runs[-1]) and runs[-1][1] < self.max_batch_length:
+                runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+            else:
+                runs.append((reg_addr, 1))
+        return runs
+
+    def read_registers_payloads(self, addresses: List[int], hidden: bool = False) -> Dict[int, bytes]:
+        # payloads by address of the registers read, registers at consecutive addresses are read in batch packets,
+        # and one by one if the batch fails (e.g. the sensor rejects batches), failed registers are left out
+        payloads = {}
+        for reg_addr in set(addresses):
+            cached_payload = self.register_cache.lookup(reg_addr, hidden)
+            if cached_payload is not None:
+                payloads[reg_addr] = cached_payload
+        not_cached = [reg_addr for reg_addr in addresses if reg_addr not in payloads]
+        batches_rejected = False
+        if not self.batch_reads:
+            failed = sorted(set(not_cached))
+        else:
+            batches = [(start_addr, count, hidden) for start_addr, count in self.address_runs(not_cached)]
+            # a sensor answering batches answers within about a round trip, so a sensor rejecting them
+            # does not hold up the one by one reads until the deadline
+            batch_results = self.read_batches_pipelined(batches, retry_time=self.retry_policy.timeout(1))
+            failed = []
+            for (start_addr, count, _), (ok, payload) in zip(batches, batch_results):
+                if not ok:
+                    failed.extend(range(start_addr, start_addr + count))
+                    continue
+                for idx in range(count):
+                    payloads[start_addr + idx] = payload[4 * idx:4 * idx + 4]
+            batches_rejected = any(count > 1 for _, count, _ in batches) and not any(ok for ok, _ in batch_results)
+        results = self.read_registers_pipelined([(reg_addr, hidden) for reg_addr in failed])
+        for reg_addr, (ok, payload) in zip(failed, results):
+            if ok:
+                payloads[reg_addr] = payload
+        if batches_rejected and any(ok for ok, _ in results):
+            # the sensor answers single reads only
+            logging.warning("Batch reads are not answered, registers are read one by one from now on!")
+            self.batch_reads = False
+        for reg_addr in not_cached:
+            if reg_addr in payloads:
+                self.register_cache.store(reg_addr, payloads[reg_addr], hidden)
+        return payloads
+
+    def registers_values(self, regs: List[Any], hidden: bool = False) -> List[Dict]:
+        # registers of the SVD parser read in bulk and parsed by the register properties, as dicts
+        payloads = self.read_registers_payloads([reg.address for reg in regs], hidden)
+        regs_as_json = []
+        for reg in regs:
+            if reg.address not in payloads:
+                logging.error(f"Reading register {reg.name} failed!")
+                continue
+            register_property = getattr(type(self), reg.name.lower())
+            reg, *_ = register_property.fget(RegisterAccessRecorder(self, payloads[reg.address]))
+            regs_as_json.append(reg.as_dict())
+        return regs_as_json
+
+    def apply_config(self, desired: Dict[str, Any], commit: bool = True) -> bool:
+        """
+        Bring the sensor to the `desired` configuration: register property names (e.g. `creg_com_rates1`) mapped to
+        values as assigned to the properties. Current values are read in bulk, only the registers which differ are
+        written (in batch packets), written registers are verified by reading back, and with `commit` the
+        configuration is stored to flash by a single `flash_commit` (skipped when no register differs, so flash
+        is not worn by applying the same configuration again). False if a register is not written as desired,
+        then nothing is committed.
+        """
+        requested = {}
+        for name, value in desired.items():
+            access = RegisterAccessRecorder(self)
+            getattr(type(self), name.lower()).fset(access, value)
+            payload = self.encode_register_value(access.reg_addr, access.reg_value)
+            requested.setdefault(access.hidden, {})[access.reg_addr] = (name, payload)
+        written = []
+        for hidden, registers in requested.items():
+            current = self.read_registers_payloads(list(registers), hidden)
+            changed = [reg_addr for reg_addr, (_, payload) in registers.items() if current.get(reg_addr) != payload]
+            for start_addr, count in self.address_runs(changed):
+                payloads = [registers[reg_addr][1] for reg_addr in range(start_addr, start_addr + count)]
+                self.write_registers(start_addr, payloads, hidden)
+            read_back = self.read_registers_payloads(changed, hidden)
+            for reg_addr in changed:
+                name, payload = registers[reg_addr]
+                if read_back.get(reg_addr) != payload:
+                    logging.error(f"Register {name} is {read_back.get(reg_addr)} after writing {payload}!")
+                    return False
+                written.append(name)
+        logging.info(f"Configuration applied, written registers: {written}")
+        if not commit or not written:
+            return True
+        access = RegisterAccessRecorder(self)
+        type(self).flash_commit.fset(access, 1)
+        return bool(self.write_register(access.reg_addr, access.reg_value))
+
+    def next_broadcast_frame(self) -> memoryview:
+        # next broadcast frame, kept aside by `find_response` or from the buffer, empty when more data is needed,
+        # frames which are not broadcasts (e.g. register responses) are kept aside for `find_response`
+        if self.pending_broadcasts:
+            return memoryview(self.pending_broadcasts.popleft())
+        while True:
+            packet = self.find_packet()
+            if len(packet) == 0 or self.is_broadcast(packet):
+                return packet
+            logging.debug(f"Packet with addr {packet[4]} of {len(packet)} bytes is kept as response")
+            self.keep_frame(self.pending_responses, (monotonic(), bytes(packet)), self.waiting_requests > 0)
+
+    def recv_broadcast_packet(self, packet_target_addr: int, expected_packet_length: int,
+                              decode_callback: Callable, num_packets: int = -1, flush_buffer_on_start: bool = False):
+        if self.reader is not None:
+            # the reader owns the port and the buffer, a subscription only receives packets from now on
+            yield from self.reader.packets(self.broadcast_packet_type(decode_callback), num_packets, self.timeout)
+            return
+        with self.receiving_broadcasts():
+            received_packets = 0
+            if flush_buffer_on_start:
+                self.flush_input()
+            while num_packets == -1 or received_packets < num_packets:
+                packet = self.next_broadcast_frame()
+                if len(packet) == 0:
+                    if not self.recv_more():
+                        return
+                    continue
+                if len(packet) > 7:
+                    recv_packet_addr = packet[4]
+                    if recv_packet_addr == packet_target_addr:
+                        packet_correct_length = len(packet) == expected_packet_length
+                        if not packet_correct_length:
+                            logging.error(f"Invalid packet length for addr: {packet_target_addr}, "
+                                          f"expected: {expected_packet_length}, got: {len(packet)}, "
+                                          f"packet: {bytes(packet)}")
+                        # checksums are verified by `find_packet`
+                        packet_type_check_ok = self.check_packet(packet)
+                        if not packet_type_check_ok:
+                            logging.error(f"Checking packet type failed for broadcast with addr: {packet_target_addr}!")
+                        if packet_correct_length and packet_type_check_ok:
+                            yield decode_callback(packet)
+                            received_packets += 1
+
+    def dispatch_broadcast(self, packet: memoryview, broadcast_decoders: Dict[Tuple[int, int], Callable]) -> Any:
+        # decoded packet, or `None` for packets without decoder or failing the packet type check
+        decode_callback = broadcast_decoders.get((packet[4], len(packet)))
+        if decode_callback is None:
+            logging.error(f"[BROADCAST ERROR]: packet with addr {packet[4]} found "
+                          f"of length: {len(packet)} bytes, "
+                          f"no decoding is implemented for this!! Packet: {bytes(packet)}")
+            return None
+        if not self.check_packet(packet):
+            logging.error(f"Checking packet type failed for broadcast with addr: {packet[4]}!")
+            return None
+        return decode_callback(packet)
+
+    def recv_broadcast(self, num_packets: int = -1, flush_buffer_on_start: bool = False, lazy: bool = False):
+        # with `lazy`, packet views are yielded, which are valid only until the next packet is requested,
+        # while the reader runs packets are taken from its subscription, decoded (views would refer to the buffer
+        # the reader keeps writing to)
+        if self.reader is not None:
+            yield from self.reader.packets(None, num_packets, self.timeout)
+            return
+        with self.receiving_broadcasts():
+            received_packets = 0
+            broadcast_decoders = self.broadcast_views() if lazy else self.broadcast_decoders
+            if flush_buffer_on_start:
+                self.flush_input()
+            while num_packets == -1 or received_packets < num_packets:
+                packet = self.next_broadcast_frame()
+                if len(packet) == 0:
+                    if not self.recv_more():
+                        return
+                    continue
+                if len(packet) > 7:
+                    decoded_packet = self.dispatch_broadcast(packet, broadcast_decoders)
+                    if decoded_packet is None:
+                        continue
+                    yield decoded_packet
+                    received_packets += 1
+
+    def recv_broadcast_batch(self, packet_type: type, num_packets: int, flush_buffer_on_start: bool = False):
+        # numpy is an optional dependency, only needed for batch decoding
+        from rsl_comm_py.rsl_numpy import decode_frames
+        if self.reader is not None:
+            raise RslException("Batch decoding needs the frames of the port, stop the reader "
+                               "or subscribe to the reader instead!")
+        packet_keys = [key for key, decode_callback in self.broadcast_decoders.items()
+                       if self.broadcast_packet_type(decode_callback) is packet_type]
+        if len(packet_keys) == 0:
+            raise ValueError(f"No broadcast decoder is registered for {packet_type.__name__}!")
+        packet_addr, packet_length = packet_keys[0]
+        frames = bytearray(num_packets * packet_length)
+        received_packets = 0
+        if flush_buffer_on_start:
+            self.flush_input()
+        while received_packets < num_packets:
+            packet = self.next_broadcast_frame()
+            if len(packet) == 0:
+                if not self.recv_more():
+                    break
+                continue
+            if packet[4] == packet_addr and len(packet) == packet_length and self.check_packet(packet):
+                frames[received_packets * packet_length:(received_packets + 1) * packet_length] = packet
+                received_packets += 1
+        return decode_frames(memoryview(frames)[:received_packets * packet_length], packet_type)
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# Date: 17 October 2026
+# Version: v0.1
+# License: MIT
+
+import heapq
+import struct
+import threading
+
+from time import monotonic
+from typing import Callable, Dict, List, Optional
+
+from rsl_comm_py.rsl_serial import byte_sum
+from rsl_comm_py.rsl_xml_svd.rsl_svd_parser import RslSvdParser
+from rsl_comm_py.shearwater_registers import ShearWaterRegisters
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.um7_serial import UM7Serial
+from rsl_comm_py.um8_serial import UM8Serial
+
+
+# model -> (SVD file, serial driver with the broadcasts of the model, packet type has the batch bit)
+SIMULATED_MODELS = {
+    'um7': ('um7.svd', UM7Serial, True),
+    'um8': ('um8.svd', UM8Serial, True),
+    'shearwater': ('shearwater.svd', ShearWaterSerial, False),
+}
+
+# broadcast rate fields of the CREG_COM_RATES registers named differently from the broadcast decoders
+RATE_FIELD_GROUPS = {
+    'QUAT_RATE': 'quaternion',
+    'GYRO_BIAS_1_RATE': 'gyro_1_bias',
+    'GYRO_BIAS_2_RATE': 'gyro_2_bias',
+}
+
+
+class SimulatedSensor:
+    """
+    In-process sensor with the register file of the SVD of `model` (`um7`, `um8`, `shearwater`), to be passed
+    as `port` keyword to `UM7Serial`, `UM8Serial`, `ShearWaterSerial`, or as `simulator` keyword to the SPI classes
+    (e.g. `ShearWaterSpiSimulated`), so the full stack can be tested and loaded without hardware.
+    Registers keep the access of the SVD: writing read-only registers, or reading write-only registers (commands)
+    is answered with the failed bit set. Single, batch and hidden register requests are answered after
+    `response_delay` seconds, `FLASH_COMMIT` and `RESET_TO_FACTORY` store and restore the configuration registers.
+    Broadcasts are sent at the rates set in the `CREG_COM_RATES` registers, with the data registers as payload:
+    `set_register` changes them, `update(simulator, time)` is called before broadcasts are sent, and the `*_TIME`
+    registers hold the simulated time in seconds. Bytes are available as soon as they are sent,
+    the line rate of the UART is not simulated.
+    """
+
+    def __init__(self, model: str = 'shearwater', response_delay: float = 0.0,
+                 update: Optional[Callable[['SimulatedSensor', float], None]] = None,
+                 max_in_waiting: int = 4096, max_output: int = 65536):
+        svd_file, serial_class, self.has_batch_bit = SIMULATED_MODELS[model]
+        self.svd_parser = RslSvdParser(svd_file=ShearWaterRegisters.find_svd(svd_file))
+        self.port = f'simulated {model}'
+        self.baudrate = 115200
+        self.timeout = None
+        self.is_open = True
+        self.response_delay = response_delay
+        self.update = update
+        self.max_in_waiting = max_in_waiting
+        self.max_output = max_output
+        self.lock = threading.RLock()
+        # notified when a request is written, which may schedule a response for a blocked read
+        self.request_written = threading.Condition(self.lock)
+        # (address, hidden) -> register of the SVD, and its payload
+        self.registers = {(reg.address, False): reg for reg in
+                          self.svd_parser.cregs + self.svd_parser.dregs + self.svd_parser.commands}
+        self.registers.update({(reg.address, True): reg for reg in self.svd_parser.hidden_regs})
+        self.values = {key: bytes(4) for key in self.registers}
+        for name in ('GET_FW_REVISION', 'GET_FW_BUILD_ID'):
+            reg = self.svd_parser.find_register_by(name=name)
+            if reg is not None:
+                self.values[(reg.address, False)] = b'SIMU'
+        self.factory_values = {(reg.address, False): bytes(4) for reg in self.svd_parser.cregs}
+        self.flash_values = dict(self.factory_values)
+        self.time_registers = {reg.address for reg in self.svd_parser.dregs if reg.name.endswith('_TIME')}
+        # broadcast group (e.g. `euler` for `decode_euler_broadcast`) -> (start address, register count)
+        self.broadcasts = {}
+        for group, (reg_name, packet_length, _) in serial_class.broadcast_groups().items():
+            start_reg = self.svd_parser.find_register_by(name=reg_name)
+            if start_reg is not None:
+                self.broadcasts[group] = (start_reg.address, (packet_length - 7) // 4)
+        # (address of the rates register, lowest bit, bit width, broadcast group) of the broadcast rate fields
+        self.rate_fields = []
+        for reg in self.svd_parser.cregs:
+            if not reg.name.startswith('CREG_COM_RATES'):
+                continue
+            for field in reg.fields:
+                group = RATE_FIELD_GROUPS.get(field.name, field.name[:-len('_RATE')].lower())
+                if field.name.endswith('_RATE') and group in self.broadcasts:
+                    msb, lsb = field.bit_range
+                    self.rate_fields.append((reg.address, lsb, msb - lsb + 1, group))
+        self.rate_addresses = {reg_addr for reg_addr, *_ in self.rate_fields}
+        # broadcast group -> [period, next due time]
+        self.schedule = {}
+        # (due time, sequence number, packet) of the responses not sent yet
+        self.pending = []
+        self.sequence = 0
+        self.start_time = None
+        self.received = bytearray()
+        self.output = bytearray()
+        self.position = 0
+        self.requests = 0
+        self.dropped_bytes = 0
+
+    def now(self) -> float:
+        # simulated time starts with the first access
+        if self.start_time is None:
+            self.start_time = monotonic()
+        return monotonic() - self.start_time
+
+    def set_register(self, name: str, value: bytes, hidden: bool = False):
+        # payload of 4 bytes, e.g. `struct.pack('>f', 1.0)` for a data register holding a float
+        reg = (self.svd_parser.find_hidden_register_by if hidden else self.svd_parser.find_register_by)(name=name)
+        with self.lock:
+            self.values[(reg.address, hidden)] = bytes(value)
+            if not hidden and reg.address in self.rate_addresses:
+                self.reschedule()
+
+    def get_register(self, name: str, hidden: bool = False) -> bytes:
+        reg = (self.svd_parser.find_hidden_register_by if hidden else self.svd_parser.find_register_by)(name=name)
+        return self.values[(reg.address, hidden)]
+
+    def broadcast_rates(self) -> Dict[str, float]:
+        rates = {}
+        for reg_addr, lsb, width, group in self.rate_fields:
+            value = int.from_bytes(self.values[(reg_addr, False)], byteorder='big') >> lsb & ((1 << width) - 1)
+            # 8-bit fields are rates in Hz, narrower fields (e.g. HEALTH_RATE) select 0.125 Hz times a power of two
+            rates[group] = float(value) if width >= 8 else (0.125 * 2 ** (value - 1) if value else 0.0)
+        for all_group, prefix in (('all_raw', 'raw_'), ('all_proc', 'proc_')):
+            if rates.get(all_group):
+                # the rate of all raw (processed) data overrides the rates of the single sensors
+                rates.update({group: 0.0 for group in rates if group.startswith(prefix)})
+        return {group: rate for group, rate in rates.items() if rate > 0}
+
+    def reschedule(self):
+        now = self.now()
+        schedule = {}
+        for group, rate in self.broadcast_rates().items():
+            period = 1.0 / rate
+            previous = self.schedule.get(group)
+            schedule[group] = previous if previous is not None and previous[0] == period else [period, now + period]
+        self.schedule = schedule
+
+    def packet(self, address: int, payload: bytes = bytes(), hidden: bool = False, failed: bool = False,
+               batch: bool = False) -> bytes:
+        count = len(payload) // 4 if batch else 0
+        packet_type = bool(payload) << 7 | (self.has_batch_bit and batch) << 6 | count << 2 | hidden << 1 | failed
+        partial_packet = b'snp' + bytes([packet_type, address]) + payload
+        return partial_packet + int.to_bytes(byte_sum(partial_packet), length=2, byteorder='big')
+
+    def block(self, start_addr: int, count: int, hidden: bool = False, fill: bool = False) -> Optional[bytes]:
+        # payload of consecutive registers, `None` if any of them can not be read, or zeros for them with `fill`
+        payload = bytearray()
+        for reg_addr in range(start_addr, start_addr + count):
+            reg = self.registers.get((reg_addr, hidden))
+            if reg is None or reg.access == 'write-only':
+                if not fill:
+                    return None
+                payload += bytes(4)
+            else:
+                payload += self.values[(reg_addr, hidden)]
+        return bytes(payload)
+
+    def write_block(self, start_addr: int, payload: bytes, hidden: bool = False) -> bool:
+        keys = [(start_addr + idx, hidden) for idx in range(len(payload) // 4)]
+        if any(key not in self.registers or self.registers[key].access == 'read-only' for key in keys):
+            return False
+        for idx, key in enumerate(keys):
+            self.values[key] = payload[4 * idx:4 * idx + 4]
+            name = self.registers[key].name
+            if name == 'FLASH_COMMIT':
+                self.flash_values = {key: self.values[key] for key in self.factory_values}
+            elif name == 'RESET_TO_FACTORY':
+                self.values.update(self.factory_values)
+                self.reschedule()
+        if not hidden and self.rate_addresses.intersection(reg_addr for reg_addr, _ in keys):
+            self.reschedule()
+        return True
+
+    def stamp(self, now: float):
+        # `*_TIME` data registers hold the time of the sample
+        for reg_addr in self.time_registers:
+            self.values[(reg_addr, False)] = struct.pack('>f', now)
+
+    def respond(self, packet_type: int, address: int, payload: bytes):
+        has_data = bool(packet_type >> 7 & 0x01)
+        hidden = bool(packet_type >> 1 & 0x01)
+        count = packet_type >> 2 & (0x0F if self.has_batch_bit else 0x1F)
+        batch = bool(packet_type >> 6 & 0x01) if self.has_batch_bit else count > 0
+        self.requests += 1
+        if has_data:
+            response = self.packet(address, hidden=hidden, failed=not self.write_block(address, payload, hidden))
+        else:
+            self.stamp(self.now())
+            payload = self.block(address, count if batch else 1, hidden)
+            if payload is None:
+                response = self.packet(address, hidden=hidden, failed=True)
+            else:
+                response = self.packet(address, payload, hidden=hidden, batch=batch)
+        heapq.heappush(self.pending, (self.now() + self.response_delay, self.sequence, response))
+        self.sequence += 1
+
+    def receive(self):
+        # answer the complete requests received so far
+        received = self.received
+        while True:
+            start_idx = received.find(b'snp')
+            if start_idx == -1:
+                del received[:max(0, len(received) - 2)]
+                return
+            del received[:start_idx]
+            if len(received) < 5:
+                return
+            packet_type = received[3]
+            count = packet_type >> 2 & (0x0F if self.has_batch_bit else 0x1F)
+            batch = bool(packet_type >> 6 & 0x01) if self.has_batch_bit else count > 0
+            has_data = bool(packet_type >> 7 & 0x01)
+            packet_length = 7 + 4 * (count if batch else 1) if has_data else 7
+            if len(received) < packet_length:
+                return
+            packet = bytes(received[:packet_length])
+            if byte_sum(packet[:-2]) != int.from_bytes(packet[-2:], byteorder='big'):
+                # not a request, re-synchronize after this preamble
+                del received[:1]
+                continue
+            del received[:packet_length]
+            self.respond(packet_type, packet[4], packet[5:-2])
+
+    def advance(self, now: float):
+        # move broadcasts and responses due by `now` to the output, in the order of their due times
+        if self.update is not None and any(due <= now for _, due in self.schedule.values()):
+            self.update(self, now)
+        frames = []
+        for group, entry in self.schedule.items():
+            period, due = entry
+            start_addr, count = self.broadcasts[group]
+            while due <= now:
+                frames.append((due, group, start_addr, count))
+                due += period
+            entry[1] = due
+        frames.sort()
+        for due, group, start_addr, count in frames:
+            while self.pending and self.pending[0][0] <= due:
+                self.output += heapq.heappop(self.pending)[2]
+            packet_length = 7 + 4 * count
+            if len(self.output) - self.position + packet_length > self.max_output:
+                # output is not read fast enough, as the UART transmit buffer of the sensor overflows
+                self.dropped_bytes += packet_length
+                continue
+            self.stamp(due)
+            self.output += self.packet(start_addr, self.block(start_addr, count, fill=True), batch=count > 1)
+        while self.pending and self.pending[0][0] <= now:
+            self.output += heapq.heappop(self.pending)[2]
+
+    def next_event_time(self) -> float:
+        due_times = [due for _, due in self.schedule.values()]
+        if self.pending:
+            due_times.append(self.pending[0][0])
+        return min(due_times) if due_times else float('inf')
+
+    @property
+    def in_waiting(self) -> int:
+        with self.lock:
+            self.advance(self.now())
+            return min(len(self.output) - self.position, self.max_in_waiting)
+
+    def readinto(self, buffer) -> int:
+        # as a serial port, wait for the next bytes at most `timeout` seconds (`None` waits forever),
+        # until a broadcast or response is due, or a request is written
+        with self.lock:
+            now = self.now()
+            self.advance(now)
+            deadline = None if self.timeout is None else now + self.timeout
+            while self.position == len(self.output):
+                wait_time = self.next_event_time() - now
+                if deadline is not None:
+                    wait_time = min(wait_time, deadline - now)
+                if wait_time <= 0:
+                    break
+                self.request_written.wait(None if wait_time == float('inf') else wait_time)
+                now = self.now()
+                self.advance(now)
+            num_bytes = min(len(buffer), len(self.output) - self.position)
+            buffer[:num_bytes] = self.output[self.position:self.position + num_bytes]
+            self.position += num_bytes
+            if self.position > self.max_output:
+                del self.output[:self.position]
+                self.position = 0
+            return num_bytes
+
+    def read(self, size: int = 1) -> bytes:
+        buffer = bytearray(size)
+        num_bytes = self.readinto(buffer)
+        return bytes(buffer[:num_bytes])
+
+    def write(self, data: bytes) -> int:
+        with self.lock:
+            self.received += data
+            self.receive()
+            self.request_written.notify_all()
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        with self.lock:
+            self.advance(self.now())
+            del self.output[:]
+            self.position = 0
+
+    def open(self):
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+    def xfer(self, msg: List[int]) -> List[int]:
+        # SPI transaction: read (0x00) or write (0x01) command, start address, 4 bytes per register
+        with self.lock:
+            now = self.now()
+            if self.update is not None:
+                self.update(self, now)
+            self.stamp(now)
+            self.requests += 1
+            reg_addr, count = msg[1], (len(msg) - 2) // 4
+            if msg[0] == 0x01:
+                self.write_block(reg_addr, bytes(msg[2:2 + 4 * count]))
+                return list(msg[:2]) + [0x00] * (len(msg) - 2)
+            return list(msg[:2]) + list(self.block(reg_addr, count, fill=True))
+
+
+if __name__ == '__main__':
+    pass
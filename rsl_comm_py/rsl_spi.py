@@ -8,60 +8,211 @@ import logging
 import os.path
 import struct
 
+from contextlib import contextmanager
 from time import sleep
-from typing import List, Union, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Union, Tuple
 
+from rsl_comm_py.rsl_metrics import RslMetrics
+from rsl_comm_py.rsl_packet_view import decode_payload, payload_registers
 from rsl_comm_py.um7_serial import RslException
 
 
 class SpiCommunication:
+    # snapshot group name -> (first register name, broadcast packet type of the register block), sensor specific
+    snapshot_groups: Dict[str, Tuple[str, type]] = {}
+    # most registers read in one transfer of the adapter, `None` for no limit
+    max_burst_registers: Optional[int] = None
+    # registers read ahead in one transfer when reading within `batch`
+    read_ahead_registers: int = 16
+
     def __init__(self, *args, **kwargs):
         super().__init__(**kwargs)
+        # read commands by number of registers, allocated once and rewritten in place for each read
+        self.read_messages = {}
+        self.clock_speed = None
+        self.metrics = kwargs.get('metrics') if kwargs.get('metrics') else RslMetrics()
+        self.batch_payloads = None
+        self.readable_addresses = None
 
     def connect(self, *args, **kwargs):
         pass
 
     def xfer(self, msg):
+        # full duplex transfer, returns the received bytes, `msg` is reused and should not be modified
         raise NotImplemented("This method should be implemented in child classes!")
 
+    def write(self, msg: bytes):
+        # transfer without using the received bytes
+        self.xfer(list(msg))
+
+    def set_clock_speed(self, clock_speed: int):
+        raise NotImplementedError("This method should be implemented in child classes!")
+
+    def applied_clock_speed(self, clock_speed: int) -> int:
+        # clock (Hz) the adapter runs at when `clock_speed` is set, for adapters with a coarse clock divider
+        return clock_speed
+
+    @property
+    def round_trips(self) -> int:
+        # transfers to the adapter
+        return self.metrics.transfers
+
     def spi_xfer(self, msg):
         # self.ssn_pin.state = False
         # sleep(0.05)
+        metrics = self.metrics
+        metrics.transfers += 1
+        metrics.bytes_written += len(msg)
         response = self.xfer(msg)
-        logging.info(f'msg: {msg}\t\tresponse: {response}')
+        metrics.bytes_read += len(response)
+        metrics.read_size.record(len(response))
+        logging.debug(f'msg: {msg}\t\tresponse: {response}')
         # sleep(0.01)
         # self.ssn_pin.state = True
         return response
 
+    def read_message(self, reg_addr: int, num_registers: int = 1) -> List[int]:
+        msg = self.read_messages.get(num_registers)
+        if msg is None:
+            msg = self.read_messages[num_registers] = [0x00, reg_addr] + [0x00] * 4 * num_registers
+            return msg
+        # the whole command is written again, in case a port wrote the received bytes into it
+        msg[0], msg[1] = 0x00, reg_addr
+        msg[2:] = bytes(4 * num_registers)
+        return msg
+
     def read_register(self, reg_addr: int, **kw) -> Tuple[bool, bytes]:
-        msg = [0x00, reg_addr] + [0x00] * 4
-        response = self.spi_xfer(msg)
+        if self.batch_payloads is not None:
+            if reg_addr not in self.batch_payloads:
+                self.read_ahead(reg_addr)
+            payload = self.batch_payloads.get(reg_addr)
+            if payload is not None:
+                return True, payload
+        response = self.spi_xfer(self.read_message(reg_addr))
         return True, bytes(response[2:])
 
     def write_register(self, reg_addr: int, reg_value: Union[int, bytes, float], **kw):
         if type(reg_value) == float:
             reg_value = struct.pack('>f', reg_value)
-        elif type(reg_value) == bytes:
-            reg_value = list(reg_value)
         elif type(reg_value) == int:
             reg_value = int.to_bytes(reg_value, length=4, byteorder='big', signed=False)
-        msg = [0x01, reg_addr] + list(reg_value)
-        self.spi_xfer(msg)
+        if self.batch_payloads is not None:
+            if reg_addr in self.batch_payloads:
+                del self.batch_payloads[reg_addr]
+            else:
+                # commands may change any register
+                self.batch_payloads.clear()
+        msg = bytes([0x01, reg_addr]) + bytes(reg_value)
+        logging.debug(f'msg: {msg}')
+        self.metrics.transfers += 1
+        self.metrics.bytes_written += len(msg)
+        self.write(msg)
         return True
 
     def read_consecutive_registers(self, reg_addr: int, num_registers: int):
-        msg = [0x00, reg_addr] + [0x00] * 4 * num_registers
-        response = self.spi_xfer(msg)
-        return True, bytes(response[2:])
+        # split in transfers of at most `max_burst_registers`, registers of different transfers
+        # may come from different measurements
+        max_registers = self.max_burst_registers or num_registers
+        if num_registers <= max_registers:
+            response = self.spi_xfer(self.read_message(reg_addr, num_registers))
+            return True, bytes(response[2:])
+        payload = bytearray()
+        for offset in range(0, num_registers, max_registers):
+            count = min(max_registers, num_registers - offset)
+            payload += bytes(self.spi_xfer(self.read_message(reg_addr + offset, count))[2:])
+        return True, bytes(payload)
+
+    def read_registers(self, start_addr: int, count: int, hidden: bool = False) -> Tuple[bool, bytes]:
+        # as `read_registers` of the UART drivers, registers are read in one transaction
+        return self.read_consecutive_registers(start_addr, count)
+
+    def snapshot(self, group: str) -> Any:
+        """
+        Read a block of data registers (e.g. `all_raw`, `all_proc`, `euler`, `quaternion`, see `snapshot_groups`)
+        in one SPI transaction, so all values come from the same measurement, and decode it into the packet
+        dataclass of the broadcast with the same registers, as received over UART (e.g. `UM7AllRawPacket`).
+        """
+        reg_name, packet_type = self.snapshot_groups[group]
+        start_addr = self.svd_parser.find_register_by(name=reg_name).address
+        _, payload = self.read_consecutive_registers(start_addr, payload_registers(packet_type))
+        self.metrics.packet_received(group)
+        return decode_payload(packet_type, payload)
+
+    def read_ahead(self, reg_addr: int) -> int:
+        # reads the configuration or data registers following `reg_addr` in one transfer into the batch,
+        # commands and unknown addresses are not read ahead, returns the number of registers read
+        if self.readable_addresses is None:
+            self.readable_addresses = {reg.address for reg in self.svd_parser.cregs + self.svd_parser.dregs}
+        max_registers = min(self.read_ahead_registers, self.max_burst_registers or self.read_ahead_registers)
+        num_registers = 0
+        while num_registers < max_registers and reg_addr + num_registers in self.readable_addresses:
+            num_registers += 1
+        if num_registers == 0:
+            return 0
+        _, payload = self.read_consecutive_registers(reg_addr, num_registers)
+        for idx in range(num_registers):
+            self.batch_payloads[reg_addr + idx] = payload[4 * idx:4 * idx + 4]
+        return num_registers
+
+    @contextmanager
+    def batch(self, reg_addrs: Iterable[int] = ()):
+        """
+        Register reads within the context, including the register properties (e.g. `sensor.creg_com_rates1`),
+        are served from blocks of consecutive registers read ahead in one transfer each, so reading many registers
+        takes few round trips to the adapter (see `round_trips`). Registers in `reg_addrs` are read when entering,
+        in as few transfers as possible. Values are read once per context, written registers are read again.
+        """
+        if self.batch_payloads is not None:
+            yield self
+            return
+        self.batch_payloads = {}
+        try:
+            for reg_addr in sorted(set(reg_addrs)):
+                if reg_addr not in self.batch_payloads:
+                    self.read_ahead(reg_addr)
+            yield self
+        finally:
+            self.batch_payloads = None
+
+    def calibrate_clock(self, clock_speeds: Iterable[int] = (1_000_000, 2_000_000, 4_000_000, 8_000_000),
+                        repeats: int = 10) -> int:
+        """
+        Find the highest SPI clock (Hz) of `clock_speeds` at which the configuration registers read back
+        the same as at the current clock, `repeats` times in a row. Clocks are tried as the adapter applies them
+        (`applied_clock_speed`), faster clocks in ascending order until the first one failing verification,
+        the clock is set to the highest verified one and returned.
+        """
+        cregs = self.svd_parser.cregs
+        start_addr = min(reg.address for reg in cregs)
+        num_registers = max(reg.address for reg in cregs) - start_addr + 1
+        _, reference = self.read_consecutive_registers(start_addr, num_registers)
+        if self.read_consecutive_registers(start_addr, num_registers)[1] != reference:
+            raise RslException(f'Reading registers is not reliable at the current clock of {self.clock_speed} Hz!')
+        verified_speed = self.clock_speed
+        for clock_speed in sorted({self.applied_clock_speed(clock_speed) for clock_speed in clock_speeds}):
+            if verified_speed is not None and clock_speed <= verified_speed:
+                continue
+            self.set_clock_speed(clock_speed)
+            if any(self.read_consecutive_registers(start_addr, num_registers)[1] != reference
+                   for _ in range(repeats)):
+                logging.info(f'Reading registers failed verification at {clock_speed} Hz')
+                break
+            verified_speed = clock_speed
+        if verified_speed is None:
+            raise RslException(f'Reading registers failed verification at {self.clock_speed} Hz, '
+                               f'and the clock before calibrating is not known!')
+        self.set_clock_speed(verified_speed)
+        return self.clock_speed
 
 
 class RslSpiLinuxPort(SpiCommunication):
     def __init__(self, *args, **kwargs):
         import spidev
-        super().__init__(args, kwargs)
+        super().__init__(**kwargs)
         self.bus = kwargs.get('bus') if kwargs.get('bus') is not None else 0
         self.device = kwargs.get('device') if kwargs.get('device') is not None else 0
         self.spi_device_path = f'/dev/spidev{self.bus}.{self.device}'
+        self.max_speed_hz = kwargs.get('max_speed_hz') if kwargs.get('max_speed_hz') is not None else 500000
         if not os.path.exists(self.spi_device_path):
             raise RslException(f'SPI device not found: {self.spi_device_path}')
         self.spi = spidev.SpiDev()
@@ -69,15 +220,25 @@ class RslSpiLinuxPort(SpiCommunication):
 
     def connect(self, *args, **kwargs):
         self.spi.open(self.bus, self.device)
-        self.spi.max_speed_hz = 500000
+        self.set_clock_speed(self.max_speed_hz)
+
+    def set_clock_speed(self, clock_speed: int):
+        self.spi.max_speed_hz = self.clock_speed = clock_speed
 
     def xfer(self, bytes_to_send: List[int]) -> List[int]:
-        tx_bytes = bytes_to_send[:]
-        self.spi.xfer(tx_bytes)
-        return tx_bytes
+        # `xfer2` keeps chip select asserted for the transfer, it writes the received bytes into the list it is given
+        # and returns that list, so it is given a copy, the read commands are reused
+        return self.spi.xfer2(list(bytes_to_send))
+
+    def write(self, msg: bytes):
+        self.spi.writebytes2(msg)
 
 
 class RslSpiUsbIss(SpiCommunication):
+    # the adapter transfers at most 62 bytes per SPI command: read command, address, and 15 registers
+    max_burst_registers = 15
+    read_ahead_registers = 15
+
     def __init__(self, **kwargs):
         from usb_iss import UsbIss
         super().__init__(**kwargs)
@@ -92,12 +253,45 @@ class RslSpiUsbIss(SpiCommunication):
 
     def connect(self, *args, **kwargs):
         self.iss.open(self.port)
-        self.iss.setup_spi(clock_khz=200)
+        self.set_clock_speed(200_000)
+
+    def applied_clock_speed(self, clock_speed: int) -> int:
+        # the adapter divides its 6 MHz clock by (divisor + 1), e.g. both 4 MHz and 8 MHz run at 6 MHz,
+        # the divisor is a byte, so clocks below 23.4 kHz (also those below 1 kHz) run at 23.4 kHz
+        divisor = min(max(6000 // max(clock_speed // 1000, 1) - 1, 0), 0xFF)
+        return 6_000_000 // (divisor + 1)
+
+    def set_clock_speed(self, clock_speed: int):
+        # given in kHz, at least 1 kHz, the adapter library divides by it
+        self.iss.setup_spi(clock_khz=max(clock_speed // 1000, 1))
+        self.clock_speed = self.applied_clock_speed(clock_speed)
 
     def xfer(self, bytes_to_send: List[int]) -> List[int]:
         recv_bytes = self.iss.spi.transfer(bytes_to_send)
         return recv_bytes
 
 
+class RslSpiSimulated(SpiCommunication):
+    # model of the `SimulatedSensor` created when no `simulator` keyword is given, set by the sensor classes
+    simulated_model = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.simulator = kwargs.get('simulator')
+        if self.simulator is None:
+            from rsl_comm_py.rsl_simulator import SimulatedSensor
+            self.simulator = SimulatedSensor(self.simulated_model)
+        self.connect()
+
+    def connect(self, *args, **kwargs):
+        self.set_clock_speed(500000)
+
+    def set_clock_speed(self, clock_speed: int):
+        self.clock_speed = clock_speed
+
+    def xfer(self, bytes_to_send: List[int]) -> List[int]:
+        return self.simulator.xfer(bytes_to_send)
+
+
 if __name__ == '__main__':
     pass
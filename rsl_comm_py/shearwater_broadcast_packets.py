@@ -5,11 +5,17 @@
 # Modified: 26 September 2020
 
 
+import struct
+
 from dataclasses import dataclass
 
 
 @dataclass
 class ShearWaterAllRawPacket:
+    __slots__ = ('gyro_1_raw_x', 'gyro_1_raw_y', 'gyro_1_raw_z', 'gyro_1_raw_time', 'gyro_2_raw_x', 'gyro_2_raw_y',
+                 'gyro_2_raw_z', 'gyro_2_raw_time', 'accel_1_raw_x', 'accel_1_raw_y', 'accel_1_raw_z',
+                 'accel_1_raw_time', 'mag_1_raw_x', 'mag_1_raw_y', 'mag_1_raw_z', 'mag_1_raw_time', 'mag_2_raw_x',
+                 'mag_2_raw_y', 'mag_2_raw_z', 'mag_2_raw_time', 'temperature', 'temperature_time')
     gyro_1_raw_x: int
     gyro_1_raw_y: int
     gyro_1_raw_z: int
@@ -74,6 +80,10 @@ class ShearWaterAllRawPacket:
 
 @dataclass
 class ShearWaterAllProcPacket:
+    __slots__ = ('gyro_1_proc_x', 'gyro_1_proc_y', 'gyro_1_proc_z', 'gyro_1_proc_time', 'gyro_2_proc_x',
+                 'gyro_2_proc_y', 'gyro_2_proc_z', 'gyro_2_proc_time', 'accel_1_proc_x', 'accel_1_proc_y',
+                 'accel_1_proc_z', 'accel_1_proc_time', 'mag_1_proc_x', 'mag_1_proc_y', 'mag_1_proc_z', 'mag_1_norm',
+                 'mag_1_proc_time', 'mag_2_proc_x', 'mag_2_proc_y', 'mag_2_proc_z', 'mag_2_norm', 'mag_2_proc_time')
     gyro_1_proc_x: float
     gyro_1_proc_y: float
     gyro_1_proc_z: float
@@ -137,6 +147,7 @@ class ShearWaterAllProcPacket:
 
 @dataclass
 class ShearWaterEulerPacket:
+    __slots__ = ('roll', 'pitch', 'yaw', 'roll_rate', 'pitch_rate', 'yaw_rate', 'time_stamp')
     roll: float
     pitch: float
     yaw: float
@@ -163,6 +174,7 @@ class ShearWaterEulerPacket:
 
 @dataclass
 class ShearWaterHealthPacket:
+    __slots__ = ('health',)
     health: int
 
     def __repr__(self):
@@ -181,6 +193,7 @@ class ShearWaterHealthPacket:
 
 @dataclass
 class ShearWaterRawAccel1Packet:
+    __slots__ = ('accel_1_raw_x', 'accel_1_raw_y', 'accel_1_raw_z', 'accel_1_raw_time')
     accel_1_raw_x: int
     accel_1_raw_y: int
     accel_1_raw_z: int
@@ -189,6 +202,7 @@ class ShearWaterRawAccel1Packet:
 
 @dataclass
 class ShearWaterRawGyro1Packet:
+    __slots__ = ('gyro_1_raw_x', 'gyro_1_raw_y', 'gyro_1_raw_z', 'gyro_1_raw_time')
     gyro_1_raw_x: int
     gyro_1_raw_y: int
     gyro_1_raw_z: int
@@ -197,6 +211,7 @@ class ShearWaterRawGyro1Packet:
 
 @dataclass
 class ShearWaterRawGyro2Packet:
+    __slots__ = ('gyro_2_raw_x', 'gyro_2_raw_y', 'gyro_2_raw_z', 'gyro_2_raw_time')
     gyro_2_raw_x: int
     gyro_2_raw_y: int
     gyro_2_raw_z: int
@@ -205,6 +220,7 @@ class ShearWaterRawGyro2Packet:
 
 @dataclass
 class ShearWaterRawMag1Packet:
+    __slots__ = ('mag_1_raw_x', 'mag_1_raw_y', 'mag_1_raw_z', 'mag_1_raw_time')
     mag_1_raw_x: int
     mag_1_raw_y: int
     mag_1_raw_z: int
@@ -213,6 +229,7 @@ class ShearWaterRawMag1Packet:
 
 @dataclass
 class ShearWaterRawMag2Packet:
+    __slots__ = ('mag_2_raw_x', 'mag_2_raw_y', 'mag_2_raw_z', 'mag_2_raw_time')
     mag_2_raw_x: int
     mag_2_raw_y: int
     mag_2_raw_z: int
@@ -221,12 +238,14 @@ class ShearWaterRawMag2Packet:
 
 @dataclass
 class ShearWaterTemperaturePacket:
+    __slots__ = ('temperature', 'temperature_time')
     temperature: float
     temperature_time: float
 
 
 @dataclass
 class ShearWaterProcAccel1Packet:
+    __slots__ = ('accel_1_proc_x', 'accel_1_proc_y', 'accel_1_proc_z', 'accel_1_proc_time')
     accel_1_proc_x: float
     accel_1_proc_y: float
     accel_1_proc_z: float
@@ -235,6 +254,7 @@ class ShearWaterProcAccel1Packet:
 
 @dataclass
 class ShearWaterProcGyro1Packet:
+    __slots__ = ('gyro_1_proc_x', 'gyro_1_proc_y', 'gyro_1_proc_z', 'gyro_1_proc_time')
     gyro_1_proc_x: float
     gyro_1_proc_y: float
     gyro_1_proc_z: float
@@ -243,6 +263,7 @@ class ShearWaterProcGyro1Packet:
 
 @dataclass
 class ShearWaterProcGyro2Packet:
+    __slots__ = ('gyro_2_proc_x', 'gyro_2_proc_y', 'gyro_2_proc_z', 'gyro_2_proc_time')
     gyro_2_proc_x: float
     gyro_2_proc_y: float
     gyro_2_proc_z: float
@@ -251,6 +272,7 @@ class ShearWaterProcGyro2Packet:
 
 @dataclass
 class ShearWaterProcMag1Packet:
+    __slots__ = ('mag_1_proc_x', 'mag_1_proc_y', 'mag_1_proc_z', 'mag_1_proc_norm', 'mag_1_proc_time')
     mag_1_proc_x: float
     mag_1_proc_y: float
     mag_1_proc_z: float
@@ -260,6 +282,7 @@ class ShearWaterProcMag1Packet:
 
 @dataclass
 class ShearWaterProcMag2Packet:
+    __slots__ = ('mag_2_proc_x', 'mag_2_proc_y', 'mag_2_proc_z', 'mag_2_proc_norm', 'mag_2_proc_time')
     mag_2_proc_x: float
     mag_2_proc_y: float
     mag_2_proc_z: float
@@ -269,6 +292,7 @@ class ShearWaterProcMag2Packet:
 
 @dataclass
 class ShearWaterQuaternionPacket:
+    __slots__ = ('q_w', 'q_x', 'q_y', 'q_z', 'q_time')
     q_w: float
     q_x: float
     q_y: float
@@ -291,6 +315,8 @@ class ShearWaterQuaternionPacket:
 
 @dataclass
 class ShearWaterEulerPosePacket:
+    __slots__ = ('roll', 'pitch', 'yaw', 'roll_rate', 'pitch_rate', 'yaw_rate', 'euler_time', 'position_north',
+                 'position_east', 'position_up', 'position_time')
     roll: float
     pitch: float
     yaw: float
@@ -306,6 +332,7 @@ class ShearWaterEulerPosePacket:
 
 @dataclass
 class ShearWaterPosePacket:
+    __slots__ = ('position_north', 'position_east', 'position_up', 'position_time')
     position_north: float
     position_east: float
     position_up: float
@@ -314,6 +341,7 @@ class ShearWaterPosePacket:
 
 @dataclass
 class ShearWaterVelocityPacket:
+    __slots__ = ('velocity_north', 'velocity_east', 'velocity_up', 'velocity_time')
     velocity_north: float
     velocity_east: float
     velocity_up: float
@@ -322,6 +350,7 @@ class ShearWaterVelocityPacket:
 
 @dataclass
 class ShearWaterGyro1BiasPacket:
+    __slots__ = ('gyro_1_bias_x', 'gyro_1_bias_y', 'gyro_1_bias_z')
     gyro_1_bias_x: float
     gyro_1_bias_y: float
     gyro_1_bias_z: float
@@ -329,6 +358,47 @@ class ShearWaterGyro1BiasPacket:
 
 @dataclass
 class ShearWaterGyro2BiasPacket:
+    __slots__ = ('gyro_2_bias_x', 'gyro_2_bias_y', 'gyro_2_bias_z')
     gyro_2_bias_x: float
     gyro_2_bias_y: float
     gyro_2_bias_z: float
+
+
+# payload layouts of the broadcast packets, decoded with `unpack_from(packet, 5)` directly from the received packet
+SHEARWATER_ALL_RAW_STRUCT = struct.Struct('>hhh2xf hhh2xf hhh2xf iiif hhh2xf ff')
+SHEARWATER_ALL_PROC_STRUCT = struct.Struct('>ffff ffff ffff fffff fffff')
+SHEARWATER_EULER_STRUCT = struct.Struct('>hhh2x hhh2xf')
+SHEARWATER_QUATERNION_STRUCT = struct.Struct('>hhhhf')
+SHEARWATER_RAW_ACCEL_1_STRUCT = struct.Struct('>hhh2xf')
+SHEARWATER_RAW_GYRO_1_STRUCT = struct.Struct('>hhh2xf')
+SHEARWATER_RAW_GYRO_2_STRUCT = struct.Struct('>hhh2xf')
+SHEARWATER_RAW_MAG_1_STRUCT = struct.Struct('>iiif')
+SHEARWATER_RAW_MAG_2_STRUCT = struct.Struct('>hhh2xf')
+SHEARWATER_PROC_ACCEL_1_STRUCT = struct.Struct('>ffff')
+SHEARWATER_PROC_GYRO_1_STRUCT = struct.Struct('>ffff')
+SHEARWATER_PROC_GYRO_2_STRUCT = struct.Struct('>ffff')
+SHEARWATER_PROC_MAG_1_STRUCT = struct.Struct('>fffff')
+SHEARWATER_PROC_MAG_2_STRUCT = struct.Struct('>fffff')
+SHEARWATER_GYRO_1_BIAS_STRUCT = struct.Struct('>fff')
+SHEARWATER_GYRO_2_BIAS_STRUCT = struct.Struct('>fff')
+SHEARWATER_HEALTH_STRUCT = struct.Struct('>I')
+
+BROADCAST_STRUCTS = {
+    ShearWaterAllRawPacket: SHEARWATER_ALL_RAW_STRUCT,
+    ShearWaterAllProcPacket: SHEARWATER_ALL_PROC_STRUCT,
+    ShearWaterEulerPacket: SHEARWATER_EULER_STRUCT,
+    ShearWaterQuaternionPacket: SHEARWATER_QUATERNION_STRUCT,
+    ShearWaterRawAccel1Packet: SHEARWATER_RAW_ACCEL_1_STRUCT,
+    ShearWaterRawGyro1Packet: SHEARWATER_RAW_GYRO_1_STRUCT,
+    ShearWaterRawGyro2Packet: SHEARWATER_RAW_GYRO_2_STRUCT,
+    ShearWaterRawMag1Packet: SHEARWATER_RAW_MAG_1_STRUCT,
+    ShearWaterRawMag2Packet: SHEARWATER_RAW_MAG_2_STRUCT,
+    ShearWaterProcAccel1Packet: SHEARWATER_PROC_ACCEL_1_STRUCT,
+    ShearWaterProcGyro1Packet: SHEARWATER_PROC_GYRO_1_STRUCT,
+    ShearWaterProcGyro2Packet: SHEARWATER_PROC_GYRO_2_STRUCT,
+    ShearWaterProcMag1Packet: SHEARWATER_PROC_MAG_1_STRUCT,
+    ShearWaterProcMag2Packet: SHEARWATER_PROC_MAG_2_STRUCT,
+    ShearWaterGyro1BiasPacket: SHEARWATER_GYRO_1_BIAS_STRUCT,
+    ShearWaterGyro2BiasPacket: SHEARWATER_GYRO_2_BIAS_STRUCT,
+    ShearWaterHealthPacket: SHEARWATER_HEALTH_STRUCT,
+}
@@ -4,16 +4,33 @@
 # Version: v0.1
 # License: MIT
 
-from rsl_comm_py.rsl_spi import RslSpiUsbIss, RslSpiLinuxPort
+from rsl_comm_py.rsl_spi import RslSpiSimulated, RslSpiUsbIss, RslSpiLinuxPort
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
 from rsl_comm_py.shearwater_registers import ShearWaterRegisters
 
 
+# register blocks read by `snapshot`, the broadcast groups of the UART driver
+SHEARWATER_SNAPSHOT_GROUPS = ShearWaterSerial.get_snapshot_groups()
+
+
 class ShearWaterSpiLinuxPort(RslSpiLinuxPort, ShearWaterRegisters):
+    snapshot_groups = SHEARWATER_SNAPSHOT_GROUPS
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
 
 class ShearWaterSpiUsbIss(RslSpiUsbIss, ShearWaterRegisters):
+    snapshot_groups = SHEARWATER_SNAPSHOT_GROUPS
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ShearWaterSpiSimulated(RslSpiSimulated, ShearWaterRegisters):
+    snapshot_groups = SHEARWATER_SNAPSHOT_GROUPS
+    simulated_model = 'shearwater'
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
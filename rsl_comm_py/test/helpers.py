@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import random
+
+from rsl_comm_py.rsl_serial import SerialCommunication
+from rsl_comm_py.rsl_spi import SpiCommunication
+from rsl_comm_py.shearwater_registers import ShearWaterRegisters
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.shearwater_spi import SHEARWATER_SNAPSHOT_GROUPS
+from rsl_comm_py.um7_registers import UM7Registers
+from rsl_comm_py.um7_serial import UM7Serial
+from rsl_comm_py.um7_spi import UM7_SNAPSHOT_GROUPS
+
+
+def make_packet(packet_type: int, address: int, payload: bytes = bytes()) -> bytes:
+    partial_packet = b'snp' + bytes([packet_type, address]) + payload
+    return partial_packet + int.to_bytes(sum(partial_packet), length=2, byteorder='big')
+
+
+def random_payload(rng: random.Random, length: int) -> bytes:
+    # reproducible register words (pass a seeded `random.Random`), none is a NaN or infinity when read as a float
+    payload = bytearray(rng.getrandbits(8) for _ in range(length))
+    for idx in range(0, length, 4):
+        if payload[idx] & 0x7F == 0x7F:
+            payload[idx] ^= 0x01
+    return bytes(payload)
+
+
+class ShearWaterFraming(SerialCommunication):
+    # shearwater framing rules, without opening the serial port
+    get_packet_type = ShearWaterSerial.get_packet_type
+    get_packet_length = ShearWaterSerial.get_packet_length
+    check_packet = ShearWaterSerial.check_packet
+    decode_quaternion_broadcast = ShearWaterSerial.decode_quaternion_broadcast
+
+
+class UM7Framing(SerialCommunication):
+    get_packet_type = UM7Serial.get_packet_type
+    get_packet_length = UM7Serial.get_packet_length
+
+
+class SpiMemory(SpiCommunication):
+    def __init__(self, registers: bytes, **kwargs):
+        super().__init__(**kwargs)
+        self.registers = registers
+        self.transactions = 0
+
+    def xfer(self, msg):
+        # registers are clocked out one after another, starting at the address of the read command
+        self.transactions += 1
+        reg_addr = msg[1]
+        return msg[:2] + list(self.registers[4 * reg_addr:4 * reg_addr + len(msg) - 2])
+
+
+class ShearWaterSpiMemory(SpiMemory, ShearWaterRegisters):
+    snapshot_groups = SHEARWATER_SNAPSHOT_GROUPS
+
+
+class UM7SpiMemory(SpiMemory, UM7Registers):
+    snapshot_groups = UM7_SNAPSHOT_GROUPS
+
+
+if __name__ == '__main__':
+    pass
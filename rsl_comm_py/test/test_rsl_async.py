@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from rsl_comm_py.rsl_async import AsyncUM7Serial
+from rsl_comm_py.rsl_replay import ReplayPort
+from rsl_comm_py.rsl_retry import RslRetryPolicy
+from rsl_comm_py.um7_broadcast_packets import UM7QuaternionPacket
+from rsl_comm_py.um7_serial import UM7Serial
+from rsl_comm_py.test.helpers import make_packet
+
+
+@pytest.mark.comm
+def test_async_register_access_and_broadcasts():
+    um7 = AsyncUM7Serial(port=ReplayPort(data=b''))
+    quat_addr = um7.svd_parser.find_register_by(name='DREG_QUAT_AB').address
+    quat = make_packet(0xCC, quat_addr, bytes.fromhex('745d000000000000') + bytes(4))
+    # responses to reading and writing CREG_COM_RATES1, then broadcasts
+    capture = make_packet(0x80, 0x01, bytes([1, 2, 3, 4])) + make_packet(0x00, 0x01) + quat * 10
+    um7.port = ReplayPort(data=capture)
+
+    async def run():
+        rates = await um7.get_register('creg_com_rates1')
+        written = await um7.set_register('creg_com_rates1', 0x05060708)
+        packets = [packet async for packet in um7.broadcasts()]
+        return rates, written, packets
+
+    (reg, raw_accel_rate, raw_gyro_rate, raw_mag_rate), written, packets = asyncio.run(run())
+    assert reg.raw_value == 0x01020304 and (raw_accel_rate, raw_gyro_rate, raw_mag_rate) == (1, 2, 3)
+    assert written
+    assert bytes(um7.port.written).endswith(um7.construct_write_packet(0x01, 0x05060708))
+    assert len(packets) == 10 and all(type(packet) is UM7QuaternionPacket for packet in packets)
+
+
+@pytest.mark.comm
+def test_async_request_is_sent_again():
+    # the response comes after the request is sent again, as decided by `retry_policy`
+    frames = [(0, bytes()), (70_000_000, make_packet(0x80, 0x01, bytes([1, 2, 3, 4])))]
+    um7 = AsyncUM7Serial(port=ReplayPort(frames=frames, speed=1.0))
+    assert asyncio.run(um7.read_register(0x01)) == (True, bytes([1, 2, 3, 4]))
+    assert bytes(um7.port.written) == 2 * um7.construct_read_packet(0x01)
+    metrics = um7.metrics.snapshot()
+    assert (metrics['requests'], metrics['resends'], metrics['request_failures']) == (1, 1, 0)
+    assert um7.retry_policy.statistics()['retransmissions'] == 1
+
+
+@pytest.mark.comm
+def test_async_request_fails_as_blocking_request():
+    # broadcasts, but no response: both drivers send the request again and give up the same way
+    um7 = UM7Serial(port=ReplayPort(data=b''))
+    async_um7 = AsyncUM7Serial(port=ReplayPort(data=b''))
+    quat_addr = um7.svd_parser.find_register_by(name='DREG_QUAT_AB').address
+    quat = make_packet(0xCC, quat_addr, bytes.fromhex('745d000000000000') + bytes(4))
+    frames = [(0, bytes())] + [(idx * 5_000_000, quat) for idx in range(1, 20)]
+    for sensor in (um7, async_um7):
+        sensor.port = ReplayPort(frames=frames, speed=1.0)
+        sensor.retry_policy = RslRetryPolicy(initial_timeout=0.01, backoff=1.0, max_attempts=3, deadline=0.05)
+    assert um7.read_register(0x01) == asyncio.run(async_um7.read_register(0x01)) == (False, bytes())
+    for sensor in (um7, async_um7):
+        metrics = sensor.metrics.snapshot()
+        assert bytes(sensor.port.written) == 3 * sensor.construct_read_packet(0x01)
+        assert (metrics['requests'], metrics['resends'], metrics['request_failures']) == (1, 2, 1)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import pytest
+
+from rsl_comm_py.rsl_replay import ReplayPort
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.test.helpers import make_packet
+
+
+@pytest.mark.comm
+def test_broadcast_metrics():
+    health_addr = ShearWaterSerial(port=ReplayPort()).svd_parser.find_register_by(name='DREG_HEALTH').address
+    health_packet = make_packet(0x80, health_addr, bytes(4))
+    corrupted_packet = health_packet[:-1] + bytes([health_packet[-1] ^ 0xFF])
+    data = health_packet + corrupted_packet + make_packet(0x81, health_addr, bytes(4)) + health_packet
+    shearwater = ShearWaterSerial(port=ReplayPort(data))
+    assert len(list(shearwater.recv_broadcast(num_packets=2))) == 2
+    metrics = shearwater.metrics.snapshot()
+    assert metrics['bytes_read'] == len(data)
+    assert metrics['checksum_failures'] == 1
+    assert metrics['packet_check_failures'] == 1
+    assert metrics['packets']['ShearWaterHealthPacket']['count'] == 3
+    assert metrics['frames'] == 3
+
+
+@pytest.mark.comm
+def test_request_metrics():
+    # the response comes after the request is sent again, the write acknowledgement of another register is discarded
+    frames = [(0, make_packet(0x00, 0x05)), (70_000_000, make_packet(0x80, 0x01, bytes([1, 2, 3, 4])))]
+    shearwater = ShearWaterSerial(port=ReplayPort(frames=frames, speed=1.0))
+    assert shearwater.read_register(0x01) == (True, bytes([1, 2, 3, 4]))
+    metrics = shearwater.metrics.snapshot()
+    assert (metrics['requests'], metrics['resends'], metrics['request_failures']) == (1, 1, 0)
+    assert metrics['discarded_frames'] == 1
+    assert metrics['bytes_written'] == 2 * len(shearwater.construct_read_packet(0x01))
+    assert metrics['response_time']['count'] == 1
+    assert metrics['response_time']['mean'] >= 0.07
+
+
+@pytest.mark.comm
+def test_stale_response_is_dropped():
+    # a late duplicate response kept aside while receiving broadcasts does not answer a later request
+    health_addr = ShearWaterSerial(port=ReplayPort()).svd_parser.find_register_by(name='DREG_HEALTH').address
+    stale_response = make_packet(0x80, 0x01, bytes.fromhex('09090909'))
+    frames = [(0, stale_response + make_packet(0x80, health_addr, bytes(4))),
+              (20_000_000, make_packet(0x80, 0x01, bytes([1, 2, 3, 4])))]
+    port = ReplayPort(frames=frames, speed=1.0)
+    shearwater = ShearWaterSerial(port=port)
+    assert len(list(shearwater.recv_broadcast(num_packets=1))) == 1
+    assert len(shearwater.pending_responses) == 1
+    assert shearwater.read_register(0x01) == (True, bytes([1, 2, 3, 4]))
+    assert shearwater.metrics.discarded_frames == 1
+    assert port.written == shearwater.construct_read_packet(0x01)
+    shearwater.pending_responses.append((0.0, stale_response))
+    shearwater.flush_input()
+    assert len(shearwater.pending_responses) == 0
+
+
+@pytest.mark.comm
+def test_overflowed_frames(caplog):
+    shearwater = ShearWaterSerial(port=ReplayPort())
+    for _ in range(shearwater.pending_responses.maxlen + 2):
+        shearwater.keep_frame(shearwater.pending_responses, (0.0, bytes(7)))
+    assert shearwater.metrics.snapshot()['overflowed_frames'] == 2
+    # one warning until the queue has room again
+    assert len([record for record in caplog.records if record.levelname == 'WARNING']) == 1
+    # frames nobody waits for are dropped without being counted
+    for _ in range(shearwater.pending_broadcasts.maxlen + 2):
+        shearwater.keep_frame(shearwater.pending_broadcasts, bytes(7), waited_for=False)
+    assert shearwater.metrics.snapshot()['overflowed_frames'] == 2
+
+
+@pytest.mark.comm
+def test_unconsumed_broadcasts_are_not_overflows():
+    shearwater = ShearWaterSerial(port=ReplayPort())
+    health_addr = shearwater.svd_parser.find_register_by(name='DREG_HEALTH').address
+    health = make_packet(0x80, health_addr, bytes(4))
+    response = make_packet(0x80, 0x01, bytes([1, 2, 3, 4]))
+    # broadcasts met by register reads, and never received
+    shearwater.port = ReplayPort(data=(health * 300 + response) * 5)
+    for _ in range(5):
+        assert shearwater.read_register(0x01) == (True, bytes([1, 2, 3, 4]))
+    assert len(shearwater.pending_broadcasts) == shearwater.pending_broadcasts.maxlen
+    assert shearwater.metrics.snapshot()['overflowed_frames'] == 0
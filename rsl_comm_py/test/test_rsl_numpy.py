@@ -0,0 +1,46 @@
+import dataclasses
+import random
+
+import pytest
+
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.um7_serial import UM7Serial
+
+np = pytest.importorskip('numpy')
+from rsl_comm_py.rsl_numpy import decode_frames, broadcast_dtype, verify_checksums
+from rsl_comm_py.test.helpers import make_packet, random_payload
+
+
+def broadcast_decoders(sensor_class):
+    for name in dir(sensor_class):
+        if name.startswith('decode_') and name.endswith('_broadcast'):
+            decode_callback = getattr(sensor_class, name)
+            yield decode_callback.__annotations__['return'], decode_callback
+
+
+@pytest.mark.comm
+@pytest.mark.parametrize('sensor_class', [ShearWaterSerial, UM7Serial])
+def test_decode_frames_matches_decode_broadcast(sensor_class):
+    rng = random.Random(sensor_class.__name__)
+    for packet_type, decode_callback in broadcast_decoders(sensor_class):
+        payload_length = broadcast_dtype(packet_type).itemsize - 7
+        frames = [make_packet(0x80, 0x55, random_payload(rng, payload_length)) for _ in range(16)]
+        decoded = decode_frames(b''.join(frames), packet_type)
+        assert len(decoded) == len(frames)
+        for frame, row in zip(frames, decoded):
+            expected = dataclasses.astuple(decode_callback(None, frame))
+            actual = tuple(row[name] for name in decoded.dtype.names)
+            np.testing.assert_array_equal(actual, expected, err_msg=f"{packet_type.__name__} decoded differently!")
+
+
+@pytest.mark.comm
+def test_verify_checksums_reports_failing_packets():
+    health = make_packet(0x80, 0x55, b'\x00\x00\x00\x01')
+    quat = make_packet(0x8C, 0x7E, bytes.fromhex('745d0001fffe8000c2f60000'))
+    corrupted_health = health[:-1] + bytes([health[-1] ^ 0x01])
+    frames = health * 3 + corrupted_health + health
+    assert list(verify_checksums(frames, len(health))) == [3]
+    frames = health + quat + b'garbage' + corrupted_health + quat
+    packet_starts = [0, 11, 37, 48]
+    packet_lengths = [11, 19, 11, 19]
+    assert list(verify_checksums(frames, packet_lengths, packet_starts)) == [2]
@@ -0,0 +1,30 @@
+import pytest
+
+from rsl_comm_py.rsl_packet_columns import RslPacketColumns
+from rsl_comm_py.shearwater_broadcast_packets import ShearWaterEulerPacket, ShearWaterHealthPacket
+
+
+@pytest.fixture
+def euler_packets():
+    return [ShearWaterEulerPacket(roll=0.5 * idx, pitch=-1.0, yaw=90.0, roll_rate=0.0, pitch_rate=0.1,
+                                  yaw_rate=-0.1, time_stamp=0.01 * idx) for idx in range(10)]
+
+
+@pytest.mark.comm
+def test_packets_are_slotted(euler_packets):
+    assert not hasattr(euler_packets[0], '__dict__'), "Broadcast packets shall not have per-instance dict!"
+
+
+@pytest.mark.comm
+def test_packet_columns(euler_packets):
+    columns = RslPacketColumns(ShearWaterEulerPacket, euler_packets)
+    assert len(columns) == 10
+    assert list(columns.roll) == [packet.roll for packet in euler_packets]
+    assert columns[3] == euler_packets[3]
+    assert list(columns[-2:]) == euler_packets[-2:]
+    assert columns.to_csv() == ''.join(packet.to_csv() for packet in euler_packets)
+    assert repr(euler_packets[0]) in repr(columns)
+    health = RslPacketColumns(ShearWaterHealthPacket, [ShearWaterHealthPacket(health=0x1FF)])
+    assert health.health.typecode == 'q', "Integer fields shall be stored as integers!"
+    with pytest.raises(AttributeError):
+        _ = columns.q_w
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from rsl_comm_py.rsl_packet_view import BROADCAST_STRUCTS, RslPacketView, broadcast_layout, packet_view_type
+from rsl_comm_py.shearwater_broadcast_packets import ShearWaterQuaternionPacket
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.um7_serial import UM7Serial
+from rsl_comm_py.test.helpers import ShearWaterFraming, make_packet, random_payload
+
+
+@pytest.mark.comm
+@pytest.mark.parametrize('sensor_class', [ShearWaterSerial, UM7Serial])
+def test_packet_view_matches_decode_broadcast(sensor_class):
+    rng = random.Random(sensor_class.__name__)
+    for name in dir(sensor_class):
+        if not (name.startswith('decode_') and name.endswith('_broadcast')):
+            continue
+        decode_callback = getattr(sensor_class, name)
+        packet_type = decode_callback.__annotations__['return']
+        _, packet_length = broadcast_layout(packet_type)
+        packet = memoryview(b'garbage' + make_packet(0x80, 0x55, random_payload(rng, packet_length - 7)))
+        view = packet_view_type(packet_type)(packet, offset=7)
+        assert isinstance(view, RslPacketView)
+        expected = decode_callback(None, packet[7:])
+        materialized = view.materialize()
+        assert type(materialized) is packet_type
+        assert repr(materialized) == repr(expected), f"{packet_type.__name__} view decoded differently!"
+
+
+@pytest.mark.comm
+def test_recv_broadcast_lazy():
+    serial_communication = ShearWaterFraming()
+    serial_communication.register_broadcast_decoder(0x7E, 19, serial_communication.decode_quaternion_broadcast)
+    quat = make_packet(0x8C, 0x7E, bytes.fromhex('745d000000000000') + bytes(4))
+    serial_communication.buffer.write(quat)
+    view, = serial_communication.recv_broadcast(num_packets=1, lazy=True)
+    assert type(view).__name__ == 'ShearWaterQuaternionPacketView'
+    assert view.q_w == pytest.approx(1.0, abs=1e-4)
+    assert view.materialize() == ShearWaterQuaternionPacket(q_w=view.q_w, q_x=0.0, q_y=0.0, q_z=0.0, q_time=0.0)
+    assert ShearWaterQuaternionPacket in BROADCAST_STRUCTS
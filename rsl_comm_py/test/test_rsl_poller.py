@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import pytest
+
+from time import perf_counter
+
+from rsl_comm_py.rsl_poller import RslPoller
+from rsl_comm_py.shearwater_broadcast_packets import ShearWaterProcGyro1Packet
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.shearwater_spi import SHEARWATER_SNAPSHOT_GROUPS
+from rsl_comm_py.test.helpers import ShearWaterSpiMemory
+
+
+@pytest.mark.comm
+def test_poller_rates_and_coalescing():
+    registers = bytes(idx * 37 % 251 for idx in range(1024))
+    sensor = ShearWaterSpiMemory(registers)
+    poller = RslPoller(sensor, {'euler': 100.0, 'quaternion': 50.0, 'health': 10.0})
+    packets = list(poller.poll(duration=0.2))
+    statistics = poller.statistics()
+    packet_types = [type(packet) for packet in packets]
+    for group, expected_samples in [('euler', 20), ('quaternion', 10), ('health', 2)]:
+        _, packet_type = SHEARWATER_SNAPSHOT_GROUPS[group]
+        assert packet_types.count(packet_type) == statistics[group]['samples']
+        assert abs(statistics[group]['samples'] - expected_samples) <= 2, group
+        assert statistics[group]['errors'] == 0
+    _, euler_type = SHEARWATER_SNAPSHOT_GROUPS['euler']
+    assert next(packet for packet in packets if type(packet) is euler_type) == sensor.snapshot('euler')
+    # groups due at the same time are read in one transaction per register range
+    assert sensor.transactions == poller.bursts + 1
+    assert poller.bursts < len(packets)
+
+
+@pytest.mark.comm
+def test_poller_groups_are_shared_by_uart_and_spi():
+    # a single data register group (e.g. gyro) is polled over SPI as over UART
+    assert SHEARWATER_SNAPSHOT_GROUPS == ShearWaterSerial.get_snapshot_groups()
+    sensor = ShearWaterSpiMemory(bytes(idx * 37 % 251 for idx in range(1024)))
+    poller = RslPoller(sensor, {'proc_gyro_1': 500.0})
+    packet, = poller.poll(num_packets=1)
+    assert type(packet) is ShearWaterProcGyro1Packet
+
+
+@pytest.mark.comm
+def test_poller_failed_reads_are_not_samples():
+    sensor = ShearWaterSpiMemory(bytes(1024))
+    sensor.read_registers = lambda start_addr, count, hidden=False: (False, bytes())
+    poller = RslPoller(sensor, {'health': 100.0})
+    assert list(poller.poll(duration=0.05)) == []
+    statistics = poller.statistics()['health']
+    assert statistics['samples'] == 0 and statistics['errors'] >= 4
+
+
+@pytest.mark.comm
+def test_poller_duration_bounds_the_wait():
+    sensor = ShearWaterSpiMemory(bytes(1024))
+    with pytest.raises(ValueError):
+        RslPoller(sensor, {})
+    # the second read is due long after the end of the poll
+    poller = RslPoller(sensor, {'health': 0.1})
+    start = perf_counter()
+    assert len(list(poller.poll(duration=0.05))) == 1
+    assert perf_counter() - start < 1.0
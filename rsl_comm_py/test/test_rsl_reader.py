@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+from rsl_comm_py.rsl_replay import ReplayPort
+from rsl_comm_py.um7_broadcast_packets import UM7HealthPacket, UM7QuaternionPacket
+from rsl_comm_py.um7_serial import UM7Serial
+from rsl_comm_py.test.helpers import make_packet
+
+
+@pytest.mark.comm
+def test_reader_subscriptions_and_register_reads():
+    um7 = UM7Serial(port=ReplayPort(data=b''))
+    quat_addr = um7.svd_parser.find_register_by(name='DREG_QUAT_AB').address
+    euler_addr = um7.svd_parser.find_register_by(name='DREG_EULER_PHI_THETA').address
+    quat = make_packet(0xCC, quat_addr, bytes.fromhex('745d000000000000') + bytes(4))
+    euler = make_packet(0xD4, euler_addr, bytes(20))
+    # register response to a read of the first register, single register with data: 11 bytes
+    response = make_packet(0x80, 0x00, bytes.fromhex('deadbeef'))
+    # replayed at 100x the UART rate, the reader has to wait for the data
+    um7.port = ReplayPort(data=(quat + euler) * 200 + response + quat * 100, speed=100.0)
+    with um7.start_reader(poll_interval=0.01, response_timeout=1.0) as reader:
+        quaternions = reader.subscribe(UM7QuaternionPacket)
+        all_packets = reader.subscribe(maxsize=100)
+        ok, payload = um7.read_register(0x00)
+        assert ok and payload == bytes.fromhex('deadbeef')
+        while reader.is_running:
+            reader.thread.join(0.1)
+    assert um7.reader is None
+    assert reader.error is None
+    received = [quaternions.get_nowait() for _ in range(quaternions.qsize())]
+    assert len(received) >= 100 and all(type(packet) is UM7QuaternionPacket for packet in received)
+    # the queue of all packets keeps the latest ones, the oldest are dropped
+    assert all_packets.qsize() == 100 and reader.dropped_packets > 0
+
+
+@pytest.mark.comm
+def test_reader_keeps_responses_of_concurrent_reads():
+    um7 = UM7Serial(port=ReplayPort(data=b''))
+    # responses arrive together, in the opposite order of the requests
+    responses = make_packet(0x80, 0x01, bytes.fromhex('01010101')) + make_packet(0x80, 0x00, bytes.fromhex('00000000'))
+    um7.port = ReplayPort(frames=[(0, bytes()), (30_000_000, responses)], speed=1.0)
+    results = {}
+    with um7.start_reader(poll_interval=0.01, response_timeout=1.0):
+        def read_register(reg_addr: int):
+            results[reg_addr] = um7.read_register(reg_addr)
+
+        threads = [threading.Thread(target=read_register, args=(reg_addr,)) for reg_addr in (0x00, 0x01)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert results == {0x00: (True, bytes(4)), 0x01: (True, bytes.fromhex('01010101'))}
+
+
+@pytest.mark.comm
+def test_reader_keeps_no_frames_without_requests():
+    um7 = UM7Serial(port=ReplayPort(data=b''))
+    health_addr = um7.svd_parser.find_register_by(name='DREG_HEALTH').address
+    # health broadcasts and an unsolicited acknowledgement are as short as register responses
+    data = make_packet(0x80, health_addr, bytes(4)) * 200 + make_packet(0x00, 0x00, bytes())
+    um7.port = ReplayPort(frames=[(0, bytes()), (30_000_000, data)], speed=1.0)
+    with um7.start_reader(poll_interval=0.01) as reader:
+        health_packets = reader.subscribe(UM7HealthPacket)
+        reader.thread.join()
+    assert health_packets.qsize() == 200
+    assert len(um7.pending_responses) == 0 and um7.metrics.overflowed_frames == 0
+
+
+@pytest.mark.comm
+def test_recv_broadcast_takes_packets_from_the_reader():
+    um7 = UM7Serial(port=ReplayPort(data=b''))
+    quat_addr = um7.svd_parser.find_register_by(name='DREG_QUAT_AB').address
+    quat = make_packet(0xCC, quat_addr, bytes.fromhex('745d000000000000') + bytes(4))
+    um7.port = ReplayPort(data=quat * 100, speed=10.0)
+    with um7.start_reader(poll_interval=0.01):
+        packets = list(um7.recv_broadcast(num_packets=20))
+        assert len(packets) == 20 and all(type(packet) is UM7QuaternionPacket for packet in packets)
+        # ends with the reader at the end of the capture
+        assert len(list(um7.recv_quaternion_broadcast())) > 0
+    assert um7.reader is None
+
+
+@pytest.mark.comm
+def test_reader_error_releases_the_port():
+    class DisconnectedPort(ReplayPort):
+        def readinto(self, buffer) -> int:
+            raise OSError("device disconnected")
+
+    um7 = UM7Serial(port=DisconnectedPort())
+    reader = um7.start_reader(poll_interval=0.01)
+    with pytest.raises(OSError):
+        list(um7.recv_broadcast())
+    reader.thread.join()
+    assert isinstance(reader.error, OSError) and um7.reader is None
@@ -0,0 +1,36 @@
+import pytest
+
+from rsl_comm_py.rsl_recorder import RslFrameRecorder, read_frames
+from rsl_comm_py.test.helpers import ShearWaterFraming, make_packet
+
+
+@pytest.mark.comm
+def test_recorder_round_trip(tmp_path):
+    log_file = tmp_path / 'capture.rslf'
+    frames = [make_packet(0x8C, 0x7E, bytes(range(idx, idx + 12))) for idx in range(10)]
+    with RslFrameRecorder(log_file, fsync_interval=0.0) as recorder:
+        for frame in frames[:5]:
+            recorder.record(memoryview(frame))
+    # appending to an existing log keeps the file header single
+    with RslFrameRecorder(log_file) as recorder:
+        for frame in frames[5:]:
+            recorder.record(frame)
+    with open(log_file, 'ab') as fd:
+        fd.write(b'\x00' * 4)  # interrupted record
+    records = list(read_frames(log_file))
+    assert [frame for _, frame in records] == frames
+    timestamps = [timestamp for timestamp, _ in records]
+    assert timestamps == sorted(timestamps)
+
+
+@pytest.mark.comm
+def test_recv_broadcast_records_frames(tmp_path):
+    log_file = tmp_path / 'broadcast.rslf'
+    serial_communication = ShearWaterFraming()
+    serial_communication.register_broadcast_decoder(0x7E, 19, serial_communication.decode_quaternion_broadcast)
+    quat = make_packet(0x8C, 0x7E, bytes.fromhex('745d000000000000') + bytes(4))
+    serial_communication.buffer.write(b'garbage' + quat + quat)
+    with RslFrameRecorder(log_file) as serial_communication.recorder:
+        packets = list(serial_communication.recv_broadcast(num_packets=2))
+    assert len(packets) == 2
+    assert [frame for _, frame in read_frames(log_file)] == [quat, quat]
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import pytest
+
+from rsl_comm_py.rsl_replay import ReplayPort
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.test.helpers import make_packet
+
+
+@pytest.mark.comm
+def test_register_cache():
+    # CREG_COM_RATES1 is read once, read again after it is written, DREGs always come from the sensor
+    frames = [(0, make_packet(0x80, 0x01, bytes([1, 2, 3, 4]))), (20_000_000, make_packet(0x00, 0x01)),
+              (40_000_000, make_packet(0x80, 0x01, bytes([5, 6, 7, 8])))]
+    port = ReplayPort(frames=frames, speed=1.0)
+    shearwater = ShearWaterSerial(port=port, cache_registers=True)
+    assert shearwater.read_register(0x01) == (True, bytes([1, 2, 3, 4]))
+    assert shearwater.read_register(0x01) == (True, bytes([1, 2, 3, 4]))
+    assert (shearwater.register_cache.hits, shearwater.register_cache.misses) == (1, 1)
+    assert shearwater.write_register(0x01, bytes([5, 6, 7, 8]))
+    assert shearwater.read_register(0x01) == (True, bytes([5, 6, 7, 8]))
+    assert bytes(port.written).count(shearwater.construct_read_packet(0x01)) == 2
+    dreg_addr = shearwater.svd_parser.dregs[0].address
+    assert shearwater.register_cache.lookup(dreg_addr) is None
+    shearwater.register_cache.invalidate()
+    assert len(shearwater.register_cache) == 0
@@ -0,0 +1,41 @@
+import pytest
+
+from time import perf_counter
+
+from rsl_comm_py.rsl_recorder import RslFrameRecorder
+from rsl_comm_py.rsl_replay import ReplayPort
+from rsl_comm_py.shearwater_broadcast_packets import ShearWaterQuaternionPacket
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.um7_broadcast_packets import UM7QuaternionPacket
+from rsl_comm_py.um7_serial import UM7Serial
+from rsl_comm_py.test.helpers import make_packet
+
+
+@pytest.mark.comm
+@pytest.mark.parametrize('sensor_class, packet_type, quaternion_type',
+                         [(UM7Serial, 0xCC, UM7QuaternionPacket), (ShearWaterSerial, 0x8C, ShearWaterQuaternionPacket)])
+def test_replay_raw_capture(sensor_class, packet_type, quaternion_type):
+    sensor = sensor_class(port=ReplayPort(data=b''))
+    quat_addr = sensor.svd_parser.find_register_by(name='DREG_QUAT_AB').address
+    quat = make_packet(packet_type, quat_addr, bytes.fromhex('745d000000000000') + bytes(4))
+    # capture spans several receive buffers, no packet is lost between reads
+    capture = b'garbage' + quat * 1000 + quat[:10]
+    sensor.port = ReplayPort(data=capture)
+    packets = list(sensor.recv_broadcast())
+    assert len(packets) == 1000
+    assert all(type(packet) is quaternion_type for packet in packets)
+    assert packets[0].q_w == pytest.approx(1.0, abs=1e-4)
+
+
+@pytest.mark.comm
+def test_replay_frame_log_paced(tmp_path):
+    log_file = tmp_path / 'capture.rslf'
+    quat = make_packet(0x8C, 0x7E, bytes.fromhex('745d000000000000') + bytes(4))
+    with RslFrameRecorder(log_file) as recorder:
+        for idx in range(5):
+            recorder.record(quat, timestamp_ns=idx * 20_000_000)
+    shearwater = ShearWaterSerial(port=ReplayPort.from_file(log_file, speed=1.0))
+    start = perf_counter()
+    packets = list(shearwater.recv_quaternion_broadcast())
+    assert perf_counter() - start >= 0.08
+    assert packets == [ShearWaterQuaternionPacket(q_w=packets[0].q_w, q_x=0.0, q_y=0.0, q_z=0.0, q_time=0.0)] * 5
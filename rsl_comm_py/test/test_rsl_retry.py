@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import pytest
+
+from rsl_comm_py.rsl_replay import ReplayPort
+from rsl_comm_py.rsl_retry import RslRetryPolicy
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.test.helpers import make_packet
+
+
+@pytest.mark.comm
+def test_retry_policy_timeout():
+    policy = RslRetryPolicy(initial_timeout=0.05, min_timeout=0.001, max_timeout=0.5, backoff=2.0)
+    assert policy.timeout(1) == 0.05 and policy.timeout(2) == 0.1 and policy.timeout(10) == 0.5
+    for _ in range(50):
+        policy.record_response(1, 0.002)
+    assert policy.srtt == pytest.approx(0.002) and policy.timeout(1) < 0.003
+    # round trip of a repeated request is ambiguous, it is counted, but not sampled
+    policy.record_response(2, 0.2)
+    policy.record_failure(4)
+    assert policy.srtt == pytest.approx(0.002)
+    assert policy.statistics()['retransmissions'] == 4 and policy.statistics()['failures'] == 1
+
+
+@pytest.mark.comm
+def test_read_register_resends():
+    # the response comes 35 ms after the request, the request is sent again after 10 ms and 20 ms
+    port = ReplayPort(frames=[(0, bytes()), (35_000_000, make_packet(0x80, 0x01, bytes([1, 2, 3, 4])))], speed=1.0)
+    policy = RslRetryPolicy(initial_timeout=0.01, backoff=2.0, max_attempts=3, deadline=0.2)
+    shearwater = ShearWaterSerial(port=port, retry_policy=policy)
+    assert shearwater.read_register(0x01) == (True, bytes([1, 2, 3, 4]))
+    assert bytes(port.written) == 3 * shearwater.construct_read_packet(0x01)
+    assert (policy.requests, policy.attempts, policy.srtt) == (1, 3, None)
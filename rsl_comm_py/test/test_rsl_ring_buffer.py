@@ -0,0 +1,100 @@
+import pytest
+
+from rsl_comm_py.rsl_ring_buffer import RslRingBuffer
+from rsl_comm_py.rsl_serial import SerialCommunication
+from rsl_comm_py.test.helpers import ShearWaterFraming, UM7Framing, make_packet
+
+
+@pytest.fixture
+def serial_communication() -> SerialCommunication:
+    return ShearWaterFraming()
+
+
+@pytest.mark.comm
+def test_ring_buffer_write_consume():
+    ring_buffer = RslRingBuffer(16)
+    ring_buffer.write(b'0123456789')
+    ring_buffer.consume(8)
+    ring_buffer.write(b'abcdefghij')
+    assert len(ring_buffer) == 12, "Ring buffer shall keep unread bytes when compacting!"
+    assert bytes(ring_buffer.peek(0, 12)) == b'89abcdefghij'
+    assert ring_buffer.dropped_bytes == 0
+
+
+@pytest.mark.comm
+def test_ring_buffer_overflow_drops_oldest():
+    ring_buffer = RslRingBuffer(8)
+    ring_buffer.write(b'01234567')
+    ring_buffer.write(b'89')
+    assert bytes(ring_buffer.peek(0, len(ring_buffer))) == b'23456789'
+    assert ring_buffer.dropped_bytes == 2
+
+
+@pytest.mark.comm
+def test_find_packet_in_place(serial_communication: SerialCommunication):
+    health = make_packet(0x80, 0x55, b'\x00\x00\x00\x01')
+    quat = make_packet(0x8C, 0x7E, bytes(12))
+    serial_communication.buffer.write(b'garbage' + health + quat + b'snp')
+    packet = serial_communication.find_packet()
+    assert isinstance(packet, memoryview), "Packets shall be framed in place!"
+    assert bytes(packet) == health
+    packet = serial_communication.find_packet()
+    assert bytes(packet) == quat
+    assert len(serial_communication.find_packet()) == 0, "Incomplete packet shall not be returned!"
+
+
+@pytest.mark.comm
+def test_find_packet_across_reads(serial_communication: SerialCommunication):
+    health = make_packet(0x80, 0x55, b'\x00\x00\x00\x01')
+    stream = health * 3
+    serial_communication.buffer.write(stream[:9])
+    assert len(serial_communication.find_packet()) == 0
+    serial_communication.buffer.write(stream[9:])
+    assert bytes(serial_communication.find_packet()) == health
+    assert bytes(serial_communication.find_packet()) == health
+    assert bytes(serial_communication.find_packet()) == health, "Last packet shall not wait for the next preamble!"
+
+
+@pytest.mark.comm
+def test_find_packet_resync_on_false_preamble(serial_communication: SerialCommunication):
+    health = make_packet(0x80, 0x55, b'\x00\x00\x00\x01')
+    serial_communication.buffer.write(b'snp\x80\x55\x01\x02' + health)
+    assert bytes(serial_communication.find_packet()) == health
+
+
+@pytest.mark.comm
+def test_packet_length_from_packet_type():
+    shearwater = ShearWaterFraming()
+    um7 = UM7Framing()
+    assert shearwater.packet_lengths[0x00] == 7, "Packet without data has 7 bytes!"
+    assert shearwater.packet_lengths[0x80] == 11, "Single register packet has 11 bytes!"
+    assert shearwater.packet_lengths[0x80 | 22 << 2] == 95, "shearwater batch of 22 registers has 95 bytes!"
+    assert um7.packet_lengths[0x80] == 11, "Single register packet has 11 bytes!"
+    assert um7.packet_lengths[0xC0 | 12 << 2] == 55, "UM7 batch of 12 registers has 55 bytes!"
+
+
+@pytest.mark.comm
+def test_recv_broadcast_dispatch(serial_communication: SerialCommunication):
+    health = make_packet(0x80, 0x55, b'\x00\x00\x00\x01')
+    quat = make_packet(0x8C, 0x7E, bytes(12))
+    serial_communication.register_broadcast_decoder(0x55, 11, lambda packet: ('health', packet[8]))
+    serial_communication.register_broadcast_decoder(0x7E, 19, lambda packet: ('quat', len(packet)))
+    serial_communication.buffer.write(quat + make_packet(0x80, 0x7E, bytes(4)) + health)
+    packets = list(serial_communication.recv_broadcast(num_packets=2))
+    assert packets == [('quat', 19), ('health', 1)], "Packets without registered decoder shall be skipped!"
+
+
+@pytest.mark.comm
+def test_response_broadcast_demultiplexing(serial_communication):
+    serial_communication.register_broadcast_decoder(0x7E, 19, lambda packet: ('quat', len(packet)))
+    quat = make_packet(0x8C, 0x7E, bytes.fromhex('745d000000000000') + bytes(4))
+    response = make_packet(0x80, 0x01, bytes.fromhex('deadbeef'))
+    # broadcasts arriving before the response are kept for the broadcast consumers
+    serial_communication.buffer.write(quat * 3 + response + quat)
+    assert serial_communication.find_response(0x01, expected_length=11) == (True, response)
+    assert len(list(serial_communication.recv_broadcast(num_packets=4))) == 4
+    # responses arriving while receiving broadcasts are kept for `find_response`
+    serial_communication.buffer.write(quat + response + quat)
+    assert len(list(serial_communication.recv_broadcast(num_packets=2))) == 2
+    assert serial_communication.find_response(0x01, expected_length=11) == (True, response)
+    assert len(serial_communication.pending_broadcasts) == 0 and len(serial_communication.pending_responses) == 0
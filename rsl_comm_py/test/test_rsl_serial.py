@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import pytest
+
+from time import perf_counter
+
+from rsl_comm_py.rsl_replay import ReplayPort
+from rsl_comm_py.shearwater_broadcast_packets import ShearWaterQuaternionPacket
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.um7_serial import RslException
+from rsl_comm_py.test.helpers import make_packet
+
+
+@pytest.mark.comm
+def test_recv_timeout():
+    quat = make_packet(0x8C, 0x7E, bytes.fromhex('745d000000000000') + bytes(4))
+    # the sensor goes silent after the first packet
+    frames = [(0, quat), (10_000_000_000, quat)]
+    shearwater = ShearWaterSerial(port=ReplayPort(frames=frames, speed=1.0), timeout=0.05)
+    broadcast = shearwater.recv_broadcast()
+    assert type(next(broadcast)) is ShearWaterQuaternionPacket
+    start = perf_counter()
+    with pytest.raises(TimeoutError):
+        next(broadcast)
+    with pytest.raises(RslException):
+        shearwater.read_register(0x00)
+    assert perf_counter() - start < 1.0
+
+
+@pytest.mark.comm
+def test_read_registers_pipelined():
+    quat = make_packet(0x8C, 0x7E, bytes.fromhex('745d000000000000') + bytes(4))
+    # responses out of order, broadcasts in between, no response for register 0x05
+    responses = [make_packet(0x80 | hidden << 1, addr, bytes([addr, 0, 0, hidden]))
+                 for addr, hidden in [(0x02, 0), (0x01, 0), (0x03, 1), (0x04, 0)]]
+    capture = quat + responses[0] + responses[1] + quat + responses[2] + responses[3] + quat
+    port = ReplayPort(frames=[(0, capture), (10_000_000_000, quat)], speed=1.0)
+    shearwater = ShearWaterSerial(port=port)
+    registers = [(0x01, False), (0x02, False), (0x03, True), (0x04, False), (0x05, False), (0x01, False)]
+    results = shearwater.read_registers_pipelined(registers, window=4, retry_time=0.2)
+    assert results == [(True, bytes([0x01, 0, 0, 0])), (True, bytes([0x02, 0, 0, 0])), (True, bytes([0x03, 0, 0, 1])),
+                       (True, bytes([0x04, 0, 0, 0])), (False, bytes()), (True, bytes([0x01, 0, 0, 0]))]
+    # the first window is sent back-to-back, before any response is received
+    assert bytes(port.written).startswith(b''.join(shearwater.construct_read_packet(*register)
+                                                   for register in registers[:4]))
+    assert len(list(shearwater.recv_broadcast(num_packets=3))) == 3
+
+
+@pytest.mark.comm
+def test_batch_register_access():
+    # 40 registers are read as batches of 31 and 9 registers, written as batches of 31 and 9 registers
+    payload = bytes(range(160))
+    responses = make_packet(0x80 | 31 << 2, 0x01, payload[:124]) + make_packet(0x80 | 9 << 2, 0x20, payload[124:])
+    acks = [(20_000_000, make_packet(0x00, 0x01)), (40_000_000, make_packet(0x00, 0x20))]
+    port = ReplayPort(frames=[(0, responses)] + acks, speed=1.0)
+    shearwater = ShearWaterSerial(port=port)
+    assert shearwater.read_registers(0x01, 40) == (True, payload)
+    assert bytes(port.written) == shearwater.construct_read_packet(0x01, count=31) + \
+        shearwater.construct_read_packet(0x20, count=9)
+    port.written.clear()
+    assert shearwater.write_registers(0x01, [payload[idx:idx + 4] for idx in range(0, 160, 4)])
+    assert bytes(port.written) == make_packet(0x80 | 31 << 2, 0x01, payload[:124]) + \
+        make_packet(0x80 | 9 << 2, 0x20, payload[124:])
+
+
+@pytest.mark.comm
+def test_rejected_batch_reads():
+    # the batch read is not answered, registers are read one by one, and from then on without trying batches
+    responses = make_packet(0x80, 0x01, bytes([1, 2, 3, 4])) + make_packet(0x80, 0x02, bytes(4))
+    next_responses = make_packet(0x80, 0x01, bytes(4)) + make_packet(0x80, 0x02, bytes([5, 6, 7, 8]))
+    frames = [(0, bytes()), (80_000_000, responses), (200_000_000, next_responses)]
+    port = ReplayPort(frames=frames, speed=1.0)
+    shearwater = ShearWaterSerial(port=port)
+    start = perf_counter()
+    assert shearwater.read_registers_payloads([0x01, 0x02]) == {0x01: bytes([1, 2, 3, 4]), 0x02: bytes(4)}
+    assert perf_counter() - start < shearwater.retry_policy.deadline
+    assert not shearwater.batch_reads
+    port.written.clear()
+    assert shearwater.read_registers_payloads([0x01, 0x02]) == {0x01: bytes(4), 0x02: bytes([5, 6, 7, 8])}
+    assert shearwater.construct_read_packet(0x01, count=2) not in port.written
+
+
+@pytest.mark.comm
+def test_apply_config():
+    # only the register which differs is written, verified by reading back, and committed to flash once
+    current = make_packet(0x80 | 2 << 2, 0x01, bytes([1, 2, 3, 4]) + bytes(4))
+    frames = [(0, current), (20_000_000, make_packet(0x00, 0x02)),
+              (40_000_000, make_packet(0x80, 0x02, bytes([0, 0, 0, 5]))), (60_000_000, make_packet(0x00, 0xAC))]
+    port = ReplayPort(frames=frames, speed=1.0)
+    shearwater = ShearWaterSerial(port=port)
+    assert shearwater.apply_config({'creg_com_rates1': 0x01020304, 'creg_com_rates2': 5})
+    assert bytes(port.written) == shearwater.construct_read_packet(0x01, count=2) + \
+        shearwater.construct_batch_write_packet(0x02, bytes([0, 0, 0, 5])) + shearwater.construct_read_packet(0x02) + \
+        shearwater.construct_write_packet(0xAC, 1)
+
+
+@pytest.mark.comm
+def test_apply_config_unchanged():
+    # the sensor is configured as desired, nothing is written nor committed to flash
+    port = ReplayPort(frames=[(0, make_packet(0x80 | 2 << 2, 0x01, bytes([1, 2, 3, 4]) + bytes([0, 0, 0, 5])))])
+    shearwater = ShearWaterSerial(port=port)
+    assert shearwater.apply_config({'creg_com_rates1': 0x01020304, 'creg_com_rates2': 5})
+    assert bytes(port.written) == shearwater.construct_read_packet(0x01, count=2)
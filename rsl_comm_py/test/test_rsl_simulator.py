@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import pytest
+
+from time import perf_counter
+
+from rsl_comm_py.rsl_simulator import SimulatedSensor
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.shearwater_spi import ShearWaterSpiSimulated
+from rsl_comm_py.um7_serial import UM7Serial
+
+
+@pytest.mark.comm
+@pytest.mark.parametrize('model, serial_class', [('shearwater', ShearWaterSerial), ('um7', UM7Serial)])
+def test_simulated_registers(model, serial_class):
+    simulator = SimulatedSensor(model)
+    sensor = serial_class(port=simulator)
+    creg_addr = sensor.svd_parser.find_register_by(name='CREG_COM_RATES1').address
+    assert sensor.write_register(creg_addr, 0x12345678)
+    assert sensor.read_register(creg_addr) == (True, bytes([0x12, 0x34, 0x56, 0x78]))
+    assert sensor.write_registers(creg_addr, [1, 2, 3])
+    assert sensor.read_registers(creg_addr, 3) == (True, bytes([0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 3]))
+    hidden_reg = next(reg for reg in sensor.svd_parser.hidden_regs if reg.access == 'read-write')
+    assert sensor.write_register(hidden_reg.address, 7, hidden=True)
+    assert sensor.read_register(hidden_reg.address, hidden=True) == (True, bytes([0, 0, 0, 7]))
+    # writing a read-only register is answered with the failed bit set
+    dreg = sensor.svd_parser.dregs[0]
+    sensor.write_register(dreg.address, 5)
+    assert sensor.metrics.packet_check_failures == 1
+    assert simulator.get_register(dreg.name) == bytes(4)
+
+
+@pytest.mark.comm
+def test_simulated_broadcasts():
+    simulator = SimulatedSensor('shearwater')
+    sensor = ShearWaterSerial(port=simulator)
+    # EULER_RATE of 100 Hz in CREG_COM_RATES5
+    sensor.write_register(sensor.svd_parser.find_register_by(name='CREG_COM_RATES5').address, 100 << 16)
+    packets = list(sensor.recv_broadcast(num_packets=10))
+    assert {type(packet).__name__ for packet in packets} == {'ShearWaterEulerPacket'}
+    time_steps = [second.time_stamp - first.time_stamp for first, second in zip(packets, packets[1:])]
+    assert all(time_step == pytest.approx(0.01, abs=1e-4) for time_step in time_steps)
+    # the same register file over SPI
+    spi_sensor = ShearWaterSpiSimulated(simulator=simulator)
+    assert spi_sensor.read_register(sensor.svd_parser.find_register_by(name='CREG_COM_RATES5').address) == \
+           (True, int.to_bytes(100 << 16, length=4, byteorder='big'))
+
+
+@pytest.mark.comm
+def test_simulated_port_timeout():
+    # nothing is broadcast, reading waits for the timeout of the port instead of returning at once
+    sensor = ShearWaterSerial(port=SimulatedSensor('shearwater'), timeout=0.2)
+    start = perf_counter()
+    with pytest.raises(TimeoutError):
+        list(sensor.recv_broadcast(num_packets=1))
+    assert perf_counter() - start >= 0.2
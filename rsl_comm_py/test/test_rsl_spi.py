@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# Author: Redshift Labs Pty Ltd
+# License: MIT
+# Date: 17 October 2026
+
+import pytest
+
+from rsl_comm_py.rsl_packet_view import broadcast_layout
+from rsl_comm_py.rsl_replay import ReplayPort
+from rsl_comm_py.rsl_spi import RslSpiUsbIss
+from rsl_comm_py.shearwater_serial import ShearWaterSerial
+from rsl_comm_py.um7_serial import RslException, UM7Serial
+from rsl_comm_py.test.helpers import ShearWaterSpiMemory, UM7SpiMemory, make_packet
+
+
+@pytest.mark.comm
+@pytest.mark.parametrize('spi_class, serial_class',
+                         [(ShearWaterSpiMemory, ShearWaterSerial), (UM7SpiMemory, UM7Serial)])
+def test_snapshot_matches_broadcast(spi_class, serial_class):
+    registers = bytes(idx * 37 % 251 for idx in range(1024))
+    sensor = spi_class(registers)
+    serial_sensor = serial_class(port=ReplayPort())
+    for group, (reg_name, packet_type) in sensor.snapshot_groups.items():
+        reg_addr = sensor.svd_parser.find_register_by(name=reg_name).address
+        decode_callback = next(decode_callback for decode_callback in serial_sensor.broadcast_decoders.values()
+                               if serial_sensor.broadcast_packet_type(decode_callback) is packet_type)
+        _, packet_length = broadcast_layout(packet_type)
+        payload = registers[4 * reg_addr:4 * reg_addr + packet_length - 7]
+        transactions = sensor.transactions
+        assert sensor.snapshot(group) == decode_callback(make_packet(0xC0, reg_addr, payload)), group
+        assert sensor.transactions == transactions + 1
+
+
+class FlakySpiMemory(ShearWaterSpiMemory):
+    # bits are flipped in long transfers above the maximum clock of the wiring
+    def __init__(self, registers: bytes, max_clock_speed: int, **kwargs):
+        super().__init__(registers, **kwargs)
+        self.max_clock_speed = max_clock_speed
+        self.clock_speed = 500_000
+
+    def set_clock_speed(self, clock_speed: int):
+        self.clock_speed = clock_speed
+
+    def xfer(self, msg):
+        response = super().xfer(msg)
+        if self.clock_speed is not None and self.clock_speed > self.max_clock_speed and len(msg) > 64:
+            response[-1] ^= 0x01
+        return response
+
+
+@pytest.mark.comm
+def test_calibrate_clock():
+    sensor = FlakySpiMemory(bytes(idx * 37 % 251 for idx in range(1024)), max_clock_speed=3_000_000)
+    assert sensor.calibrate_clock() == 2_000_000
+    assert sensor.clock_speed == 2_000_000
+    # read commands are allocated once per length
+    assert sensor.read_message(0x10) is sensor.read_message(0x20)
+    assert sensor.read_register(0x20) == (True, sensor.registers[0x80:0x84])
+
+
+class FlakyUsbIssSpiMemory(FlakySpiMemory):
+    applied_clock_speed = RslSpiUsbIss.applied_clock_speed
+
+    def set_clock_speed(self, clock_speed: int):
+        self.clock_speed = self.applied_clock_speed(clock_speed)
+
+
+@pytest.mark.comm
+def test_calibrate_clock_of_coarse_divider():
+    # 4 MHz and 8 MHz both run at 6 MHz on the USB-ISS, which fails, so 2 MHz is the highest verified clock
+    sensor = FlakyUsbIssSpiMemory(bytes(idx * 37 % 251 for idx in range(1024)), max_clock_speed=5_000_000)
+    assert sensor.calibrate_clock() == 2_000_000
+    assert sensor.clock_speed == 2_000_000
+    assert sensor.applied_clock_speed(4_000_000) == sensor.applied_clock_speed(8_000_000) == 6_000_000
+
+
+@pytest.mark.comm
+def test_usb_iss_clock_range():
+    sensor = FlakyUsbIssSpiMemory(bytes(1024), max_clock_speed=5_000_000)
+    assert sensor.applied_clock_speed(6_000_000) == 6_000_000
+    # the divisor is a byte, the slowest clock is 6 MHz / 256
+    assert sensor.applied_clock_speed(500) == sensor.applied_clock_speed(0) == 6_000_000 // 256
+
+
+@pytest.mark.comm
+def test_calibrate_clock_from_unknown_clock():
+    # the clock before calibrating reads reliably, but is not known, so it cannot be restored
+    sensor = FlakySpiMemory(bytes(idx * 37 % 251 for idx in range(1024)), max_clock_speed=0)
+    sensor.clock_speed = None
+    with pytest.raises(RslException):
+        sensor.calibrate_clock()
+
+
+class InPlaceSpiMemory(ShearWaterSpiMemory):
+    # receives into the message, as `xfer2` of spidev, the sensor sends 0xFF while the command is clocked in
+    def xfer(self, msg):
+        assert msg[0] == 0x00 and not any(msg[2:]), "Read command expected!"
+        msg[:] = [0xFF, 0xFF] + super().xfer(msg)[2:]
+        return msg
+
+
+@pytest.mark.comm
+def test_reads_with_in_place_transfers():
+    registers = bytes(idx * 37 % 251 for idx in range(1024))
+    sensor = InPlaceSpiMemory(registers)
+    assert sensor.read_registers(0x20, 2) == (True, registers[0x80:0x88])
+    assert sensor.read_registers(0x10, 2) == (True, registers[0x40:0x48])
+    assert sensor.read_register(0x20) == (True, registers[0x80:0x84])
+
+
+class UsbIssSpiMemory(ShearWaterSpiMemory):
+    max_burst_registers = 15
+    read_ahead_registers = 15
+
+    def xfer(self, msg):
+        assert len(msg) <= 62
+        return super().xfer(msg)
+
+
+@pytest.mark.comm
+def test_batch_reads():
+    registers = bytes(idx * 37 % 251 for idx in range(1024))
+    sensor = UsbIssSpiMemory(registers)
+    names = ['creg_com_settings', 'creg_com_rates1', 'creg_com_rates2', 'creg_com_rates3', 'creg_com_rates4']
+    values = [getattr(sensor, name) for name in names]
+    assert sensor.round_trips == len(names)
+    with sensor.batch():
+        assert [getattr(sensor, name) for name in names] == values
+    assert sensor.round_trips == len(names) + 1
+    # long blocks are split in transfers of the adapter
+    assert sensor.read_registers(0x00, 40) == (True, registers[:160])
+    assert sensor.round_trips == len(names) + 4
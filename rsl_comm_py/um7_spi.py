@@ -4,16 +4,33 @@
 # Version: v0.1
 # License: MIT
 
-from rsl_comm_py.rsl_spi import RslSpiUsbIss, RslSpiLinuxPort
+from rsl_comm_py.rsl_spi import RslSpiSimulated, RslSpiUsbIss, RslSpiLinuxPort
+from rsl_comm_py.um7_serial import UM7Serial
 from rsl_comm_py.um7_registers import UM7Registers
 
 
+# register blocks read by `snapshot`, the broadcast groups of the UART driver
+UM7_SNAPSHOT_GROUPS = UM7Serial.get_snapshot_groups()
+
+
 class UM7SpiLinuxPort(RslSpiLinuxPort, UM7Registers):
+    snapshot_groups = UM7_SNAPSHOT_GROUPS
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
 
 class UM7SpiUsbIss(RslSpiUsbIss, UM7Registers):
+    snapshot_groups = UM7_SNAPSHOT_GROUPS
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UM7SpiSimulated(RslSpiSimulated, UM7Registers):
+    snapshot_groups = UM7_SNAPSHOT_GROUPS
+    simulated_model = 'um7'
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
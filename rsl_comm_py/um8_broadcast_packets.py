@@ -4,11 +4,16 @@
 # Date: 23 May 2020
 
 
+import struct
+
 from dataclasses import dataclass
 
 
 @dataclass
 class UM8AllRawPacket:
+    __slots__ = ('gyro_raw_x', 'gyro_raw_y', 'gyro_raw_z', 'gyro_raw_time', 'accel_raw_x', 'accel_raw_y', 'accel_raw_z',
+                 'accel_raw_time', 'mag_raw_x', 'mag_raw_y', 'mag_raw_z', 'mag_raw_time', 'temperature',
+                 'temperature_time')
     gyro_raw_x: int
     gyro_raw_y: int
     gyro_raw_z: int
@@ -38,6 +43,8 @@ class UM8AllRawPacket:
 
 @dataclass
 class UM8AllProcPacket:
+    __slots__ = ('gyro_proc_x', 'gyro_proc_y', 'gyro_proc_z', 'gyro_proc_time', 'accel_proc_x', 'accel_proc_y',
+                 'accel_proc_z', 'accel_proc_time', 'mag_proc_x', 'mag_proc_y', 'mag_proc_z', 'mag_proc_time')
     gyro_proc_x: float
     gyro_proc_y: float
     gyro_proc_z: float
@@ -63,6 +70,7 @@ class UM8AllProcPacket:
 
 @dataclass
 class UM8EulerPacket:
+    __slots__ = ('roll', 'pitch', 'yaw', 'roll_rate', 'pitch_rate', 'yaw_rate', 'time_stamp')
     roll: float
     pitch: float
     yaw: float
@@ -80,6 +88,7 @@ class UM8EulerPacket:
 
 @dataclass
 class UM8HealthPacket:
+    __slots__ = ('health',)
     health: int
 
     def __repr__(self):
@@ -99,6 +108,7 @@ class UM8HealthPacket:
 
 @dataclass
 class UM8RawAccelPacket:
+    __slots__ = ('accel_raw_x', 'accel_raw_y', 'accel_raw_z', 'accel_raw_time')
     accel_raw_x: int
     accel_raw_y: int
     accel_raw_z: int
@@ -107,6 +117,7 @@ class UM8RawAccelPacket:
 
 @dataclass
 class UM8RawGyroPacket:
+    __slots__ = ('gyro_raw_x', 'gyro_raw_y', 'gyro_raw_z', 'gyro_raw_time')
     gyro_raw_x: int
     gyro_raw_y: int
     gyro_raw_z: int
@@ -115,6 +126,7 @@ class UM8RawGyroPacket:
 
 @dataclass
 class UM8RawMagPacket:
+    __slots__ = ('mag_raw_x', 'mag_raw_y', 'mag_raw_z', 'mag_raw_time')
     mag_raw_x: int
     mag_raw_y: int
     mag_raw_z: int
@@ -123,12 +135,14 @@ class UM8RawMagPacket:
 
 @dataclass
 class UM8TemperaturePacket:
+    __slots__ = ('temperature', 'temperature_time')
     temperature: float
     temperature_time: float
 
 
 @dataclass
 class UM8ProcAccelPacket:
+    __slots__ = ('accel_proc_x', 'accel_proc_y', 'accel_proc_z', 'accel_proc_time')
     accel_proc_x: float
     accel_proc_y: float
     accel_proc_z: float
@@ -137,6 +151,7 @@ class UM8ProcAccelPacket:
 
 @dataclass
 class UM8ProcGyroPacket:
+    __slots__ = ('gyro_proc_x', 'gyro_proc_y', 'gyro_proc_z', 'gyro_proc_time')
     gyro_proc_x: float
     gyro_proc_y: float
     gyro_proc_z: float
@@ -145,6 +160,7 @@ class UM8ProcGyroPacket:
 
 @dataclass
 class UM8ProcMagPacket:
+    __slots__ = ('mag_proc_x', 'mag_proc_y', 'mag_proc_z', 'mag_proc_time')
     mag_proc_x: float
     mag_proc_y: float
     mag_proc_z: float
@@ -153,6 +169,7 @@ class UM8ProcMagPacket:
 
 @dataclass
 class UM8QuaternionPacket:
+    __slots__ = ('q_w', 'q_x', 'q_y', 'q_z', 'q_time')
     q_w: float
     q_x: float
     q_y: float
@@ -162,6 +179,8 @@ class UM8QuaternionPacket:
 
 @dataclass
 class UM8EulerPosePacket:
+    __slots__ = ('roll', 'pitch', 'yaw', 'roll_rate', 'pitch_rate', 'yaw_rate', 'euler_time', 'position_north',
+                 'position_east', 'position_up', 'position_time')
     roll: float
     pitch: float
     yaw: float
@@ -177,6 +196,7 @@ class UM8EulerPosePacket:
 
 @dataclass
 class UM8PosePacket:
+    __slots__ = ('position_north', 'position_east', 'position_up', 'position_time')
     position_north: float
     position_east: float
     position_up: float
@@ -185,6 +205,7 @@ class UM8PosePacket:
 
 @dataclass
 class UM8VelocityPacket:
+    __slots__ = ('velocity_north', 'velocity_east', 'velocity_up', 'velocity_time')
     velocity_north: float
     velocity_east: float
     velocity_up: float
@@ -193,6 +214,7 @@ class UM8VelocityPacket:
 
 @dataclass
 class UM8GyroBiasPacket:
+    __slots__ = ('gyro_bias_x', 'gyro_bias_y', 'gyro_bias_z')
     gyro_bias_x: float
     gyro_bias_y: float
     gyro_bias_z: float
@@ -205,3 +227,32 @@ class UM8GyroBiasPacket:
 if __name__ == '__main__':
     pass
 
+
+# payload layouts of the broadcast packets, decoded with `unpack_from(packet, 5)` directly from the received packet
+UM8_ALL_RAW_STRUCT = struct.Struct('>hhh2xf hhh2xf hhh2xf ff')
+UM8_ALL_PROC_STRUCT = struct.Struct('>ffff ffff ffff')
+UM8_EULER_STRUCT = struct.Struct('>hhh2x hhh2xf')
+UM8_QUATERNION_STRUCT = struct.Struct('>hhhhf')
+UM8_RAW_ACCEL_STRUCT = struct.Struct('>hhh2xf')
+UM8_RAW_GYRO_STRUCT = struct.Struct('>hhh2xf')
+UM8_RAW_MAG_STRUCT = struct.Struct('>hhh2xf')
+UM8_PROC_ACCEL_STRUCT = struct.Struct('>ffff')
+UM8_PROC_GYRO_STRUCT = struct.Struct('>ffff')
+UM8_PROC_MAG_STRUCT = struct.Struct('>ffff')
+UM8_GYRO_BIAS_STRUCT = struct.Struct('>fff')
+UM8_HEALTH_STRUCT = struct.Struct('>I')
+
+BROADCAST_STRUCTS = {
+    UM8AllRawPacket: UM8_ALL_RAW_STRUCT,
+    UM8AllProcPacket: UM8_ALL_PROC_STRUCT,
+    UM8EulerPacket: UM8_EULER_STRUCT,
+    UM8QuaternionPacket: UM8_QUATERNION_STRUCT,
+    UM8RawAccelPacket: UM8_RAW_ACCEL_STRUCT,
+    UM8RawGyroPacket: UM8_RAW_GYRO_STRUCT,
+    UM8RawMagPacket: UM8_RAW_MAG_STRUCT,
+    UM8ProcAccelPacket: UM8_PROC_ACCEL_STRUCT,
+    UM8ProcGyroPacket: UM8_PROC_GYRO_STRUCT,
+    UM8ProcMagPacket: UM8_PROC_MAG_STRUCT,
+    UM8GyroBiasPacket: UM8_GYRO_BIAS_STRUCT,
+    UM8HealthPacket: UM8_HEALTH_STRUCT,
+}
@@ -4,16 +4,33 @@
 # Version: v0.1
 # License: MIT
 
-from rsl_comm_py.rsl_spi import RslSpiUsbIss, RslSpiLinuxPort
+from rsl_comm_py.rsl_spi import RslSpiSimulated, RslSpiUsbIss, RslSpiLinuxPort
+from rsl_comm_py.um8_serial import UM8Serial
 from rsl_comm_py.um8_registers import UM8Registers
 
 
+# register blocks read by `snapshot`, the broadcast groups of the UART driver
+UM8_SNAPSHOT_GROUPS = UM8Serial.get_snapshot_groups()
+
+
 class UM8SpiLinuxPort(RslSpiLinuxPort, UM8Registers):
+    snapshot_groups = UM8_SNAPSHOT_GROUPS
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
 
 class UM8SpiUsbIss(RslSpiUsbIss, UM8Registers):
+    snapshot_groups = UM8_SNAPSHOT_GROUPS
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UM8SpiSimulated(RslSpiSimulated, UM8Registers):
+    snapshot_groups = UM8_SNAPSHOT_GROUPS
+    simulated_model = 'um8'
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 